@@ -0,0 +1,13 @@
+"""
+mediakit
+Shared helpers for the Manim projects in this repo.
+
+Projects stay self-contained scene files; anything that more than one scene
+needs (numeric engines, mobject primitives, render plumbing) lives here.
+
+The repo root is on PYTHONPATH (scripts/install.sh adds it to the shell
+profile; every render script exports it), so scene files in
+projects/<name>/ import it directly:
+
+    from mediakit.winding import WindingMachine
+"""
@@ -0,0 +1,67 @@
+"""
+axes.py
+Memoized Axes / NumberPlane construction.
+
+Building an Axes regenerates every tick and, with include_numbers=True,
+a DecimalNumber per labelled tick -- each one a TeX render plus an SVG
+parse. Scenes that draw the same axes in several sections pay for that
+every time. get_axes() and get_number_plane() build one prototype per
+distinct configuration and hand out copies of it: the nth identical
+axes in a render costs one Mobject.copy(), with no tick layout, TeX or
+SVG work, and every copy's labels carry the prototype's glyph outlines.
+
+Copies are full deep copies. Manim moves mobjects by updating point
+arrays in place (shift does points += v), so copies cannot safely share
+arrays; duplicating them is a memcpy, far cheaper than a rebuild.
+"""
+
+import numpy as np
+from manim import Axes, NumberPlane, config
+
+_PROTOTYPES = {}
+stats = {"hits": 0, "misses": 0}
+
+
+def _freeze(value):
+    """Hashable, order-independent form of a constructor argument."""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, np.ndarray):
+        return (value.dtype.str, value.shape, value.tobytes())
+    try:
+        hash(value)
+    except TypeError:
+        return repr(value)
+    return value
+
+
+def cached_axes(cls, **kwargs):
+    """
+    Copy of a memoized `cls(**kwargs)` (Axes, NumberPlane or a subclass).
+
+    The key includes the frame size, which sets the default axis lengths.
+    """
+    key = (cls, config.frame_width, config.frame_height, _freeze(kwargs))
+    if key not in _PROTOTYPES:
+        _PROTOTYPES[key] = cls(**kwargs)
+        stats["misses"] += 1
+    else:
+        stats["hits"] += 1
+    return _PROTOTYPES[key].copy()
+
+
+def get_axes(**kwargs):
+    """Axes(**kwargs), built once per configuration."""
+    return cached_axes(Axes, **kwargs)
+
+
+def get_number_plane(**kwargs):
+    """NumberPlane(**kwargs), built once per configuration."""
+    return cached_axes(NumberPlane, **kwargs)
+
+
+def clear_axes_cache():
+    """Drop every prototype, e.g. after changing the label font."""
+    _PROTOTYPES.clear()
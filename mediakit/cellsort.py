@@ -0,0 +1,291 @@
+"""
+cellsort.py
+Array-backed cell-sorting simulation and a batched grid renderer.
+
+CellSortSim keeps cell types in one integer grid. Same-type neighbor counts
+come from shifted one-hot arrays, and swap proposals are evaluated for a
+whole sublattice of disjoint, non-interacting neighbor pairs at once. Every
+accepted step is recorded as a pair of flat slot-index arrays.
+
+CellGrid draws the grid as one VMobject per cell type (all squares of that
+type are subpaths of a single path), so 10^4 cells are 3 mobjects, not
+10^4. ReplaySwaps animates a recorded history onto it.
+"""
+
+import numpy as np
+from manim import Animation, VGroup, VMobject, GRAY_D, linear
+
+
+# ---------------------------------------------------------------------------
+# Simulation
+# ---------------------------------------------------------------------------
+
+# (axis, pair stride along axis, stride across): pairs on one sublattice never
+# touch each other's neighborhoods, so their swaps can be judged in parallel
+_SUBLATTICES = [
+    (axis, along, across)
+    for axis in (0, 1)
+    for along in range(3)
+    for across in range(2)
+]
+
+
+class CellSortSim:
+    """
+    Cells of immutable type on a rows x cols grid swap with 4-neighbors
+    whenever the swap lowers the pair's count of unlike neighbors.
+
+    Args:
+        rows, cols: Grid size
+        num_types: Number of cell types (algotypes)
+        seed: Seed for the simulation's own random generator
+        types: Optional (rows, cols) initial type grid
+    """
+
+    def __init__(self, rows, cols, num_types=3, seed=None, types=None):
+        self.rng = np.random.default_rng(seed)
+        self.rows, self.cols, self.num_types = rows, cols, num_types
+        if types is None:
+            types = self.rng.integers(0, num_types, size=(rows, cols))
+        self.types = np.asarray(types, dtype=np.int8).copy()
+        self.initial_types = self.types.copy()
+        self.history = []
+
+        # Number of in-grid 4-neighbors of every slot
+        deg = np.full((rows, cols), 4)
+        deg[0, :] -= 1
+        deg[-1, :] -= 1
+        deg[:, 0] -= 1
+        deg[:, -1] -= 1
+        self.degree = deg
+
+    # ------------------------------------------------------------------
+    # Neighbor counts
+    # ------------------------------------------------------------------
+    def same_counts(self):
+        """(num_types, rows, cols): neighbors of each slot having type t."""
+        onehot = (self.types[None] == np.arange(self.num_types)[:, None, None]).astype(np.int16)
+        counts = np.zeros_like(onehot)
+        counts[:, 1:, :] += onehot[:, :-1, :]
+        counts[:, :-1, :] += onehot[:, 1:, :]
+        counts[:, :, 1:] += onehot[:, :, :-1]
+        counts[:, :, :-1] += onehot[:, :, 1:]
+        return counts
+
+    def discomfort(self):
+        """(rows, cols): unlike neighbors of every cell."""
+        counts = self.same_counts()
+        own = np.take_along_axis(counts, self.types[None].astype(np.intp), axis=0)[0]
+        return self.degree - own
+
+    def energy(self):
+        """Number of unlike neighbor bonds in the whole grid."""
+        return int(self.discomfort().sum()) // 2
+
+    # ------------------------------------------------------------------
+    # Swap proposals
+    # ------------------------------------------------------------------
+    def _sublattice_pairs(self, axis, along, across):
+        """Flat slot indices (a, b) of one sublattice of neighbor pairs."""
+        r = np.arange(self.rows)
+        c = np.arange(self.cols)
+        if axis == 0:
+            r = r[(r % 3 == along) & (r + 1 < self.rows)]
+            c = c[c % 2 == across]
+            rr, cc = np.meshgrid(r, c, indexing="ij")
+            a = rr * self.cols + cc
+            b = a + self.cols
+        else:
+            r = r[r % 2 == across]
+            c = c[(c % 3 == along) & (c + 1 < self.cols)]
+            rr, cc = np.meshgrid(r, c, indexing="ij")
+            a = rr * self.cols + cc
+            b = a + 1
+        return a.ravel(), b.ravel()
+
+    def _improving(self, a, b):
+        """Mask of pairs whose swap strictly lowers their unlike-neighbor count."""
+        flat = self.types.ravel()
+        counts = self.same_counts().reshape(self.num_types, -1)
+        ta, tb = flat[a], flat[b]
+        # Moving a's cell to b (and back) changes unlike neighbors by
+        # S_ta(a) - S_tb(a) + 1 at a and S_tb(b) - S_ta(b) + 1 at b
+        delta = (
+            counts[ta, a] - counts[tb, a] + 1
+            + counts[tb, b] - counts[ta, b] + 1
+        )
+        return (ta != tb) & (delta < 0)
+
+    def step(self, max_swaps=None):
+        """
+        Run one step: sweep sublattices in random order, accepting every
+        improving swap on disjoint slots, up to `max_swaps`.
+
+        Returns:
+            (a, b): flat slot indices of the swaps made (also appended to
+            history)
+        """
+        flat = self.types.reshape(-1)
+        used = np.zeros(flat.size, dtype=bool)
+        done_a, done_b = [], []
+        remaining = np.inf if max_swaps is None else max_swaps
+
+        for i in self.rng.permutation(len(_SUBLATTICES)):
+            if remaining <= 0:
+                break
+            a, b = self._sublattice_pairs(*_SUBLATTICES[i])
+            keep = self._improving(a, b) & ~used[a] & ~used[b]
+            a, b = a[keep], b[keep]
+            if len(a) > remaining:
+                pick = self.rng.choice(len(a), size=int(remaining), replace=False)
+                a, b = a[pick], b[pick]
+            if len(a) == 0:
+                continue
+            flat[a], flat[b] = flat[b], flat[a].copy()
+            used[a] = used[b] = True
+            done_a.append(a)
+            done_b.append(b)
+            remaining -= len(a)
+
+        pair = (
+            np.concatenate(done_a) if done_a else np.empty(0, dtype=int),
+            np.concatenate(done_b) if done_b else np.empty(0, dtype=int),
+        )
+        self.history.append(pair)
+        return pair
+
+    def run(self, steps, max_swaps=None):
+        """Run `steps` steps; returns the full swap history."""
+        for _ in range(steps):
+            self.step(max_swaps)
+        return self.history
+
+    def states(self):
+        """Flat type arrays before each recorded step, plus the final one."""
+        flat = self.initial_types.ravel().copy()
+        out = [flat.copy()]
+        for a, b in self.history:
+            flat[a], flat[b] = flat[b], flat[a].copy()
+            out.append(flat.copy())
+        return out
+
+
+# ---------------------------------------------------------------------------
+# Rendering
+# ---------------------------------------------------------------------------
+
+def _square_beziers(side):
+    """(16, 3) cubic Bezier control points of an axis-aligned square."""
+    h = side / 2
+    corners = np.array([[h, h, 0], [-h, h, 0], [-h, -h, 0], [h, -h, 0], [h, h, 0]])
+    start, end = corners[:-1], corners[1:]
+    return np.stack([start, start + (end - start) / 3, start + 2 * (end - start) / 3, end], axis=1).reshape(-1, 3)
+
+
+class CellGrid(VGroup):
+    """
+    Batched grid of colored cells: one VMobject per cell type.
+
+    Position it with move_to/shift; cell geometry is regenerated from the
+    slot centers, so scaling or rotating the group is not supported.
+
+    Args:
+        types: Flat or (rows, cols) initial type array
+        rows, cols: Grid size
+        colors: One fill color per type
+        cell_size: Side length of each square
+        spacing: Distance between neighboring cell centers
+    """
+
+    def __init__(
+        self,
+        types,
+        rows,
+        cols,
+        colors,
+        cell_size=0.5,
+        spacing=0.6,
+        fill_opacity=0.95,
+        stroke_width=0.5,
+        stroke_color=GRAY_D,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self.rows, self.cols = rows, cols
+        self.types = np.asarray(types).ravel().copy()
+        rr, cc = np.divmod(np.arange(rows * cols), cols)
+        self.slot_centers = np.stack([
+            (cc - (cols - 1) / 2) * spacing,
+            ((rows - 1) / 2 - rr) * spacing,
+            np.zeros(rows * cols),
+        ], axis=1)
+        self._template = _square_beziers(cell_size)
+        self.layers = [
+            VMobject(
+                fill_color=color, fill_opacity=fill_opacity,
+                stroke_color=stroke_color, stroke_width=stroke_width,
+            )
+            for color in colors
+        ]
+        self.add(*self.layers)
+        self.show(self.types)
+
+    def shift(self, *vectors):
+        self.slot_centers = self.slot_centers + sum(vectors)
+        return super().shift(*vectors)
+
+    def show(self, types, swaps=None, alpha=0.0):
+        """
+        Draw `types` with the cells of each swap pair `alpha` of the way
+        toward each other's slot.
+        """
+        centers = self.slot_centers
+        if swaps is not None and len(swaps[0]):
+            a, b = swaps
+            centers = centers.copy()
+            ca, cb = self.slot_centers[a], self.slot_centers[b]
+            centers[a] = ca + alpha * (cb - ca)
+            centers[b] = cb + alpha * (ca - cb)
+        for t, layer in enumerate(self.layers):
+            pts = centers[types == t][:, None, :] + self._template[None]
+            layer.set_points(pts.reshape(-1, 3))
+        return self
+
+    def cell_squares(self):
+        """
+        The current cells as separate VMobjects in slot order, styled like
+        the grid, for animations that need them one by one (a lagged
+        FadeIn). Swap them for the grid once that animation is done.
+        """
+        cells = VGroup()
+        for center, t in zip(self.slot_centers, self.types):
+            cells.add(self.layers[t].copy().set_points(center + self._template))
+        return cells
+
+
+class ReplaySwaps(Animation):
+    """
+    Replay a CellSortSim history onto a CellGrid, one equal slice of the
+    run time per step.
+
+    Args:
+        grid: CellGrid showing the simulation's initial types
+        sim: CellSortSim whose history is replayed
+    """
+
+    def __init__(self, grid, sim, rate_func=linear, **kwargs):
+        self.history = sim.history
+        self.states = sim.states()
+        super().__init__(grid, rate_func=rate_func, **kwargs)
+
+    def interpolate_mobject(self, alpha):
+        if not self.history:
+            return
+        pos = alpha * len(self.history)
+        i = min(int(pos), len(self.history) - 1)
+        self.mobject.show(self.states[i], self.history[i], pos - i)
+
+    def finish(self):
+        super().finish()
+        self.mobject.types = self.states[-1]
+        self.mobject.show(self.mobject.types)
@@ -0,0 +1,250 @@
+"""
+chunks.py
+Encode each animation in GOP-aligned chunks on parallel encoders.
+
+A play() is encoded by one x264 instance fed by one writer thread. For
+long renders (the 10-minute Cox model at 1440p) that encoder is a large
+share of the total time, and a single encoder does not use every core.
+
+enable_chunked_encoding() patches the scene file writer so that each
+partial movie is cut into chunks of `chunk_seconds`:
+
+  * the writer thread converts every frame to the encoder's pixel format
+    once (which also releases the frame buffer, see pipeline.py) and
+    appends it to the current chunk;
+  * every chunk is its own encoder and container, run on a worker pool,
+    so it starts with a keyframe and chunks encode side by side;
+  * once a play() ends, its chunks are joined into the partial movie
+    file by stream copy (no re-encode), in the background while the
+    next play() renders. The scene file is combined only after every
+    join has finished, with explicit timestamp offsets as holds.py
+    combines it.
+
+Every chunk uses exactly the codec, pixel format and options manim uses
+for a partial movie (see project.stream_settings), plus the same fixed
+thread count, so the chunks' parameter sets agree and the stream-copy
+joins are always valid. Runs of identical frames (waits, holds.py) are
+stored as their first and last frame, as holds.py does. Frames waiting
+for an encoder are bounded by `max_buffered_frames` (about 5.5 MB each
+at 1440p in YUV 4:2:0); when the budget is used up, rendering waits.
+"""
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from fractions import Fraction
+from pathlib import Path
+from queue import Queue
+
+import av
+from manim import config, logger
+from manim.scene.scene_file_writer import SceneFileWriter, to_av_frame_rate
+from manim.utils.file_ops import is_gif_format
+
+from .holds import _add_stream_like, _combine_files, seal_packets
+from .pipeline import video_frame
+from .project import stream_settings
+
+_previous = {}
+_settings = {"chunk_seconds": 2.0, "threads": 1, "encoders": None, "joiner": None, "budget": None}
+stats = {"chunks": 0, "joins": 0}
+
+
+class ChunkEncoder:
+    """
+    One chunk of a partial movie: its own frame queue, encoder and file.
+
+    Args:
+        path: Chunk file to write
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.frames = Queue()
+        self.next_pts = 0
+        self.future = _settings["encoders"].submit(self.run)
+        stats["chunks"] += 1
+
+    def put(self, frame, num_frames):
+        """Queue `frame` for the next `num_frames` frame slots."""
+        _settings["budget"].acquire()
+        self.frames.put((frame, self.next_pts, num_frames))
+        self.next_pts += num_frames
+
+    def close(self):
+        self.frames.put(None)
+
+    def run(self):
+        """Encode every queued frame; returns the chunk's length in frames."""
+        codec, pix_fmt, options = stream_settings()
+        container = av.open(str(self.path), mode="w")
+        try:
+            stream = container.add_stream(
+                codec, rate=to_av_frame_rate(config.frame_rate),
+                options={**options, "threads": str(_settings["threads"])},
+            )
+            stream.pix_fmt = pix_fmt
+            stream.width = config.pixel_width
+            stream.height = config.pixel_height
+            dts_shift = None
+            while (item := self.frames.get()) is not None:
+                frame, pts, num_frames = item
+                try:
+                    # A run of identical frames is its first and last frame
+                    for t in sorted({pts, pts + num_frames - 1}):
+                        frame.pts = t
+                        for packet in stream.encode(frame):
+                            if dts_shift is None and packet.dts is not None:
+                                dts_shift = packet.dts - packet.pts
+                            container.mux(packet)
+                finally:
+                    _settings["budget"].release()
+            packets = list(stream.encode())
+            seal_packets(packets, self.next_pts, dts_shift)
+            for packet in packets:
+                container.mux(packet)
+        except BaseException:
+            # Free the budget held by frames this chunk will never encode
+            while (item := self.frames.get()) is not None:
+                _settings["budget"].release()
+            raise
+        finally:
+            container.close()
+        return self.next_pts
+
+
+def join_chunks(chunks, output):
+    """Concatenate encoded `chunks` into `output` by stream copy, then delete them."""
+    lengths = [chunk.future.result() for chunk in chunks]
+    frame_time = 1 / Fraction(to_av_frame_rate(config.frame_rate))
+    with av.open(str(output), mode="w") as container:
+        stream = None
+        offset = 0
+        for chunk, length in zip(chunks, lengths):
+            with av.open(str(chunk.path)) as source:
+                template = source.streams.video[0]
+                if stream is None:
+                    stream = _add_stream_like(container, template)
+                shift = round(offset * frame_time / template.time_base)
+                for packet in source.demux(template):
+                    if packet.dts is None:
+                        continue
+                    packet.pts += shift
+                    packet.dts += shift
+                    packet.stream = stream
+                    container.mux(packet)
+            offset += length
+            chunk.path.unlink()
+    stats["joins"] += 1
+    return output
+
+
+# ---------------------------------------------------------------------------
+# File writer: chunked partial movies
+# ---------------------------------------------------------------------------
+
+def _chunk_path(writer, index):
+    path = Path(writer.partial_movie_file_path)
+    return path.with_name(f"{path.stem}.chunk{index:04d}{path.suffix}")
+
+
+def _open_partial_movie_stream(self, file_path=None):
+    if is_gif_format():
+        return _previous["open"](self, file_path)
+    if file_path is None:
+        file_path = self.partial_movie_files[self.renderer.num_plays]
+    self.partial_movie_file_path = file_path
+    self._chunks = []
+    self.queue = Queue()
+    self.writer_thread = threading.Thread(target=self.listen_and_write, args=())
+    self.writer_thread.start()
+
+
+def _encode_and_write_frame(self, frame, num_frames):
+    chunks = getattr(self, "_chunks", None)
+    if chunks is None or is_gif_format():
+        return _previous["encode"](self, frame, num_frames)
+    if num_frames <= 0:
+        return
+    chunk_frames = max(1, round(_settings["chunk_seconds"] * config.frame_rate))
+    if not chunks or chunks[-1].next_pts >= chunk_frames:
+        if chunks:
+            chunks[-1].close()
+        chunks.append(ChunkEncoder(_chunk_path(self, len(chunks))))
+    pix_fmt = stream_settings()[1]
+    av_frame = video_frame(frame).reformat(format=pix_fmt)
+    av_frame.time_base = 1 / Fraction(to_av_frame_rate(config.frame_rate))
+    chunks[-1].put(av_frame, num_frames)
+
+
+def _close_partial_movie_stream(self):
+    chunks = getattr(self, "_chunks", None)
+    if chunks is None or is_gif_format():
+        return _previous["close"](self)
+    self.queue.put((-1, None))
+    self.writer_thread.join()
+    self._chunks = None
+    if not chunks:
+        # An empty play still gets its (empty) chunk and partial file
+        chunks.append(ChunkEncoder(_chunk_path(self, 0)))
+    chunks[-1].close()
+    joins = getattr(self, "_chunk_joins", [])
+    joins.append(_settings["joiner"].submit(join_chunks, chunks, self.partial_movie_file_path))
+    self._chunk_joins = joins
+    logger.info(
+        f"Animation {self.renderer.num_plays} : {len(chunks)} chunk(s) encoding into %(path)s",
+        {"path": f"'{self.partial_movie_file_path}'"},
+    )
+
+
+def _combine_to_movie(self):
+    for join in getattr(self, "_chunk_joins", []):
+        join.result()
+    self._chunk_joins = []
+    return _previous["combine"](self)
+
+
+def enable_chunked_encoding(workers=None, chunk_seconds=2.0, max_buffered_frames=240):
+    """
+    Encode partial movies as parallel chunks joined by stream copy (see
+    module docstring). Enable after enable_static_holds() and
+    enable_render_pipeline(), whose writer-side hooks this one takes over.
+
+    Args:
+        workers: Chunks encoded at once (default: one per four cores)
+        chunk_seconds: Chunk length; every chunk starts with a keyframe
+        max_buffered_frames: Converted frames waiting for an encoder
+    """
+    cores = os.cpu_count() or 1
+    workers = workers or max(1, cores // 4)
+    if not _previous:
+        _previous.update(
+            open=SceneFileWriter.open_partial_movie_stream,
+            encode=SceneFileWriter.encode_and_write_frame,
+            close=SceneFileWriter.close_partial_movie_stream,
+            combine=SceneFileWriter.combine_to_movie,
+            combine_files=SceneFileWriter.combine_files,
+        )
+    _settings.update(
+        chunk_seconds=chunk_seconds,
+        threads=max(1, cores // workers),
+        encoders=ThreadPoolExecutor(max_workers=workers, thread_name_prefix="chunk"),
+        joiner=ThreadPoolExecutor(max_workers=1, thread_name_prefix="join"),
+        budget=threading.BoundedSemaphore(max_buffered_frames),
+    )
+    SceneFileWriter.open_partial_movie_stream = _open_partial_movie_stream
+    SceneFileWriter.encode_and_write_frame = _encode_and_write_frame
+    SceneFileWriter.close_partial_movie_stream = _close_partial_movie_stream
+    SceneFileWriter.combine_to_movie = _combine_to_movie
+    SceneFileWriter.combine_files = _combine_files
+
+
+def disable_chunked_encoding():
+    """Encode each partial movie with a single encoder, as before."""
+    if _previous:
+        SceneFileWriter.open_partial_movie_stream = _previous["open"]
+        SceneFileWriter.encode_and_write_frame = _previous["encode"]
+        SceneFileWriter.close_partial_movie_stream = _previous["close"]
+        SceneFileWriter.combine_to_movie = _previous["combine"]
+        SceneFileWriter.combine_files = _previous["combine_files"]
+        _previous.clear()
@@ -0,0 +1,52 @@
+"""
+coords.py
+Batch coordinate transforms for Axes / NumberPlane.
+
+An Axes maps scaled coordinates (after each axis' scaling, e.g. log10 for
+a LogBase axis) to the scene with a fixed affine map. axes_affine() reads
+that map off three c2p probes; coords_to_points() then converts whole
+arrays with one inverse-scaling call per axis and one broadcast, instead
+of a c2p call per point.
+
+The affine map is re-probed on every call, so axes that were moved or
+scaled after construction are always handled correctly.
+"""
+
+import numpy as np
+
+
+def axes_affine(axes):
+    """
+    Affine map of `axes` in scaled coordinates.
+
+    Returns:
+        (origin, ex, ey): scene point = origin + u * ex + v * ey, where u and
+        v are the x/y coordinates after the axes' inverse scaling
+    """
+    fx = axes.x_axis.scaling.function
+    fy = axes.y_axis.scaling.function
+    p00 = np.asarray(axes.c2p(fx(0.0), fy(0.0)), dtype=float)
+    p10 = np.asarray(axes.c2p(fx(1.0), fy(0.0)), dtype=float)
+    p01 = np.asarray(axes.c2p(fx(0.0), fy(1.0)), dtype=float)
+    return p00, p10 - p00, p01 - p00
+
+
+def coords_to_points(axes, x, y=None):
+    """
+    Vectorized `axes.c2p` for many points.
+
+    Args:
+        axes: Axes, NumberPlane or any subclass (log-scaled axes included)
+        x: (N,) x coordinates, or an (N, 2) array of (x, y) pairs
+        y: (N,) y coordinates when `x` is 1D
+
+    Returns:
+        (N, 3) scene points, ready for set_points_* / path construction
+    """
+    if y is None:
+        xy = np.asarray(x, dtype=float)
+        x, y = xy[:, 0], xy[:, 1]
+    u = axes.x_axis.scaling.inverse_function(np.asarray(x, dtype=float))
+    v = axes.y_axis.scaling.inverse_function(np.asarray(y, dtype=float))
+    origin, ex, ey = axes_affine(axes)
+    return origin + np.multiply.outer(u, ex) + np.multiply.outer(v, ey)
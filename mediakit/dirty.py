@@ -0,0 +1,188 @@
+"""
+dirty.py
+Redraw only the part of the frame that changed.
+
+Each animated frame, manim copies the whole static image into the pixel
+array and re-rasterizes every moving mobject over the full frame, even
+when the only thing that moved is a readout in one corner. At 2560x1440
+that is a 14 MB copy plus a full-frame Cairo pass for every moving path.
+
+enable_dirty_rects() patches the Cairo renderer's update_frame to keep
+the previous frame in place and, per frame:
+
+  * digest every displayed moving mobject (points, colors, stroke widths,
+    z-order; see holds.mobject_digest) and compare with the last frame;
+  * take the pixel bounding box of each mobject that appeared, changed
+    or disappeared -- old and new boxes both, padded for stroke width
+    and miter joints -- and their union;
+  * restore only that rectangle from the static image (or background),
+    then draw the moving mobjects that overlap it, clipped to it.
+
+Drawing order is kept, and pixels inside the rectangle are produced by
+the same Cairo operations as a full redraw. A full redraw is used when
+the rectangle covers more than `max_fraction` of the frame, on the first
+frame of each play(), after the camera moves or its pixel array is
+swapped (see pipeline.py), when moving mobjects are reordered, and
+whenever a point cloud, image or background-gradient VMobject is moving
+(those are not drawn through the clipped context).
+"""
+
+import numpy as np
+from manim import Mobject, ThreeDCamera, VMobject
+from manim.renderer.cairo_renderer import CairoRenderer
+from manim.utils.iterables import list_update
+
+from .holds import camera_digest, mobject_digest
+
+# Cairo's default miter limit (10) lets a joint reach 5 line widths out
+MITER_REACH = 5.0
+ANTIALIAS_PAD = 2
+
+_original_update_frame = CairoRenderer.update_frame
+_settings = {"max_fraction": 0.5}
+stats = {"full": 0, "partial": 0, "clean": 0, "dirty_pixels": 0}
+
+
+def pixel_box(camera, mob):
+    """(x0, y0, x1, y1) pixel bounds of a mobject's drawing, stroke included."""
+    points = mob.points
+    if len(points) == 0:
+        return None
+    x_scale = camera.pixel_width / camera.frame_width
+    y_scale = camera.pixel_height / camera.frame_height
+    low, high = points[:, :2].min(axis=0), points[:, :2].max(axis=0)
+    width = max(getattr(mob, "stroke_width", 0.0), getattr(mob, "background_stroke_width", 0.0))
+    pad = MITER_REACH * float(np.max(width)) * camera.cairo_line_width_multiple * x_scale + ANTIALIAS_PAD
+    center = camera.frame_center
+    x0 = (low[0] - center[0]) * x_scale + camera.pixel_width / 2 - pad
+    x1 = (high[0] - center[0]) * x_scale + camera.pixel_width / 2 + pad
+    y0 = (center[1] - high[1]) * y_scale + camera.pixel_height / 2 - pad
+    y1 = (center[1] - low[1]) * y_scale + camera.pixel_height / 2 + pad
+    return x0, y0, x1, y1
+
+
+def _clippable(camera, mob):
+    """Whether the camera draws `mob` through its Cairo context (or not at all)."""
+    kind = camera.type_or_raise(mob)
+    if kind is VMobject:
+        return not mob.get_background_image()
+    return kind is Mobject
+
+
+def _union(boxes):
+    boxes = [b for b in boxes if b is not None]
+    if not boxes:
+        return None
+    b = np.array(boxes)
+    return b[:, 0].min(), b[:, 1].min(), b[:, 2].max(), b[:, 3].max()
+
+
+class FrameState:
+    """What the pixel array holds after a frame: its base image and moving mobjects."""
+
+    def __init__(self, pixels, base, key, digests, boxes, clippable):
+        self.pixels = pixels
+        self.base = base
+        self.key = key
+        self.digests = digests
+        self.boxes = boxes
+        self.clippable = clippable
+
+    def dirty_box(self, new):
+        """
+        Pixel box to redraw to turn this frame into `new`: () when nothing
+        changed, None when only a full redraw will do.
+        """
+        if new.pixels is not self.pixels or new.base is not self.base or new.key != self.key:
+            return None
+        if not (self.clippable and new.clippable):
+            return None
+        if new.digests == self.digests:
+            return ()
+        old_set, new_set = set(self.digests), set(new.digests)
+        kept_old = [d for d in self.digests if d in new_set]
+        kept_new = [d for d in new.digests if d in old_set]
+        if kept_old != kept_new:
+            return None
+        changed = [b for d, b in zip(self.digests, self.boxes) if d not in new_set]
+        changed += [b for d, b in zip(new.digests, new.boxes) if d not in old_set]
+        return _union(changed) or ()
+
+
+def _update_frame(self, scene, mobjects=None, include_submobjects=True, ignore_skipping=True, **kwargs):
+    camera = self.camera
+    if (self.skip_animations and not ignore_skipping) or kwargs or isinstance(camera, ThreeDCamera):
+        self._frame_state = None
+        return _original_update_frame(
+            self, scene, mobjects, include_submobjects, ignore_skipping, **kwargs,
+        )
+
+    if not mobjects:
+        mobjects = list_update(scene.mobjects, scene.foreground_mobjects)
+    displayed = camera.get_mobjects_to_display(mobjects, include_submobjects=include_submobjects)
+    base = self.static_image if self.static_image is not None else camera.background
+    state = FrameState(
+        pixels=camera.pixel_array,
+        base=base,
+        key=camera_digest(camera),
+        digests=[mobject_digest(m) for m in displayed],
+        boxes=[pixel_box(camera, m) for m in displayed],
+        clippable=all(_clippable(camera, m) for m in displayed),
+    )
+    previous = getattr(self, "_frame_state", None)
+    self._frame_state = state
+    box = previous.dirty_box(state) if previous is not None else None
+
+    if box == ():
+        stats["clean"] += 1
+        return None
+    width, height = camera.pixel_width, camera.pixel_height
+    if box is not None:
+        x0, y0 = max(int(np.floor(box[0])), 0), max(int(np.floor(box[1])), 0)
+        x1, y1 = min(int(np.ceil(box[2])), width), min(int(np.ceil(box[3])), height)
+        if x1 <= x0 or y1 <= y0:
+            stats["clean"] += 1
+            return None
+        if (x1 - x0) * (y1 - y0) > _settings["max_fraction"] * width * height:
+            box = None
+    if box is None:
+        stats["full"] += 1
+        return _original_update_frame(self, scene, mobjects, include_submobjects, ignore_skipping)
+
+    stats["partial"] += 1
+    stats["dirty_pixels"] += (x1 - x0) * (y1 - y0)
+    camera.pixel_array[y0:y1, x0:x1] = base[y0:y1, x0:x1]
+    overlapping = [
+        m for m, b in zip(displayed, state.boxes)
+        if b is not None and b[0] < x1 and b[2] > x0 and b[1] < y1 and b[3] > y0
+    ]
+    ctx = camera.get_cairo_context(camera.pixel_array)
+    ctx.save()
+    try:
+        # Clip in device pixels, then draw with the camera's frame transform
+        matrix = ctx.get_matrix()
+        ctx.identity_matrix()
+        ctx.rectangle(x0, y0, x1 - x0, y1 - y0)
+        ctx.clip()
+        ctx.set_matrix(matrix)
+        camera.capture_mobjects(overlapping, include_submobjects=False)
+    finally:
+        ctx.restore()
+    return None
+
+
+def enable_dirty_rects(max_fraction=0.5):
+    """
+    Redraw only the changed region of each frame (see module docstring).
+
+    Args:
+        max_fraction: Largest share of the frame redrawn partially; above
+                      it the whole frame is redrawn
+    """
+    _settings["max_fraction"] = max_fraction
+    CairoRenderer.update_frame = _update_frame
+
+
+def disable_dirty_rects():
+    """Redraw every frame in full, as manim does."""
+    CairoRenderer.update_frame = _original_update_frame
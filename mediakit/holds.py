@@ -0,0 +1,283 @@
+"""
+holds.py
+Encode static holds as one frame plus a duration.
+
+Manim already rasterizes a static wait() only once, but it still pushes
+that frame through the encoder once per output frame: a wait(10) at
+2560x1440 is 300 RGBA -> YUV conversions and 300 x264 encodes of the same
+picture. Waits with updaters, and plays whose updaters leave everything
+as it was, do not even get the single rasterization.
+
+enable_static_holds() patches the Cairo renderer and the scene file
+writer:
+
+  * Every rendered frame is fingerprinted (the displayed mobjects'
+    points, colors, stroke widths and z-order, plus the camera frame,
+    a ThreeDCamera's orientation, zoom and light source, and the camera
+    background).
+    While the fingerprint repeats, rasterization is skipped and the
+    frames are counted instead.
+  * A run of identical frames is encoded as two frames, its first and
+    last, with the timestamps in between left empty. The stream becomes
+    variable frame rate, so players hold the picture for the full
+    duration and every timestamp is unchanged.
+  * The scene file is combined by stream copy with every partial's
+    timestamps offset explicitly (concat_partials). Manim's own combine
+    drops the dts and lets libav guess it, which falls far behind after a
+    hold, and a scene ending on a hold would lose it.
+
+The encoded pictures are the same ones manim would produce; only the
+repeated copies are gone. GIF output (re-timed frame by frame when the
+partial movies are combined) and PNG sequences keep manim's own
+per-frame path.
+"""
+
+import hashlib
+from fractions import Fraction
+
+import av
+import numpy as np
+from manim import ThreeDCamera, config, logger
+from manim import __version__ as manim_version
+from manim.renderer.cairo_renderer import CairoRenderer
+from manim.scene.scene_file_writer import SceneFileWriter, to_av_frame_rate
+from manim.utils.file_ops import is_gif_format, is_png_format
+
+from .pipeline import video_frame
+
+STATE_ATTRS = (
+    "fill_rgbas", "stroke_rgbas", "background_stroke_rgbas",
+    "stroke_width", "background_stroke_width", "sheen_factor",
+    "sheen_direction", "rgbas", "pixel_array", "z_index",
+)
+
+_original = {
+    "render": CairoRenderer.render,
+    "open": SceneFileWriter.open_partial_movie_stream,
+    "encode": SceneFileWriter.encode_and_write_frame,
+    "close": SceneFileWriter.close_partial_movie_stream,
+    "end_animation": SceneFileWriter.end_animation,
+    "combine_files": SceneFileWriter.combine_files,
+}
+stats = {"rendered": 0, "reused": 0, "encoded": 0, "held": 0}
+
+
+def camera_digest(camera):
+    """Digest of the camera's frame placement (and 3D orientation)."""
+    center = np.asarray(getattr(camera, "frame_center", np.zeros(3)), dtype=float)
+    size = [getattr(camera, "frame_width", 0.0), getattr(camera, "frame_height", 0.0)]
+    parts = [center, size]
+    if isinstance(camera, ThreeDCamera):
+        # Ambient rotation moves the picture while every point stays put
+        parts.append([
+            camera.get_phi(), camera.get_theta(), camera.get_gamma(),
+            camera.get_zoom(), camera.get_focal_distance(),
+        ])
+        parts.append(np.asarray(camera.light_source.get_center(), dtype=float))
+    return np.concatenate(parts).astype(float).tobytes()
+
+
+def mobject_digest(mob):
+    """Digest of one displayed mobject's points and drawing state."""
+    h = hashlib.blake2b(type(mob).__name__.encode(), digest_size=16)
+    h.update(np.ascontiguousarray(mob.points).tobytes())
+    for attr in STATE_ATTRS:
+        value = getattr(mob, attr, None)
+        if value is not None:
+            h.update(np.ascontiguousarray(value).tobytes())
+    return h.digest()
+
+
+def frame_fingerprint(camera, mobjects):
+    """Digest of everything the camera would draw for `mobjects`."""
+    h = hashlib.blake2b(camera_digest(camera), digest_size=16)
+    for mob in camera.get_mobjects_to_display(mobjects):
+        h.update(mobject_digest(mob))
+    return h.digest()
+
+
+# ---------------------------------------------------------------------------
+# Renderer: skip rasterizing frames identical to the previous one
+# ---------------------------------------------------------------------------
+
+def flush_hold(renderer):
+    """Send the pending run of identical frames to the file writer."""
+    pending = getattr(renderer, "_hold", None)
+    renderer._hold = None
+    if pending is not None:
+        _, frame, count, _ = pending
+        renderer.file_writer.write_frame(frame, num_frames=count)
+
+
+def _render(self, scene, time, moving_mobjects):
+    if self.skip_animations or is_png_format():
+        return _original["render"](self, scene, time, moving_mobjects)
+
+    key = frame_fingerprint(self.camera, moving_mobjects)
+    pending = getattr(self, "_hold", None)
+    # The hold keeps its background alive, so an identity check is safe
+    if pending is not None and pending[0] == key and pending[3] is self.camera.background:
+        pending[2] += 1
+        stats["reused"] += 1
+    else:
+        flush_hold(self)
+        self.update_frame(scene, moving_mobjects)
+        self._hold = [key, self.get_frame(), 1, self.camera.background]
+        stats["rendered"] += 1
+    self.time += 1 / self.camera.frame_rate
+
+
+# ---------------------------------------------------------------------------
+# File writer: a run of n identical frames costs two encodes
+# ---------------------------------------------------------------------------
+
+def _open_partial_movie_stream(self, file_path=None):
+    self._next_pts = 0
+    self._dts_shift = None
+    _original["open"](self, file_path)
+
+
+def _mux(self, packets):
+    for packet in packets:
+        if self._dts_shift is None and packet.dts is not None:
+            self._dts_shift = packet.dts - packet.pts
+        self.video_container.mux(packet)
+
+
+def _encode_picture(self, frame, pts):
+    av_frame = video_frame(frame)
+    av_frame.pts = pts
+    av_frame.time_base = 1 / Fraction(to_av_frame_rate(config.frame_rate))
+    _mux(self, self.video_stream.encode(av_frame))
+    stats["encoded"] += 1
+
+
+def _encode_and_write_frame(self, frame, num_frames):
+    if is_gif_format():
+        return _original["encode"](self, frame, num_frames)
+    if num_frames <= 0:
+        return
+    start = self._next_pts
+    _encode_picture(self, frame, start)
+    if num_frames > 1:
+        # The closing copy pins the end of the hold on the timeline
+        _encode_picture(self, frame, start + num_frames - 1)
+        stats["held"] += num_frames - 2
+    self._next_pts = start + num_frames
+
+
+def seal_packets(packets, next_pts, dts_shift=None):
+    """
+    Stretch the last of a stream's flushed `packets` so the track ends
+    `next_pts` frames in. The muxer ends it at the last packet's dts +
+    duration, which falls short when the stream ends on a hold.
+    """
+    if not packets:
+        return
+    last = packets[-1]
+    if dts_shift is None:
+        dts_shift = packets[0].dts - packets[0].pts
+    frame_time = 1 / Fraction(to_av_frame_rate(config.frame_rate))
+    end = round(next_pts * frame_time / last.time_base) + dts_shift
+    last.duration = max(last.duration, end - last.dts)
+
+
+def _close_partial_movie_stream(self):
+    if is_gif_format():
+        return _original["close"](self)
+    self.queue.put((-1, None))
+    self.writer_thread.join()
+
+    packets = list(self.video_stream.encode())
+    seal_packets(packets, self._next_pts, self._dts_shift)
+    _mux(self, packets)
+    self.video_container.close()
+    logger.info(
+        f"Animation {self.renderer.num_plays} : Partial movie file written in %(path)s",
+        {"path": f"'{self.partial_movie_file_path}'"},
+    )
+
+
+def _add_stream_like(container, template):
+    """Output stream copying `template`'s codec parameters (PyAV < 14 and >= 14)."""
+    if hasattr(container, "add_stream_from_template"):
+        return container.add_stream_from_template(template)
+    return container.add_stream(template=template)
+
+
+def concat_partials(input_files, output_file):
+    """
+    Concatenate partial movies into `output_file` by stream copy.
+
+    Each partial is shifted by the length of those before it, taken as its
+    last packet's dts + duration (what seal_packets pins), so a partial
+    ending on a hold keeps its full length, as in chunks.join_chunks.
+
+    Returns:
+        Length of the combined movie in seconds
+    """
+    offset = Fraction(0)
+    with av.open(str(output_file), mode="w") as container:
+        container.metadata["comment"] = f"Rendered with Manim Community v{manim_version}"
+        stream = None
+        for path in input_files:
+            with av.open(str(path)) as source:
+                template = source.streams.video[0]
+                if stream is None:
+                    stream = _add_stream_like(container, template)
+                shift = round(offset / template.time_base)
+                dts_shift = end = None
+                for packet in source.demux(template):
+                    if packet.dts is None:
+                        continue
+                    if dts_shift is None:
+                        dts_shift = packet.dts - packet.pts
+                    end = packet.dts + (packet.duration or 0)
+                    packet.pts += shift
+                    packet.dts += shift
+                    packet.stream = stream
+                    container.mux(packet)
+                if end is not None:
+                    offset += (end - dts_shift) * template.time_base
+
+    # The muxer ends the track at its last dts + duration; check it kept the holds
+    with av.open(str(output_file)) as combined:
+        stream = combined.streams.video[0]
+        length = stream.duration * stream.time_base if stream.duration else None
+    if length is not None and abs(length - offset) * Fraction(config.frame_rate) > Fraction(1, 2):
+        logger.warning(
+            "%(path)s lasts %(length).3fs, its partial movies %(expected).3fs",
+            {"path": f"'{output_file}'", "length": float(length), "expected": float(offset)},
+        )
+    return offset
+
+
+def _combine_files(self, input_files, output_file, create_gif=False, includes_sound=False):
+    if create_gif:
+        return _original["combine_files"](self, input_files, output_file, create_gif, includes_sound)
+    concat_partials(input_files, output_file)
+
+
+def _end_animation(self, allow_write=False):
+    flush_hold(self.renderer)
+    _original["end_animation"](self, allow_write)
+
+
+def enable_static_holds():
+    """Skip re-rasterizing and re-encoding frames that do not change."""
+    CairoRenderer.render = _render
+    SceneFileWriter.open_partial_movie_stream = _open_partial_movie_stream
+    SceneFileWriter.encode_and_write_frame = _encode_and_write_frame
+    SceneFileWriter.close_partial_movie_stream = _close_partial_movie_stream
+    SceneFileWriter.end_animation = _end_animation
+    SceneFileWriter.combine_files = _combine_files
+
+
+def disable_static_holds():
+    """Restore manim's per-frame rendering and encoding."""
+    CairoRenderer.render = _original["render"]
+    SceneFileWriter.open_partial_movie_stream = _original["open"]
+    SceneFileWriter.encode_and_write_frame = _original["encode"]
+    SceneFileWriter.close_partial_movie_stream = _original["close"]
+    SceneFileWriter.end_animation = _original["end_animation"]
+    SceneFileWriter.combine_files = _original["combine_files"]
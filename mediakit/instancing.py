@@ -0,0 +1,283 @@
+"""
+instancing.py
+Many copies of one shape, stored as columns instead of mobjects.
+
+An Instances group holds one template path and, per instance, only a
+center, a scale, a fill color, a fill opacity and an overall opacity, each
+in its own numpy column. Drawing buckets instances by their (8-bit
+quantized) color and opacities and emits one VMobject per bucket, built by
+broadcasting the template against the centers, so 10^4 tiles cost a
+handful of mobjects and a few array operations per refresh.
+
+InstanceTransition animates any subset of the columns, optionally with
+a per-instance lag (the same timing as FadeIn(..., lag_ratio=...) on a
+VGroup), with one array interpolation per frame. FadeInInstances and
+TransformInstances are the columnar counterparts of FadeIn and Transform.
+
+Instances in different buckets are drawn bucket by bucket, so overlapping
+instances do not keep their relative order.
+"""
+
+import numpy as np
+from manim import Animation, ManimColor, VGroup, VMobject, WHITE, smooth
+
+COLUMNS = ("positions", "scales", "colors", "fill_opacities", "opacities")
+
+
+def _rgb_column(colors, n):
+    """(n, 3) float RGB from one color or a sequence of n colors."""
+    if isinstance(colors, np.ndarray) and colors.ndim == 2:
+        return colors.astype(float)
+    if isinstance(colors, (list, tuple)):
+        return np.array([ManimColor(c).to_rgb() for c in colors], dtype=float)
+    return np.tile(ManimColor(colors).to_rgb(), (n, 1))
+
+
+def rate_table(rate_func, resolution=1024):
+    """Samples of `rate_func` on [0, 1], for vectorized lookups via np.interp."""
+    grid = np.linspace(0.0, 1.0, resolution + 1)
+    return grid, np.array([rate_func(t) for t in grid])
+
+
+def lagged_alphas(alpha, n, lag_ratio, table):
+    """
+    Per-item progress for n items started `lag_ratio` apart, matching
+    Animation.get_sub_alpha, with the rate function applied via `table`.
+    """
+    full_length = (n - 1) * lag_ratio + 1
+    local = np.clip(alpha * full_length - np.arange(n) * lag_ratio, 0.0, 1.0)
+    return np.interp(local, *table)
+
+
+class Instances(VGroup):
+    """
+    N instances of one template shape with columnar per-instance state.
+
+    Translations applied from outside (shift/move_to/next_to on this group
+    or any parent) are picked up on the next refresh; scaling or rotating
+    the group is not supported, set the `scales` column instead.
+
+    Args:
+        template: VMobject (its points about its center are shared) or an
+                  (M, 3) array of cubic Bezier control points
+        positions: (N, 3) instance centers
+        scales: Scalar or (N,) scale of the template
+        colors: One fill color or N fill colors
+        fill_opacities: Scalar or (N,) fill opacity
+        opacities: Scalar or (N,) overall opacity (multiplies fill and stroke)
+        stroke_color, stroke_width, stroke_opacity: Stroke shared by all
+    """
+
+    def __init__(
+        self,
+        template,
+        positions,
+        scales=1.0,
+        colors=WHITE,
+        fill_opacities=1.0,
+        opacities=1.0,
+        stroke_color=WHITE,
+        stroke_width=0.0,
+        stroke_opacity=1.0,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        if isinstance(template, VMobject):
+            stroke_width = stroke_width or template.get_stroke_width()
+            template = template.points - template.get_center()
+        self.template = np.asarray(template, dtype=float)
+
+        self.positions = np.array(positions, dtype=float)
+        n = len(self.positions)
+        self.scales = np.broadcast_to(np.asarray(scales, dtype=float), (n,)).copy()
+        self.colors = _rgb_column(colors, n)
+        self.fill_opacities = np.broadcast_to(np.asarray(fill_opacities, dtype=float), (n,)).copy()
+        self.opacities = np.broadcast_to(np.asarray(opacities, dtype=float), (n,)).copy()
+        self.stroke_style = (stroke_color, stroke_width, stroke_opacity)
+
+        self._layers = []
+        self._buffer = None
+        self._written = None
+        self.refresh()
+
+    def __len__(self):
+        return len(self.positions)
+
+    # ------------------------------------------------------------------
+    # Columns
+    # ------------------------------------------------------------------
+    def sync(self):
+        """Fold translations applied to the drawn layers into `positions`."""
+        if self._written is not None and self.submobjects:
+            drift = self.submobjects[0].points[0] - self._written
+            if np.any(drift):
+                self._translate(drift)
+        return self
+
+    def _translate(self, vector):
+        self.positions += vector
+
+    def set_columns(self, **columns):
+        """Replace whole columns (see COLUMNS), then redraw."""
+        self.sync()
+        n = len(self.positions)
+        for name, value in columns.items():
+            if name not in COLUMNS:
+                raise ValueError(f"Unknown instance column {name!r}")
+            if name == "colors":
+                value = _rgb_column(value, n)
+            elif name == "positions":
+                value = np.array(value, dtype=float)
+            else:
+                value = np.broadcast_to(np.asarray(value, dtype=float), (n,)).copy()
+            setattr(self, name, value)
+        return self.refresh()
+
+    def get_columns(self):
+        """Copies of every column, e.g. to animate from."""
+        self.sync()
+        return {name: getattr(self, name).copy() for name in COLUMNS}
+
+    # ------------------------------------------------------------------
+    # Drawing
+    # ------------------------------------------------------------------
+    def refresh(self):
+        """Rebuild the bucket layers from the columns."""
+        self.sync()
+        keys = np.round(np.column_stack([
+            self.colors,
+            self.fill_opacities * self.opacities,
+            self.opacities,
+        ]) * 255).astype(np.int64)
+        # One sort on packed 8-bit channels groups instances by bucket
+        packed = np.zeros(len(keys), dtype=np.int64)
+        for channel in keys.T:
+            packed = (packed << 8) | np.clip(channel, 0, 255)
+        order = np.argsort(packed, kind="stable")
+        cuts = np.flatnonzero(np.diff(packed[order])) + 1
+        buckets = keys[order[np.concatenate([[0], cuts])]] if len(order) else keys[:0]
+        bounds = np.concatenate([[0], cuts, [len(order)]]) * len(self.template)
+
+        # Broadcast every instance into one buffer in bucket order; each
+        # layer's points are then a contiguous view, with no extra copy
+        shape = (len(order), *self.template.shape)
+        if self._buffer is None or self._buffer.shape != shape:
+            self._buffer = np.empty(shape)
+        np.multiply(self.scales[order, None, None], self.template[None], out=self._buffer)
+        self._buffer += self.positions[order, None, :]
+        flat = self._buffer.reshape(-1, 3)
+
+        while len(self._layers) < len(buckets):
+            self._layers.append(VMobject())
+        layers = self._layers[:len(buckets)]
+        stroke_color, stroke_width, stroke_opacity = self.stroke_style
+        for layer, key, start, stop in zip(layers, buckets, bounds[:-1], bounds[1:]):
+            layer.points = flat[start:stop]
+            layer.set_fill(ManimColor.from_rgb(key[:3] / 255), opacity=float(key[3]) / 255)
+            layer.set_stroke(stroke_color, width=stroke_width, opacity=stroke_opacity * float(key[4]) / 255)
+        self.submobjects = list(layers)
+        self._written = layers[0].points[0].copy() if layers else None
+        return self
+
+    def get_instances(self, indices):
+        """
+        Stand-alone VMobject with the geometry of the given instances, e.g.
+        for SurroundingRectangle or next_to targets.
+        """
+        self.sync()
+        idx = np.asarray(indices)
+        pts = self.positions[idx, None, :] + self.scales[idx, None, None] * self.template[None]
+        return VMobject().set_points(pts.reshape(-1, 3))
+
+
+class InstanceTransition(Animation):
+    """
+    Animate Instances columns to new values with one array op per frame.
+
+    Args:
+        instances: Instances to animate
+        lag_ratio: Per-instance start offset, as for FadeIn(group, lag_ratio)
+        **kwargs: Column targets (positions, scales, colors,
+                  fill_opacities, opacities; scalars broadcast) and
+                  Animation arguments
+    """
+
+    def __init__(self, instances, lag_ratio=0.0, rate_func=smooth, **kwargs):
+        self.targets = {name: kwargs.pop(name) for name in COLUMNS if name in kwargs}
+        super().__init__(instances, lag_ratio=lag_ratio, rate_func=rate_func, **kwargs)
+
+    def starting_columns(self):
+        """Column values at alpha = 0 (by default, the current ones)."""
+        return self.mobject.get_columns()
+
+    def begin(self):
+        inst = self.mobject
+        self.start = self.starting_columns()
+        n = len(inst)
+        self.end = {}
+        for name, value in self.targets.items():
+            if name == "colors":
+                self.end[name] = _rgb_column(value, n)
+            else:
+                self.end[name] = np.broadcast_to(np.asarray(value, dtype=float), self.start[name].shape)
+        self.table = rate_table(self.rate_func)
+        super().begin()
+
+    def create_starting_mobject(self):
+        # Columns are captured in begin(); no need to copy every layer
+        return VMobject()
+
+    def interpolate_mobject(self, alpha):
+        inst = self.mobject
+        a = lagged_alphas(alpha, len(inst), self.lag_ratio, self.table)
+        inst.sync()
+        for name, end in self.end.items():
+            start = self.start[name]
+            weight = a if start.ndim == 1 else a[:, None]
+            setattr(inst, name, start + weight * (end - start))
+        inst.refresh()
+
+
+class FadeInInstances(InstanceTransition):
+    """
+    Fade instances in from transparent, like FadeIn(group, scale=...) per
+    member, towards their opacities and scales at construction time.
+
+    Args:
+        instances: Instances to introduce
+        scale: Starting size relative to the final one
+        lag_ratio: Per-instance start offset
+    """
+
+    def __init__(self, instances, scale=1.0, lag_ratio=0.0, **kwargs):
+        self.start_scale = scale
+        super().__init__(
+            instances, lag_ratio=lag_ratio, introducer=True,
+            opacities=instances.opacities.copy(), scales=instances.scales.copy(),
+            **kwargs,
+        )
+
+    def starting_columns(self):
+        start = super().starting_columns()
+        start["opacities"] = np.zeros_like(self.targets["opacities"])
+        start["scales"] = self.targets["scales"] * self.start_scale
+        return start
+
+
+class TransformInstances(InstanceTransition):
+    """
+    Move every column of `instances` to those of `target`, instance by
+    instance (target is only read, never added to the scene).
+
+    Args:
+        instances: Instances to animate
+        target: Instances of the same length holding the end state
+        lag_ratio: Per-instance start offset
+    """
+
+    def __init__(self, instances, target, lag_ratio=0.0, **kwargs):
+        if len(target) != len(instances):
+            raise ValueError(
+                f"Cannot transform {len(instances)} instances into {len(target)}"
+            )
+        super().__init__(instances, lag_ratio=lag_ratio, **{**kwargs, **target.get_columns()})
@@ -0,0 +1,172 @@
+"""
+lagged.py
+Lagged FadeIn / FadeOut over large families as a few array operations.
+
+FadeIn(group, lag_ratio=...) is a Transform: every frame it walks the
+family, computes one sub-alpha per member and interpolates that member's
+points and colors from a faded copy, all in Python. BatchedFadeIn gathers
+every member's points and RGBA rows into two flat buffers once, computes
+the per-member alphas as one vector per frame, and interpolates both
+buffers in bulk. Members hold views into the buffers while the
+animation runs, so nothing is copied back per frame.
+
+The result matches FadeIn / FadeOut with the same shift, scale and
+lag_ratio (lag over family members with points, scale about the group's
+center). per_submobject=True instead matches
+LaggedStart(*[FadeIn(m, ...) for m in group], lag_ratio=...): one lag
+slot per top-level submobject, each scaled about its own center.
+"""
+
+import numpy as np
+from manim import ORIGIN, Animation, VMobject, smooth
+
+from .instancing import lagged_alphas, rate_table
+
+RGBA_ATTRS = ("fill_rgbas", "stroke_rgbas", "background_stroke_rgbas")
+
+
+class BatchedFade(Animation):
+    """
+    Fade a mobject family in or out with vectorized per-member lag.
+
+    Args:
+        mobject: Mobject whose family is faded (VMobjects get their
+                 colors faded; other members only move)
+        fade_in: Fade in (True) or out (False)
+        shift: Direction of motion, as for FadeIn / FadeOut
+        scale: Size of the faded state relative to the visible one
+        lag_ratio: Start offset between lag slots
+        per_submobject: One lag slot and scaling center per top-level
+                        submobject (LaggedStart timing; run_time then
+                        defaults to LaggedStart's 1 + (n - 1) * lag_ratio)
+    """
+
+    def __init__(self, mobject, fade_in=True, shift=ORIGIN, scale=1.0, lag_ratio=0.0,
+                 per_submobject=False, rate_func=smooth, **kwargs):
+        self.fade_in = fade_in
+        self.shift_vector = np.asarray(shift, dtype=float)
+        self.scale_factor = scale
+        self.per_submobject = per_submobject
+        if per_submobject and "run_time" not in kwargs:
+            kwargs["run_time"] = 1 + (len(mobject.submobjects) - 1) * lag_ratio
+        super().__init__(
+            mobject, lag_ratio=lag_ratio, rate_func=rate_func,
+            introducer=fade_in, remover=not fade_in, **kwargs,
+        )
+
+    def _lag_slots(self):
+        """
+        (family members with points, lag slot per member, number of slots,
+        scaling group per member, mobjects whose centers the groups scale about).
+        """
+        if not self.per_submobject:
+            members = self.mobject.family_members_with_points()
+            n = len(members)
+            return members, np.arange(n), n, np.zeros(n, dtype=int), [self.mobject]
+        members, slots, parents = [], [], []
+        for parent in self.mobject.submobjects:
+            family = parent.family_members_with_points()
+            members += family
+            slots += [len(parents)] * len(family)
+            parents.append(parent)
+        slots = np.array(slots, dtype=int)
+        return members, slots, len(parents), slots, parents
+
+    def begin(self):
+        members, self.slots, self.num_slots, groups, parents = self._lag_slots()
+        self.members = members
+        self.table = rate_table(self.rate_func)
+
+        # Points: visible state and faded state, as in _Fade._create_faded_mobject
+        counts = [len(m.points) for m in members]
+        self.point_weight_index = np.repeat(np.arange(len(members)), counts)
+        visible = np.concatenate([m.points for m in members]) if members else np.zeros((0, 3))
+        centers = np.array([p.get_center() for p in parents]).reshape(-1, 3)
+        center = np.repeat(centers[groups], counts, axis=0)
+        direction = -1 if self.fade_in else 1
+        faded = (visible - center) * self.scale_factor + center + direction * self.shift_vector
+
+        # Colors: every RGBA row of every VMobject member, faded to alpha 0
+        rows, owners = [], []
+        for i, m in enumerate(members):
+            if isinstance(m, VMobject):
+                for attr in RGBA_ATTRS:
+                    rgbas = getattr(m, attr)
+                    rows.append(rgbas)
+                    owners.append((i, m, attr, len(rgbas)))
+        visible_rgba = np.concatenate(rows) if rows else np.zeros((0, 4))
+        faded_rgba = visible_rgba.copy()
+        faded_rgba[:, 3] = 0.0
+        self.rgba_weight_index = np.repeat([o[0] for o in owners], [o[3] for o in owners]).astype(int)
+
+        if self.fade_in:
+            self.start_points, self.end_points = faded, visible
+            self.start_rgba, self.end_rgba = faded_rgba, visible_rgba
+        else:
+            self.start_points, self.end_points = visible, faded
+            self.start_rgba, self.end_rgba = visible_rgba, faded_rgba
+        self.point_delta = self.start_points - self.end_points
+        self.rgba_delta = self.start_rgba - self.end_rgba
+
+        # Hand every member views into the two shared buffers
+        self.points = self.end_points.copy()
+        self.rgba = self.end_rgba.copy()
+        offset = 0
+        for m, n in zip(members, counts):
+            m.points = self.points[offset:offset + n]
+            offset += n
+        offset = 0
+        for _, m, attr, n in owners:
+            setattr(m, attr, self.rgba[offset:offset + n])
+            offset += n
+        self._visible = (visible, visible_rgba, counts, owners)
+        super().begin()
+
+    def create_starting_mobject(self):
+        # Both states live in arrays built in begin()
+        return VMobject()
+
+    def interpolate_mobject(self, alpha):
+        w = lagged_alphas(alpha, self.num_slots, self.lag_ratio, self.table)[self.slots]
+        # end + (1 - w) * (start - end) lands exactly on the end state at w = 1
+        remaining = 1.0 - w
+        np.multiply(remaining[self.point_weight_index, None], self.point_delta, out=self.points)
+        self.points += self.end_points
+        np.multiply(remaining[self.rgba_weight_index, None], self.rgba_delta, out=self.rgba)
+        self.rgba += self.end_rgba
+
+    def finish(self):
+        super().finish()
+        # Give members their own arrays back so the buffers can be freed
+        for m in self.members:
+            m.points = m.points.copy()
+        for _, m, attr, _ in self._visible[3]:
+            setattr(m, attr, getattr(m, attr).copy())
+
+    def clean_up_from_scene(self, scene):
+        super().clean_up_from_scene(scene)
+        if not self.fade_in:
+            # Like FadeOut, leave the (removed) mobject in its visible state
+            visible, visible_rgba, counts, owners = self._visible
+            offset = 0
+            for m, n in zip(self.members, counts):
+                m.points = visible[offset:offset + n].copy()
+                offset += n
+            offset = 0
+            for _, m, attr, n in owners:
+                setattr(m, attr, visible_rgba[offset:offset + n].copy())
+                offset += n
+
+
+class BatchedFadeIn(BatchedFade):
+    """FadeIn(mobject, shift=..., scale=..., lag_ratio=...) in bulk."""
+
+    def __init__(self, mobject, **kwargs):
+        super().__init__(mobject, fade_in=True, **kwargs)
+
+
+class BatchedFadeOut(BatchedFade):
+    """FadeOut(mobject, shift=..., scale=..., lag_ratio=...) in bulk."""
+
+    def __init__(self, mobject, **kwargs):
+        super().__init__(mobject, fade_in=False, **kwargs)
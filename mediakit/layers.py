@@ -0,0 +1,92 @@
+"""
+layers.py
+Static-layer cache that persists across play() calls.
+
+Within one play(), manim already draws the mobjects that are not
+animated and have no updaters once, into a static image, and each frame
+copies that image and draws only the moving mobjects on top. But the
+static image is thrown away after every play() and rasterized again for
+the next one, even though in a narrated scene it is nearly always the
+same titles, dividers and timelines as before, plus whatever the
+previous animation just finished introducing.
+
+enable_layer_cache() keeps the last static image together with a digest
+of each mobject drawn into it (points, colors, stroke widths, z-order;
+see holds.mobject_digest) and of the camera frame. For the next play():
+
+  * same mobjects, same state: the cached image is reused as is;
+  * the old list is a prefix of the new one (mobjects were added on
+    top): only the new mobjects are drawn over a copy of the cache;
+  * anything else (removed, restyled, reordered, camera moved): full
+    rasterization, as manim does today.
+"""
+
+from manim.renderer.cairo_renderer import CairoRenderer
+
+from .holds import camera_digest, mobject_digest
+
+_original_save_static_frame_data = CairoRenderer.save_static_frame_data
+stats = {"hits": 0, "extended": 0, "misses": 0}
+
+
+class StaticLayer:
+    """One cached static image and the drawing state it was made from."""
+
+    def __init__(self, base, digests, frame):
+        self.base = base
+        self.digests = digests
+        self.frame = frame
+
+    def match(self, base, digests):
+        """How a new static mobject list relates to this layer: "hit", "extend" or None."""
+        n = len(self.digests)
+        if base != self.base or digests[:n] != self.digests:
+            return None
+        return "hit" if len(digests) == n else "extend"
+
+
+def _background_digest(camera):
+    return (
+        camera_digest(camera),
+        str(camera.background_color),
+        camera.background_opacity,
+        id(camera.background),
+    )
+
+
+def _save_static_frame_data(self, scene, static_mobjects):
+    self.static_image = None
+    if not static_mobjects:
+        return None
+
+    camera = self.camera
+    mobjects = camera.get_mobjects_to_display(static_mobjects)
+    base = _background_digest(camera)
+    digests = [mobject_digest(m) for m in mobjects]
+    layer = getattr(self, "_static_layer", None)
+    match = layer.match(base, digests) if layer is not None else None
+
+    if match == "hit":
+        stats["hits"] += 1
+        self.static_image = layer.frame
+        return self.static_image
+    if match == "extend":
+        stats["extended"] += 1
+        camera.set_frame_to_background(layer.frame)
+        camera.capture_mobjects(mobjects[len(layer.digests):], include_submobjects=False)
+        self.static_image = self.get_frame()
+    else:
+        stats["misses"] += 1
+        _original_save_static_frame_data(self, scene, static_mobjects)
+    self._static_layer = StaticLayer(base, digests, self.static_image)
+    return self.static_image
+
+
+def enable_layer_cache():
+    """Keep the static layer between play() calls (see module docstring)."""
+    CairoRenderer.save_static_frame_data = _save_static_frame_data
+
+
+def disable_layer_cache():
+    """Rasterize the static layer afresh for every play(), as manim does."""
+    CairoRenderer.save_static_frame_data = _original_save_static_frame_data
@@ -0,0 +1,286 @@
+"""
+outputs.py
+Encode a web proxy and a vertical cut from the frames of the master render.
+
+Scenes render at 2560x1440, while manim.cfg and the social platforms
+want a 1080x1920 vertical video, and reviewing a render wants a small
+file. Getting those today means rendering the scene again at another
+resolution: every frame is rasterized twice or three times.
+
+enable_extra_outputs() tees the master's frame stream into more encoders.
+Each frame the writer thread encodes for the master also goes through
+one filter graph:
+
+    buffer (rgba, master size) -> split -> scale=1280:720 ------> proxy
+                                        -> crop=ih*9/16:ih, scale -> vertical
+
+so the extra outputs cost a scale/crop and an encode per frame, never a
+rasterization. Every play() gets an extra partial movie per output next
+to its master partial (`<hash>.proxy.mp4`, `<hash>.vertical.mp4`), and
+when manim combines the scene file each output is joined by stream copy
+(holds.concat_partials, which keeps a closing hold's full length) into
+`<Scene>_proxy.mp4` and `<Scene>_vertical.mp4`, with the master's
+audio track when the scene has sound. An animation counts as cached only
+when its extra partials exist too.
+
+The extra outputs are always H.264 in yuv420p; the proxy trades quality
+for size with a higher CRF. The vertical cut either crops a 9:16 window
+out of the frame (`vertical="crop"`, placed by `vertical_center`) or
+fits the whole frame into it with black bars (`vertical="fit"`). Runs of
+identical frames are stored as their first and last frame, as holds.py
+does for the master. GIF output and project streaming (project.py) write
+the master only.
+"""
+
+from fractions import Fraction
+from pathlib import Path
+
+import av
+from manim import config, logger
+from manim.scene.scene_file_writer import SceneFileWriter, to_av_frame_rate
+from manim.utils.file_ops import is_gif_format
+
+from .holds import _add_stream_like, concat_partials, seal_packets
+from .pipeline import video_frame
+from .project import stream_settings
+
+_previous = {}
+_settings = {"outputs": {}}
+stats = {"frames": 0, "partials": 0, "movies": 0}
+
+
+def _even(n):
+    return max(2, int(n) // 2 * 2)
+
+
+class ExtraOutput:
+    """
+    One extra partial movie: an H.264 encoder fed by a buffersink.
+
+    Args:
+        path: Partial movie file to write
+        size: (width, height) of the output
+        crf: x264 constant rate factor
+    """
+
+    def __init__(self, path, size, crf):
+        self.path = Path(path)
+        self.container = av.open(str(self.path), mode="w")
+        options = {**stream_settings()[2], "crf": str(crf)}
+        self.stream = self.container.add_stream(
+            "libx264", rate=to_av_frame_rate(config.frame_rate), options=options,
+        )
+        self.stream.pix_fmt = "yuv420p"
+        self.stream.width, self.stream.height = size
+        self.sink = None
+        self.next_pts = 0
+        self.dts_shift = None
+
+    def encode(self, frame, num_frames):
+        """Encode `frame` for the next `num_frames` frame slots."""
+        for t in sorted({self.next_pts, self.next_pts + num_frames - 1}):
+            frame.pts = t
+            for packet in self.stream.encode(frame):
+                if self.dts_shift is None and packet.dts is not None:
+                    self.dts_shift = packet.dts - packet.pts
+                self.container.mux(packet)
+        self.next_pts += num_frames
+
+    def close(self):
+        packets = list(self.stream.encode())
+        seal_packets(packets, self.next_pts, self.dts_shift)
+        for packet in packets:
+            self.container.mux(packet)
+        self.container.close()
+
+
+def _branch_filters(name):
+    """(filter, args) chain turning a master frame into output `name`."""
+    width, height = _settings["outputs"][name]["size"]
+    if name == "proxy":
+        return [("scale", f"{width}:{height}")]
+    if _settings["vertical"] == "fit":
+        return [
+            ("scale", f"{width}:{height}:force_original_aspect_ratio=decrease"),
+            ("pad", f"{width}:{height}:(ow-iw)/2:(oh-ih)/2:black"),
+        ]
+    crop_w = f"trunc(ih*{width}/{height}/2)*2"
+    x = f"(iw-ow)*{_settings['vertical_center']}"
+    return [("crop", f"{crop_w}:ih:{x}:0"), ("scale", f"{width}:{height}")]
+
+
+def build_graph(outputs):
+    """
+    One filter graph from the master frame to every output in `outputs`.
+
+    Returns:
+        (graph, source) -- frames are pushed into `source`; each output's
+        converted frames are pulled from its `sink`
+    """
+    graph = av.filter.Graph()
+    source = graph.add_buffer(
+        width=config.pixel_width, height=config.pixel_height, format="rgba",
+        time_base=1 / Fraction(to_av_frame_rate(config.frame_rate)),
+    )
+    split = graph.add("split", str(len(outputs)))
+    source.link_to(split)
+    for index, (name, output) in enumerate(outputs.items()):
+        previous, previous_pad = split, index
+        for filter_name, args in _branch_filters(name) + [("format", "yuv420p")]:
+            node = graph.add(filter_name, args)
+            previous.link_to(node, previous_pad, 0)
+            previous, previous_pad = node, 0
+        output.sink = graph.add("buffersink")
+        previous.link_to(output.sink, previous_pad, 0)
+    graph.configure()
+    return graph, source
+
+
+def _extra_path(master_path, name):
+    master_path = Path(master_path)
+    return master_path.with_name(f"{master_path.stem}.{name}.mp4")
+
+
+# ---------------------------------------------------------------------------
+# File writer: tee each partial movie into the extra outputs
+# ---------------------------------------------------------------------------
+
+def _open_partial_movie_stream(self, file_path=None):
+    self._extras = None
+    if not is_gif_format():
+        if file_path is None:
+            file_path = self.partial_movie_files[self.renderer.num_plays]
+        outputs = {
+            name: ExtraOutput(_extra_path(file_path, name), spec["size"], spec["crf"])
+            for name, spec in _settings["outputs"].items()
+        }
+        if outputs:
+            self._extra_graph, self._extra_source = build_graph(outputs)
+            self._extras = outputs
+            stats["partials"] += 1
+    return _previous["open"](self, file_path)
+
+
+def _encode_and_write_frame(self, frame, num_frames):
+    _previous["encode"](self, frame, num_frames)
+    extras = getattr(self, "_extras", None)
+    if not extras or num_frames <= 0:
+        return
+    # Pull every branch before returning: the frame buffer may be reused
+    # (pipeline.py) as soon as the master is done with it
+    av_frame = video_frame(frame)
+    av_frame.pts = next(iter(extras.values())).next_pts
+    self._extra_source.push(av_frame)
+    for output in extras.values():
+        output.encode(output.sink.pull(), num_frames)
+    stats["frames"] += 1
+
+
+def _close_partial_movie_stream(self):
+    _previous["close"](self)
+    extras = getattr(self, "_extras", None)
+    self._extras = None
+    self._extra_graph = self._extra_source = None
+    for output in (extras or {}).values():
+        output.close()
+
+
+def _is_already_cached(self, hash_invocation):
+    if not _previous["cached"](self, hash_invocation):
+        return False
+    if is_gif_format():
+        return True
+    master = self.partial_movie_directory / f"{hash_invocation}{config['movie_file_extension']}"
+    return all(_extra_path(master, name).exists() for name in _settings["outputs"])
+
+
+def _mux_audio(video_path, audio_source, output):
+    """`video_path`'s video with `audio_source`'s audio track, into `output`."""
+    with av.open(str(video_path)) as video_input, av.open(str(audio_source)) as audio_input:
+        video_stream = video_input.streams.video[0]
+        audio_stream = audio_input.streams.audio[0]
+        with av.open(str(output), mode="w") as container:
+            # Every stream must exist before the first packet is muxed
+            copies = [
+                (source, stream, _add_stream_like(container, stream))
+                for source, stream in ((video_input, video_stream), (audio_input, audio_stream))
+            ]
+            for source, stream, target in copies:
+                for packet in source.demux(stream):
+                    if packet.dts is None:
+                        continue
+                    packet.stream = target
+                    container.mux(packet)
+
+
+def _combine_to_movie(self):
+    _previous["combine"](self)
+    partial_movie_files = [f for f in self.partial_movie_files if f is not None]
+    if is_gif_format() or not partial_movie_files:
+        return
+    movie_file_path = Path(self.movie_file_path)
+    for name in _settings["outputs"]:
+        output = movie_file_path.with_name(f"{movie_file_path.stem}_{name}.mp4")
+        partials = [_extra_path(f, name) for f in partial_movie_files]
+        if self.includes_sound:
+            silent = output.with_name(f"{output.stem}_temp.mp4")
+            concat_partials(partials, silent)
+            _mux_audio(silent, movie_file_path, output)
+            silent.unlink()
+        else:
+            concat_partials(partials, output)
+        stats["movies"] += 1
+        logger.info("%(name)s output written in %(path)s", {"name": name, "path": f"'{output}'"})
+
+
+def enable_extra_outputs(proxy=(1280, 720), proxy_crf=30, vertical=None,
+                         vertical_size=(1080, 1920), vertical_crf=23, vertical_center=0.5):
+    """
+    Encode extra outputs from the master's frames (see module docstring).
+    Enable after the other file writer patches (holds.py, pipeline.py,
+    chunks.py): this one wraps whichever encoder is installed.
+
+    Args:
+        proxy: (width, height) of the web proxy, or None for no proxy
+        proxy_crf: x264 CRF of the proxy (higher is smaller)
+        vertical: "crop" for a 9:16 window of the frame, "fit" for the
+                  whole frame with black bars, or None for no vertical cut
+        vertical_size: (width, height) of the vertical cut
+        vertical_crf: x264 CRF of the vertical cut
+        vertical_center: Horizontal position of the crop window, 0 (left
+                         edge) to 1 (right edge)
+    """
+    if vertical not in (None, "crop", "fit"):
+        raise ValueError(f"vertical must be 'crop', 'fit' or None, not {vertical!r}")
+    outputs = {}
+    if proxy:
+        outputs["proxy"] = {"size": (_even(proxy[0]), _even(proxy[1])), "crf": proxy_crf}
+    if vertical:
+        outputs["vertical"] = {
+            "size": (_even(vertical_size[0]), _even(vertical_size[1])), "crf": vertical_crf,
+        }
+    _settings.update(outputs=outputs, vertical=vertical, vertical_center=vertical_center)
+    if not _previous:
+        _previous.update(
+            open=SceneFileWriter.open_partial_movie_stream,
+            encode=SceneFileWriter.encode_and_write_frame,
+            close=SceneFileWriter.close_partial_movie_stream,
+            cached=SceneFileWriter.is_already_cached,
+            combine=SceneFileWriter.combine_to_movie,
+        )
+    SceneFileWriter.open_partial_movie_stream = _open_partial_movie_stream
+    SceneFileWriter.encode_and_write_frame = _encode_and_write_frame
+    SceneFileWriter.close_partial_movie_stream = _close_partial_movie_stream
+    SceneFileWriter.is_already_cached = _is_already_cached
+    SceneFileWriter.combine_to_movie = _combine_to_movie
+
+
+def disable_extra_outputs():
+    """Write the master only, as manim does."""
+    if _previous:
+        SceneFileWriter.open_partial_movie_stream = _previous["open"]
+        SceneFileWriter.encode_and_write_frame = _previous["encode"]
+        SceneFileWriter.close_partial_movie_stream = _previous["close"]
+        SceneFileWriter.is_already_cached = _previous["cached"]
+        SceneFileWriter.combine_to_movie = _previous["combine"]
+        _previous.clear()
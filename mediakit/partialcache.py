@@ -0,0 +1,297 @@
+"""
+partialcache.py
+Repo-wide cache of partial movie files, indexed in SQLite, with LRU eviction.
+
+Manim skips an animation whose partial movie file is already in
+media/videos/<file>/<quality>/partial_movie_files/, but the render
+scripts delete that tree before every build, so every animation is
+rasterized again even when nothing about it changed; and when the tree is
+kept, nothing bounds its size.
+
+enable_partial_cache() keeps a second home for partial movies at
+<repo>/.cache/partials, shared by every scene file and every project:
+
+  * entries are keyed on manim's hash of the play() call -- the camera,
+    the animations and the state of every mobject on screen before it,
+    so only what is drawn counts -- together with the render settings
+    that change the file (size, frame rate, container, codec, background,
+    transparency, manim version);
+  * when manim asks whether an animation is cached, a hit in the index
+    is linked (or copied, across file systems) back into the partial
+    movie directory, and manim skips rasterizing it;
+  * once the scene file is combined, every partial it used is stored
+    (hard-linked, so storing costs no copy), together with its extra
+    outputs (outputs.py);
+  * the index (index.sqlite) records each entry's size and last use;
+    after storing, least recently used entries are evicted until the
+    cache fits in `max_bytes`.
+
+A re-render after a small edit then only rasterizes the play() calls
+whose hash changed: the edited animation and those after it whose
+on-screen state differs. Several renders may share the cache at once.
+Output sizes of outputs.py are not part of the key; clear the cache
+(`python -m mediakit.partialcache --clear`) after changing them.
+
+    python -m mediakit.partialcache              # size and entry count
+    python -m mediakit.partialcache --max-gb 5   # evict down to 5 GB
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import sqlite3
+import time
+from contextlib import closing
+from pathlib import Path
+
+from manim import __version__ as manim_version
+from manim import config, logger
+from manim.scene.scene_file_writer import SceneFileWriter
+from manim.utils.file_ops import is_gif_format, write_to_movie
+
+from .project import stream_settings
+
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parents[1] / ".cache" / "partials"
+DEFAULT_MAX_BYTES = 20 * 2**30
+
+_previous = {}
+_cache = None
+_settings = {"max_bytes": DEFAULT_MAX_BYTES}
+stats = {"hits": 0, "misses": 0, "stored": 0, "evicted": 0}
+
+
+def cache_key(hash_invocation):
+    """Cache key of manim's hash of a play() call under the current render settings."""
+    seed = (
+        hash_invocation,
+        config.pixel_width,
+        config.pixel_height,
+        float(config.frame_rate),
+        config.movie_file_extension,
+        str(config.background_color),
+        config.background_opacity,
+        config.transparent,
+        stream_settings(),
+        manim_version,
+    )
+    return hashlib.sha256(repr(seed).encode()).hexdigest()[:32]
+
+
+def _link_or_copy(source, target):
+    """Hard-link `source` at `target` (copying across file systems), atomically."""
+    tmp = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+    try:
+        os.link(source, tmp)
+    except OSError:
+        shutil.copy2(source, tmp)
+    os.replace(tmp, target)
+
+
+class PartialCache:
+    """
+    Partial movie files in one directory, indexed by an SQLite database.
+
+    Args:
+        root: Cache directory
+    """
+
+    def __init__(self, root):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        with self._connect() as db, db:
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                " key TEXT PRIMARY KEY, files TEXT NOT NULL, bytes INTEGER NOT NULL,"
+                " created REAL NOT NULL, last_used REAL NOT NULL)"
+            )
+            db.execute("CREATE INDEX IF NOT EXISTS entries_last_used ON entries (last_used)")
+
+    def _connect(self):
+        # WAL lets one render read the index while another stores into it
+        db = sqlite3.connect(self.root / "index.sqlite", timeout=60)
+        db.execute("PRAGMA journal_mode=WAL")
+        return closing(db)
+
+    def _path(self, key, suffix):
+        return self.root / f"{key}{suffix}"
+
+    # ------------------------------------------------------------------
+    # Entries
+    # ------------------------------------------------------------------
+    def restore(self, key, target_stem):
+        """
+        Link entry `key`'s files to `target_stem` + each file's suffix.
+
+        Returns:
+            Whether the entry was found and restored
+        """
+        with self._connect() as db, db:
+            row = db.execute("SELECT files FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return False
+            try:
+                for suffix in json.loads(row[0]):
+                    target = target_stem.with_name(f"{target_stem.name}{suffix}")
+                    if not target.exists():
+                        _link_or_copy(self._path(key, suffix), target)
+            except FileNotFoundError:
+                # Evicted by another render since the lookup
+                db.execute("DELETE FROM entries WHERE key = ?", (key,))
+                return False
+            db.execute("UPDATE entries SET last_used = ? WHERE key = ?", (time.time(), key))
+        return True
+
+    def store(self, key, files):
+        """
+        Add `files` (paths sharing one stem) as entry `key`. An entry that
+        already holds all of them is only marked as used.
+        """
+        now = time.time()
+        stem = files[0].name.split(".", 1)[0]
+        suffixes = [f.name[len(stem):] for f in files]
+        with self._connect() as db, db:
+            row = db.execute("SELECT files FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is not None and set(suffixes) <= set(json.loads(row[0])):
+                db.execute("UPDATE entries SET last_used = ? WHERE key = ?", (now, key))
+                return
+            for source, suffix in zip(files, suffixes):
+                _link_or_copy(source, self._path(key, suffix))
+            db.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?)",
+                (key, json.dumps(suffixes), sum(f.stat().st_size for f in files), now, now),
+            )
+        stats["stored"] += 1
+
+    def evict(self, max_bytes):
+        """Delete least recently used entries until the cache holds at most `max_bytes`."""
+        with self._connect() as db, db:
+            total = db.execute("SELECT COALESCE(SUM(bytes), 0) FROM entries").fetchone()[0]
+            rows = db.execute("SELECT key, files, bytes FROM entries ORDER BY last_used").fetchall()
+            for key, files, size in rows:
+                if total <= max_bytes:
+                    break
+                for suffix in json.loads(files):
+                    self._path(key, suffix).unlink(missing_ok=True)
+                db.execute("DELETE FROM entries WHERE key = ?", (key,))
+                total -= size
+                stats["evicted"] += 1
+        return total
+
+    def usage(self):
+        """(entries, bytes) currently in the cache."""
+        with self._connect() as db:
+            return db.execute("SELECT COUNT(*), COALESCE(SUM(bytes), 0) FROM entries").fetchone()
+
+
+# ---------------------------------------------------------------------------
+# File writer: look up and fill the shared cache
+# ---------------------------------------------------------------------------
+
+def _cacheable(writer):
+    return (
+        _cache is not None
+        and hasattr(writer, "partial_movie_directory")
+        and write_to_movie()
+        and not is_gif_format()
+    )
+
+
+def _is_already_cached(self, hash_invocation):
+    if _cacheable(self):
+        master = self.partial_movie_directory / f"{hash_invocation}{config.movie_file_extension}"
+        if not master.exists():
+            if _cache.restore(cache_key(hash_invocation), self.partial_movie_directory / hash_invocation):
+                stats["hits"] += 1
+            else:
+                stats["misses"] += 1
+    return _previous["cached"](self, hash_invocation)
+
+
+def _partial_files(master):
+    """A partial movie and the extra outputs written next to it (not chunks)."""
+    stem = master.name.split(".", 1)[0]
+    extras = sorted(
+        p for p in master.parent.glob(f"{stem}.*")
+        if p != master and p.suffix == ".mp4" and ".chunk" not in p.name
+    )
+    return [master] + extras
+
+
+def _add_partial_movie_file(self, hash_animation):
+    _previous["add"](self, hash_animation)
+    if hash_animation is None or self.renderer.skip_animations or not _cacheable(self):
+        return
+    # About to be rendered: drop any links into the cache, so that the
+    # writers create new files instead of truncating the cached ones
+    for path in _partial_files(Path(self.partial_movie_files[-1])):
+        path.unlink(missing_ok=True)
+
+
+def _combine_to_movie(self):
+    _previous["combine"](self)
+    if not _cacheable(self):
+        return
+    for file_path in self.partial_movie_files:
+        if file_path is None:
+            continue
+        master = Path(file_path)
+        if master.name.startswith("uncached_") or not master.exists():
+            continue
+        _cache.store(cache_key(master.name.split(".", 1)[0]), _partial_files(master))
+    _cache.evict(_settings["max_bytes"])
+    logger.info(
+        "Partial cache: %(hits)s reused, %(misses)s rendered, %(evicted)s evicted",
+        {k: stats[k] for k in ("hits", "misses", "evicted")},
+    )
+
+
+def enable_partial_cache(cache_dir=None, max_bytes=DEFAULT_MAX_BYTES):
+    """
+    Reuse partial movie files across runs and scene files (see module
+    docstring).
+
+    Args:
+        cache_dir: Cache directory (defaults to <repo>/.cache/partials)
+        max_bytes: Cache size above which least recently used entries
+                   are evicted
+    """
+    global _cache
+    _cache = PartialCache(cache_dir if cache_dir is not None else DEFAULT_CACHE_DIR)
+    _settings["max_bytes"] = max_bytes
+    if not _previous:
+        _previous.update(
+            cached=SceneFileWriter.is_already_cached,
+            add=SceneFileWriter.add_partial_movie_file,
+            combine=SceneFileWriter.combine_to_movie,
+        )
+    SceneFileWriter.is_already_cached = _is_already_cached
+    SceneFileWriter.add_partial_movie_file = _add_partial_movie_file
+    SceneFileWriter.combine_to_movie = _combine_to_movie
+
+
+def disable_partial_cache():
+    """Use only manim's own partial movie directory, as before."""
+    global _cache
+    _cache = None
+    if _previous:
+        SceneFileWriter.is_already_cached = _previous["cached"]
+        SceneFileWriter.add_partial_movie_file = _previous["add"]
+        SceneFileWriter.combine_to_movie = _previous["combine"]
+        _previous.clear()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Inspect or trim the shared partial movie cache.")
+    parser.add_argument("--dir", default=DEFAULT_CACHE_DIR, help="Cache directory")
+    parser.add_argument("--max-gb", type=float, help="Evict least recently used entries down to this size")
+    parser.add_argument("--clear", action="store_true", help="Remove every entry")
+    args = parser.parse_args()
+    cache = PartialCache(args.dir)
+    if args.clear:
+        cache.evict(0)
+    elif args.max_gb is not None:
+        cache.evict(int(args.max_gb * 2**30))
+    entries, size = cache.usage()
+    print(f"{entries} entries, {size / 2**30:.2f} GB in {cache.root}")
@@ -0,0 +1,269 @@
+"""
+pipeline.py
+Bounded, zero-copy frame handoff between the render loop and the encoder.
+
+Manim's file writer already encodes on its own thread: the render loop
+rasterizes a frame, copies it out with get_frame(), and puts it on a
+queue that the writer thread drains into PyAV. Along the way:
+
+  * the queue is unbounded: when x264 is slower than rasterization,
+    frames pile up at 14.7 MB each (1440p RGBA) until the play() ends;
+  * every frame is copied twice after it is drawn -- into a fresh
+    14.7 MB array by get_frame(), then into an AVFrame by
+    VideoFrame.from_ndarray() -- before the RGBA -> YUV conversion.
+
+enable_render_pipeline() gives the renderer a small ring of preallocated
+frame arrays. Each movie frame is drawn by Cairo straight into a free
+ring buffer (it is the camera's pixel array for that frame), get_frame()
+hands that same array to the writer, and the writer wraps it with
+VideoFrame.from_numpy_buffer(), so the encoder's colour conversion reads
+the memory Cairo drew into (PyAV >= 14; older PyAV cannot wrap RGBA
+buffers, and the frame is copied in as manim does). The writer thread
+returns the buffer to the ring once it is encoded. When every buffer is
+in flight the render loop waits for the encoder, so at most `depth`
+frames are queued, and throughput settles at the slower of the two
+stages instead of memory growing.
+
+The only full-frame copy left is the static background manim lays down
+before drawing the moving mobjects. Frames kept beyond their encode
+(static images, layer caches, frozen waits) are taken outside render()
+and keep their own arrays. With zero_copy=False frames are copied into
+the ring instead (one copy, no allocation). Either way each frame lands
+in a different buffer, so dirty.py has no previous frame to patch and
+redraws in full.
+
+`python -m mediakit.pipeline` benchmarks the bytes copied per frame.
+"""
+
+import queue
+import time
+import tracemalloc
+
+import av
+import numpy as np
+from manim.renderer.cairo_renderer import CairoRenderer
+from manim.scene.scene_file_writer import SceneFileWriter
+from manim.utils.file_ops import write_to_movie
+
+_original = {
+    "render": CairoRenderer.render,
+    "get_frame": CairoRenderer.get_frame,
+    "listen": SceneFileWriter.listen_and_write,
+    "encode": SceneFileWriter.encode_and_write_frame,
+}
+_settings = {"depth": 4, "zero_copy": True}
+_POOLS = {}
+stats = {"pooled": 0, "allocated": 0, "waits": 0, "bytes_copied": 0}
+
+
+class FramePool:
+    """A fixed set of same-shaped frame arrays, handed out and returned."""
+
+    def __init__(self, shape, dtype, size):
+        self.buffers = [np.empty(shape, dtype=dtype) for _ in range(size)]
+        self.ids = {id(b) for b in self.buffers}
+        self.free = queue.Queue()
+        for b in self.buffers:
+            self.free.put(b)
+
+    def owns(self, frame):
+        return id(frame) in self.ids
+
+    def acquire(self, alive=lambda: True):
+        """A free buffer, waiting for one while `alive()` holds (else None)."""
+        try:
+            return self.free.get_nowait()
+        except queue.Empty:
+            stats["waits"] += 1
+        while alive():
+            try:
+                return self.free.get(timeout=0.5)
+            except queue.Empty:
+                pass
+        return None
+
+    def release(self, frame):
+        self.free.put(frame)
+
+
+def frame_pool(shape, dtype):
+    """The shared pool for frames of this shape and dtype."""
+    key = (tuple(shape), np.dtype(dtype).str)
+    if key not in _POOLS:
+        _POOLS[key] = FramePool(shape, dtype, _settings["depth"])
+    return _POOLS[key]
+
+
+def release_frame(frame):
+    """Return `frame` to its pool, if it came from one."""
+    if isinstance(frame, np.ndarray):
+        pool = _POOLS.get((frame.shape, frame.dtype.str))
+        if pool is not None and pool.owns(frame):
+            pool.release(frame)
+
+
+def video_frame(frame):
+    """av.VideoFrame over `frame`'s own memory (copied if not contiguous, or on PyAV < 14)."""
+    if frame.flags.c_contiguous:
+        try:
+            return av.VideoFrame.from_numpy_buffer(frame, format="rgba")
+        except ValueError:
+            pass  # PyAV < 14 (pinned by manim 0.19.0 and 0.19.1) cannot wrap rgba
+    stats["bytes_copied"] += frame.nbytes
+    return av.VideoFrame.from_ndarray(frame, format="rgba")
+
+
+# ---------------------------------------------------------------------------
+# Renderer: frames bound for the encoder live in the ring
+# ---------------------------------------------------------------------------
+
+def _draw_into_ring(renderer):
+    """Make a free ring buffer the camera's pixel array, unless one already is."""
+    camera = renderer.camera
+    pixels = camera.pixel_array
+    pool = frame_pool(pixels.shape, pixels.dtype)
+    if pool.owns(pixels):
+        return
+    buffer = pool.acquire(renderer.file_writer.writer_thread.is_alive)
+    if buffer is not None:
+        renderer._scratch_pixels = pixels
+        camera.pixel_array = buffer
+
+
+def _render(self, scene, time, moving_mobjects):
+    writer = getattr(self.file_writer, "writer_thread", None)
+    self._pooled_frames = not self.skip_animations and write_to_movie() and writer is not None
+    self._handed_off = False
+    if self._pooled_frames and _settings["zero_copy"]:
+        _draw_into_ring(self)
+    try:
+        return _original["render"](self, scene, time, moving_mobjects)
+    finally:
+        self._pooled_frames = False
+        if self._handed_off:
+            # The writer owns that buffer now; anything else is drawn elsewhere
+            self.camera.pixel_array = self._scratch_pixels
+
+
+def _get_frame(self):
+    pixels = self.camera.pixel_array
+    if getattr(self, "_pooled_frames", False):
+        pool = frame_pool(pixels.shape, pixels.dtype)
+        if pool.owns(pixels) and not self._handed_off:
+            self._handed_off = True
+            stats["pooled"] += 1
+            return pixels
+        frame = pool.acquire(self.file_writer.writer_thread.is_alive)
+        if frame is not None:
+            np.copyto(frame, pixels)
+            stats["pooled"] += 1
+            stats["bytes_copied"] += frame.nbytes
+            return frame
+    stats["allocated"] += 1
+    stats["bytes_copied"] += pixels.nbytes
+    return _original["get_frame"](self)
+
+
+# ---------------------------------------------------------------------------
+# File writer: encode from the ring buffer, then hand it back
+# ---------------------------------------------------------------------------
+
+def _listen_and_write(self):
+    while True:
+        num_frames, frame = self.queue.get()
+        if frame is None:
+            break
+        try:
+            self.encode_and_write_frame(frame, num_frames)
+        finally:
+            release_frame(frame)
+
+
+def _encode_and_write_frame(self, frame, num_frames):
+    for _ in range(num_frames):
+        # A fresh AVFrame per copy, as manim does, but over the same memory
+        for packet in self.video_stream.encode(video_frame(frame)):
+            self.video_container.mux(packet)
+
+
+def enable_render_pipeline(depth=4, zero_copy=True):
+    """
+    Hand frames to the encoder through a bounded ring of buffers (see
+    module docstring). Enable after enable_static_holds(), whose render
+    loop this one wraps.
+
+    Args:
+        depth: Frames that may be rendered ahead of the encoder
+        zero_copy: Draw frames straight into the ring (else copy them in)
+    """
+    _settings["depth"] = depth
+    _settings["zero_copy"] = zero_copy
+    _POOLS.clear()
+    if CairoRenderer.render is not _render:
+        _original["render"] = CairoRenderer.render
+    CairoRenderer.render = _render
+    CairoRenderer.get_frame = _get_frame
+    SceneFileWriter.listen_and_write = _listen_and_write
+    if SceneFileWriter.encode_and_write_frame is _original["encode"]:
+        SceneFileWriter.encode_and_write_frame = _encode_and_write_frame
+
+
+def disable_render_pipeline():
+    """Allocate every frame and queue without bound, as manim does."""
+    if CairoRenderer.render is _render:
+        CairoRenderer.render = _original["render"]
+    CairoRenderer.get_frame = _original["get_frame"]
+    SceneFileWriter.listen_and_write = _original["listen"]
+    if SceneFileWriter.encode_and_write_frame is _encode_and_write_frame:
+        SceneFileWriter.encode_and_write_frame = _original["encode"]
+
+
+# ---------------------------------------------------------------------------
+# Benchmark
+# ---------------------------------------------------------------------------
+
+def benchmark_handoff(frames=60, shape=(1440, 2560, 4)):
+    """
+    Bytes copied, peak traced allocation and time per frame for manim's
+    handoff (get_frame() copy + from_ndarray) and the ring's
+    (from_numpy_buffer), each through the YUV conversion both share.
+    """
+    pixels = np.random.default_rng(0).integers(0, 256, shape, dtype=np.uint8)
+    ring = [pixels.copy() for _ in range(_settings["depth"])]
+
+    def manim_handoff(i):
+        frame = np.array(pixels)
+        return av.VideoFrame.from_ndarray(frame, format="rgba"), 2 * frame.nbytes
+
+    def ring_handoff(i):
+        # Cairo would have drawn into ring[i]; the background copy is common to both
+        copied = stats["bytes_copied"]
+        av_frame = video_frame(ring[i % len(ring)])
+        return av_frame, stats["bytes_copied"] - copied
+
+    results = {}
+    for name, handoff in (("manim", manim_handoff), ("ring", ring_handoff)):
+        copied = 0
+        tracemalloc.start()
+        start = time.perf_counter()
+        for i in range(frames):
+            av_frame, nbytes = handoff(i)
+            av_frame.reformat(format="yuv420p")
+            copied += nbytes
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        results[name] = {
+            "bytes_copied_per_frame": copied // frames,
+            "peak_traced_bytes": peak,
+            "ms_per_frame": 1000 * elapsed / frames,
+        }
+    return results
+
+
+if __name__ == "__main__":
+    for name, row in benchmark_handoff().items():
+        print(
+            f"{name:>6}: {row['bytes_copied_per_frame'] / 1e6:6.1f} MB copied/frame, "
+            f"peak {row['peak_traced_bytes'] / 1e6:6.1f} MB, {row['ms_per_frame']:6.2f} ms/frame"
+        )
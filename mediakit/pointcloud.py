@@ -0,0 +1,155 @@
+"""
+pointcloud.py
+Batched dot clouds driven by array offsets.
+
+A DotCloud is a single VMobject whose subpaths are N circles. Dot centers
+live in one (N, 3) array; moving every dot is one broadcast against a
+shared circle template followed by one set_points call, so per-frame
+cost does not grow with Python-level work per dot.
+
+Animate with `offset_updater`: a vectorized offset function of
+(t, keys) -- keys being any per-dot parameter array such as atomic number
+Z -- is evaluated once per frame and added to the base positions.
+
+A Scatter is the same idea for clouds whose dots differ in radius, color
+or opacity: it stores those as per-point columns on top of Instances (see
+instancing.py), so dots sharing a style are drawn as one path. Fade it in
+with FadeInInstances and morph it into another cloud of the same size
+with TransformInstances.
+"""
+
+import numpy as np
+from manim import VMobject, WHITE
+
+from .instancing import Instances
+
+
+def unit_circle_beziers(num_arcs=8):
+    """(4 * num_arcs, 3) cubic Bezier control points of a unit circle."""
+    theta = 2 * np.pi / num_arcs
+    h = 4.0 / 3.0 * np.tan(theta / 4)
+    a0 = np.arange(num_arcs) * theta
+    a1 = a0 + theta
+    p0 = np.stack([np.cos(a0), np.sin(a0)], axis=1)
+    p3 = np.stack([np.cos(a1), np.sin(a1)], axis=1)
+    t0 = np.stack([-np.sin(a0), np.cos(a0)], axis=1)
+    t1 = np.stack([-np.sin(a1), np.cos(a1)], axis=1)
+    ctrl = np.stack([p0, p0 + h * t0, p3 - h * t1, p3], axis=1).reshape(-1, 2)
+    return np.hstack([ctrl, np.zeros((len(ctrl), 1))])
+
+
+class DotCloud(VMobject):
+    """
+    N filled dots sharing one style, stored as one (N, 3) center array.
+
+    Args:
+        positions: (N, 3) base centers
+        radius: Dot radius
+        keys: Optional (N,) per-dot parameter passed to offset functions
+              (defaults to arange(N))
+    """
+
+    def __init__(self, positions, radius=0.08, keys=None, color=WHITE,
+                 fill_opacity=1.0, stroke_width=0, **kwargs):
+        super().__init__(
+            fill_color=color, fill_opacity=fill_opacity,
+            stroke_color=color, stroke_width=stroke_width, **kwargs,
+        )
+        self.base_positions = np.array(positions, dtype=float)
+        self.keys = np.arange(len(self.base_positions)) if keys is None else np.asarray(keys)
+        self.radius = radius
+        self._template = radius * unit_circle_beziers()
+        self.set_centers(self.base_positions)
+
+    def set_centers(self, centers):
+        """Move every dot to the given (N, 3) centers in one array write."""
+        self.centers = np.asarray(centers, dtype=float)
+        pts = self.centers[:, None, :] + self._template[None]
+        self.set_points(pts.reshape(-1, 3))
+        return self
+
+    def get_centers(self):
+        """(N, 3) current dot centers."""
+        return self.centers
+
+    def shift(self, *vectors):
+        total = sum(vectors)
+        self.base_positions = self.base_positions + total
+        self.centers = self.centers + total
+        return super().shift(*vectors)
+
+    def offset_updater(self, offset_func, time_func):
+        """
+        Updater placing dots at base_positions + offset_func(t, keys).
+
+        Args:
+            offset_func: Vectorized (t, keys) -> (N, 3) offsets
+            time_func: Zero-argument callable returning t (e.g.
+                       tracker.get_value)
+
+        Returns:
+            The updater, for add_updater / remove_updater
+        """
+        def updater(mob):
+            mob.set_centers(mob.base_positions + offset_func(time_func(), mob.keys))
+
+        return updater
+
+
+class Scatter(Instances):
+    """
+    N dots with per-point radius, color and opacity columns.
+
+    Args:
+        positions: (N, 3) base centers
+        radii: Scalar or (N,) dot radius
+        colors: One color or N colors
+        opacities: Scalar or (N,) opacity
+        keys: Optional (N,) per-dot parameter passed to offset functions
+              (defaults to arange(N))
+        num_arcs: Cubic arcs per dot outline; 4 is plenty for dots only a
+                  few pixels across
+    """
+
+    def __init__(self, positions, radii=0.05, colors=WHITE, opacities=1.0,
+                 keys=None, num_arcs=8, **kwargs):
+        super().__init__(
+            unit_circle_beziers(num_arcs), positions,
+            scales=radii, colors=colors, opacities=opacities, **kwargs,
+        )
+        self.base_positions = self.positions.copy()
+        self.keys = np.arange(len(self.positions)) if keys is None else np.asarray(keys)
+
+    @property
+    def radii(self):
+        return self.scales
+
+    def _translate(self, vector):
+        super()._translate(vector)
+        self.base_positions = self.base_positions + vector
+
+    def set_centers(self, centers):
+        """Move every dot to the given (N, 3) centers."""
+        return self.set_columns(positions=centers)
+
+    def get_centers(self):
+        """(N, 3) current dot centers."""
+        return self.sync().positions
+
+    def offset_updater(self, offset_func, time_func):
+        """
+        Updater placing dots at base_positions + offset_func(t, keys).
+
+        Args:
+            offset_func: Vectorized (t, keys) -> (N, 3) offsets
+            time_func: Zero-argument callable returning t (e.g.
+                       tracker.get_value)
+
+        Returns:
+            The updater, for add_updater / remove_updater
+        """
+        def updater(mob):
+            mob.sync()
+            mob.set_centers(mob.base_positions + offset_func(time_func(), mob.keys))
+
+        return updater
@@ -0,0 +1,254 @@
+"""
+project.py
+Render every scene of a project into one video through one encoder.
+
+A multi-scene project (euler_dimensions.py, melting_table.py, the time
+crystal scenes) is built today by rendering each scene to partial movie
+files, combining those into one mp4 per scene, then concatenating the
+scene files with `ffmpeg -f concat -c copy`: every frame is written to
+disk three times.
+
+render_project() renders the scenes in order in one process and streams
+every frame into a single long-lived encoder that writes the final
+video:
+
+  * each play() still gets manim's writer thread and queue, but no
+    partial movie file; frames go straight to the project's stream;
+  * scene files are not combined or written at all;
+  * each scene becomes a chapter (title = scene name), with exact frame
+    boundaries, stored in the container when PyAV supports chapters
+    and otherwise written next to the video as an FFMETADATA file
+    (`ffmpeg -i video.mp4 -i video.chapters.txt -map_chapters 1 -c copy`).
+
+Caching is turned off for the run: a cached animation would be skipped
+rather than drawn, leaving a hole in the stream. Scenes with sound and
+GIF output are not supported; render those scene by scene. A scene that
+adds sound stops the run at its first add_sound(), and a failed run
+deletes the partial video instead of finalizing it.
+
+    python -m mediakit.project euler_dimensions.py TitleScene Scene1_FourShadows ... \\
+        -o euler_dimensions_full.mp4
+"""
+
+import argparse
+import importlib.util
+import sys
+from pathlib import Path
+from queue import Queue
+from threading import Thread
+
+import av
+from manim import config, logger
+from manim.scene.scene_file_writer import SceneFileWriter, to_av_frame_rate
+
+from .holds import seal_packets
+
+
+def stream_settings():
+    """(codec, pix_fmt, options) manim uses for a movie with the current config."""
+    codec, pix_fmt = "libx264", "yuv420p"
+    options = {"an": "1", "crf": "23"}
+    if config.movie_file_extension == ".webm":
+        codec = "libvpx-vp9"
+        options["-auto-alt-ref"] = "1"
+        if config.transparent:
+            pix_fmt = "yuva420p"
+    elif config.transparent:
+        codec, pix_fmt = "qtrle", "argb"
+    return codec, pix_fmt, options
+
+
+class ProjectStream:
+    """
+    One output container and video stream shared by a sequence of scenes.
+
+    Args:
+        path: Output video file
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.fps = to_av_frame_rate(config.frame_rate)
+        codec, pix_fmt, options = stream_settings()
+        self.container = av.open(str(self.path), mode="w")
+        self.stream = self.container.add_stream(codec, rate=self.fps, options=options)
+        self.stream.pix_fmt = pix_fmt
+        self.stream.width = config.pixel_width
+        self.stream.height = config.pixel_height
+        self.next_pts = 0
+        self.dts_shift = None
+        self.scene_start = 0
+        self.chapters = []
+
+    # ------------------------------------------------------------------
+    # Scenes
+    # ------------------------------------------------------------------
+    def begin_scene(self):
+        self.scene_start = self.next_pts
+
+    def end_scene(self, title):
+        if self.next_pts > self.scene_start:
+            self.chapters.append((self.scene_start, self.next_pts, title))
+
+    # ------------------------------------------------------------------
+    # Animations (called in place of the file writer's partial movie stream)
+    # ------------------------------------------------------------------
+    def attach(self, writer):
+        """Point `writer` at the project stream and start its writer thread."""
+        writer.video_container = self.container
+        writer.video_stream = self.stream
+        # Picked up by holds.py, which times frames itself
+        writer._next_pts = self.next_pts
+        writer._dts_shift = self.dts_shift
+        writer.queue = Queue()
+        writer.writer_thread = Thread(target=writer.listen_and_write, args=())
+        writer.writer_thread.start()
+
+    def detach(self, writer):
+        """Wait for `writer`'s frames to be encoded; the stream stays open."""
+        writer.queue.put((-1, None))
+        writer.writer_thread.join()
+        self.next_pts = self.scene_start + round(writer.renderer.time * self.fps)
+        self.dts_shift = getattr(writer, "_dts_shift", None)
+
+    # ------------------------------------------------------------------
+    # Output
+    # ------------------------------------------------------------------
+    def discard(self):
+        """Abandon the video: close the container and delete the file."""
+        try:
+            self.container.close()
+        finally:
+            self.path.unlink(missing_ok=True)
+
+    def close(self):
+        packets = list(self.stream.encode())
+        seal_packets(packets, self.next_pts, self.dts_shift)
+        for packet in packets:
+            self.container.mux(packet)
+        time_base = 1 / self.fps
+        if hasattr(self.container, "set_chapters"):
+            self.container.set_chapters([
+                {"id": i + 1, "start": start, "end": end, "time_base": time_base,
+                 "metadata": {"title": title}}
+                for i, (start, end, title) in enumerate(self.chapters)
+            ])
+        else:
+            self.write_chapter_file(time_base)
+        self.container.close()
+
+    def write_chapter_file(self, time_base):
+        """Chapters as an FFMETADATA file next to the video."""
+        lines = [";FFMETADATA1"]
+        for start, end, title in self.chapters:
+            lines += [
+                "[CHAPTER]",
+                f"TIMEBASE={time_base.numerator}/{time_base.denominator}",
+                f"START={start}",
+                f"END={end}",
+                f"title={title}",
+            ]
+        self.path.with_suffix(".chapters.txt").write_text("\n".join(lines) + "\n")
+
+
+# ---------------------------------------------------------------------------
+# File writer patches, active only inside render_project()
+# ---------------------------------------------------------------------------
+
+_active = {"stream": None, "scene": None}
+
+
+def _open_partial_movie_stream(self, file_path=None):
+    _active["stream"].attach(self)
+
+
+def _close_partial_movie_stream(self):
+    _active["stream"].detach(self)
+    logger.info(
+        f"Animation {self.renderer.num_plays} : streamed into %(path)s",
+        {"path": f"'{_active['stream'].path}'"},
+    )
+
+
+def _refuse_sound(self, *args, **kwargs):
+    # Fail before the scene streams any further into the shared encoder
+    raise ValueError(f"{_active['scene']} has sound; render it scene by scene")
+
+
+def _finish(self):
+    # No scene file: everything is already in the project stream
+    pass
+
+
+def render_project(scene_classes, output):
+    """
+    Render `scene_classes` in order into the single video `output`.
+
+    Args:
+        scene_classes: Scene subclasses, in narrative order
+        output: Path of the final video
+
+    Returns:
+        Path of the written video
+    """
+    if config.format == "gif" or config.movie_file_extension == ".gif":
+        raise ValueError("Project streaming writes a video container, not GIF")
+    stream = ProjectStream(output)
+    previous = {
+        "open": SceneFileWriter.open_partial_movie_stream,
+        "close": SceneFileWriter.close_partial_movie_stream,
+        "finish": SceneFileWriter.finish,
+        "add_sound": SceneFileWriter.add_sound,
+        "add_audio_segment": SceneFileWriter.add_audio_segment,
+    }
+    saved = {key: config[key] for key in ("disable_caching", "write_to_movie", "save_last_frame")}
+    config.disable_caching = True
+    _active["stream"] = stream
+    SceneFileWriter.open_partial_movie_stream = _open_partial_movie_stream
+    SceneFileWriter.close_partial_movie_stream = _close_partial_movie_stream
+    SceneFileWriter.finish = _finish
+    SceneFileWriter.add_sound = _refuse_sound
+    SceneFileWriter.add_audio_segment = _refuse_sound
+    try:
+        for scene_class in scene_classes:
+            _active["scene"] = scene_class.__name__
+            stream.begin_scene()
+            scene = scene_class()
+            scene.render()
+            stream.end_scene(scene_class.__name__)
+            # A scene without animations switches manim to still-image output
+            config.write_to_movie = saved["write_to_movie"]
+            config.save_last_frame = saved["save_last_frame"]
+    except BaseException:
+        # Leave no finished-looking, truncated video behind
+        stream.discard()
+        raise
+    finally:
+        for name, method in previous.items():
+            setattr(SceneFileWriter, name, method)
+        _active.update(stream=None, scene=None)
+        for key, value in saved.items():
+            config[key] = value
+    stream.close()
+    logger.info("Project video written in %(path)s", {"path": f"'{stream.path}'"})
+    return stream.path
+
+
+def _load_scenes(script, names):
+    """Scene classes `names` from the scene file `script`."""
+    path = Path(script).resolve()
+    spec = importlib.util.spec_from_file_location(path.stem, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[path.stem] = module
+    spec.loader.exec_module(module)
+    return [getattr(module, name) for name in names]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Render a project's scenes into one video.")
+    parser.add_argument("script", help="Scene file")
+    parser.add_argument("scenes", nargs="+", help="Scene class names, in order")
+    parser.add_argument("-o", "--output", required=True, help="Final video path")
+    args = parser.parse_args()
+    render_project(_load_scenes(args.script, args.scenes), args.output)
@@ -0,0 +1,208 @@
+"""
+readout.py
+Live numeric labels built from a cached glyph atlas.
+
+always_redraw(lambda: Text(f"f = {x:.1f} Hz")) runs a full Pango layout
+and SVG parse every frame just to change a few digits. A Readout lays out
+its whole label once, keeps the static prefix and suffix glyphs, and
+draws the changing number from a GlyphAtlas: per-font outlines and
+advance widths of each character, measured once from small probe Texts.
+A value change is one concatenation of cached glyph arrays and one
+set_points call.
+"""
+
+import string
+
+import numpy as np
+from manim import RIGHT, Text, VGroup, VMobject, WHITE
+
+_ATLASES = {}
+
+
+def _center(points):
+    """Bounding-box center of a point array, as Mobject.get_center() sees it."""
+    return (points.min(axis=0) + points.max(axis=0)) / 2
+
+
+def _affine_map(src, dst):
+    """
+    (matrix, offset) of the affine map taking `src` to `dst`, so that
+    dst ~ src @ matrix + offset. Arrays of different lengths (the family
+    was re-aligned by become() or a Transform) are matched by their
+    bounding boxes instead.
+    """
+    if src.shape != dst.shape:
+        span = np.ptp(src, axis=0)
+        scale = np.ones(3)
+        scale[span > 0] = np.ptp(dst, axis=0)[span > 0] / span[span > 0]
+        return np.diag(scale), dst.min(axis=0) - src.min(axis=0) * scale
+    homogeneous = np.hstack([src, np.ones((len(src), 1))])
+    solution = np.linalg.lstsq(homogeneous, dst, rcond=None)[0]
+    return solution[:3], solution[3]
+
+
+class GlyphAtlas:
+    """
+    Outlines and advances of single characters in one Text style.
+
+    Glyphs are measured lazily from Text(f"0{char}0") probes: the two
+    zeros give the character's slot and advance, assuming digits sit
+    centered in their (tabular) advance width.
+
+    Args:
+        **text_kwargs: Text style (font_size, font, weight, slant)
+    """
+
+    def __init__(self, **text_kwargs):
+        self.text_kwargs = text_kwargs
+        ref = Text("00", **text_kwargs)
+        self.digit_advance = ref[1].get_x() - ref[0].get_x()
+        self._glyphs = {}
+
+    def glyph(self, char):
+        """(points relative to the slot's left/center-line point, advance)."""
+        if char not in self._glyphs:
+            probe = Text(f"0{char}0", **self.text_kwargs)
+            first, last = probe[0], probe[-1]
+            slot = first.get_center() + RIGHT * self.digit_advance / 2
+            advance = last.get_x() - first.get_x() - self.digit_advance
+            points = probe[1].points - slot if len(probe) == 3 else np.zeros((0, 3))
+            self._glyphs[char] = (points, advance)
+        return self._glyphs[char]
+
+    def layout(self, text, pen):
+        """
+        Points of `text` set from `pen` (left slot edge, on the center line).
+
+        Returns:
+            ((M, 3) points, total advance)
+        """
+        pieces, x = [], 0.0
+        for char in text:
+            points, advance = self.glyph(char)
+            if len(points):
+                pieces.append(points + pen + x * RIGHT)
+            x += advance
+        return (np.concatenate(pieces) if pieces else np.zeros((0, 3))), x
+
+
+def get_atlas(**text_kwargs):
+    """Shared GlyphAtlas for a Text style."""
+    key = tuple(sorted(text_kwargs.items()))
+    if key not in _ATLASES:
+        _ATLASES[key] = GlyphAtlas(**text_kwargs)
+    return _ATLASES[key]
+
+
+def _split_template(template):
+    """('f = ', '.1f', ' Hz') for 'f = {:.1f} Hz'."""
+    fields = list(string.Formatter().parse(template))
+    prefix, name, spec, _ = fields[0]
+    if name is None or len(fields) > 2 or (len(fields) == 2 and fields[1][1] is not None):
+        raise ValueError(f"Readout template needs exactly one field: {template!r}")
+    suffix = fields[1][0] if len(fields) == 2 else ""
+    return prefix, spec or "", suffix
+
+
+def _glyph_count(text):
+    return sum(not c.isspace() for c in text)
+
+
+class Readout(VGroup):
+    """
+    Text label with one live number, e.g. Readout("f = {:.1f} Hz").
+
+    Shifts, scales, rotations, Transforms and a parent's transforms all
+    carry the live number along: before relaying the digits, the label
+    compares its points with those it last laid out and moves its pen
+    and axes by the same affine map.
+
+    Args:
+        template: Label with a single format field
+        value: Initial value
+        align: "center" keeps the label's center fixed as the number's
+               width changes (like re-centering a redrawn Text); "left"
+               keeps the prefix fixed and lets the suffix move
+        color: Fill color
+        **text_kwargs: Text style (font_size, font, weight, slant)
+    """
+
+    def __init__(self, template, value=0.0, align="center", color=WHITE, **text_kwargs):
+        super().__init__()
+        prefix, spec, suffix = _split_template(template)
+        self.number_format = "{:" + spec + "}"
+        self.align = align
+        self.atlas = get_atlas(**text_kwargs)
+
+        self._string = self.number_format.format(value)
+        sample = Text(prefix + self._string + suffix, color=color, **text_kwargs)
+        n_pre, n_num = _glyph_count(prefix), _glyph_count(self._string)
+        self.prefix = VGroup(*sample[:n_pre])
+        self.suffix = VGroup(*sample[n_pre + n_num:])
+        self.number = VMobject(fill_color=color, fill_opacity=1.0, stroke_width=0)
+        self.add(self.prefix, self.number, self.suffix)
+
+        # Recover the number's pen position from its first laid-out glyph
+        lead = len(self._string) - len(self._string.lstrip())
+        skipped = sum(self.atlas.glyph(c)[1] for c in self._string[:lead])
+        first_points, _ = self.atlas.glyph(self._string[lead])
+        self._pen = sample[n_pre].get_center() - _center(first_points) - skipped * RIGHT
+        # Glyph x/y/z in atlas units -> scene displacement from the pen
+        self._axes = np.eye(3)
+        points, self._width = self.atlas.layout(self._string, self._pen)
+        self.number.set_points(points)
+        self._anchor = self.get_center()
+        self._laid = self.get_all_points()
+
+    def sync(self):
+        """Move the pen, axes and anchor with whatever moved the label since it was laid out."""
+        current = self.get_all_points()
+        if current.shape == self._laid.shape and np.array_equal(current, self._laid):
+            return self
+        matrix, offset = _affine_map(self._laid, current)
+        self._pen = self._pen @ matrix + offset
+        self._anchor = self._anchor @ matrix + offset
+        self._axes = self._axes @ matrix
+        self._laid = current
+        return self
+
+    def shift(self, *vectors):
+        self.sync()
+        total = sum(vectors)
+        self._pen = self._pen + total
+        self._anchor = self._anchor + total
+        super().shift(*vectors)
+        self._laid = self.get_all_points()
+        return self
+
+    def set_value(self, value):
+        """Show `value`; only the number's glyphs are rebuilt."""
+        text = self.number_format.format(value)
+        if text == self._string:
+            return self
+        self.sync()
+        points, width = self.atlas.layout(text, np.zeros(3))
+        if len(points):
+            self.number.set_points(self._pen + points @ self._axes)
+        else:
+            self.number.clear_points()
+        advance = self._axes[0]
+        if width != self._width:
+            self.suffix.shift((width - self._width) * advance)
+        self._string, self._width = text, width
+
+        if self.align == "center":
+            # Re-center along the text, in the label's own (untransformed) frame
+            to_local = np.linalg.pinv(self._axes)
+            local = (self.get_all_points() - self._pen) @ to_local
+            dx = ((self._anchor - self._pen) @ to_local)[0] - _center(local)[0]
+            if dx:
+                super().shift(dx * advance)
+                self._pen = self._pen + dx * advance
+        self._laid = self.get_all_points()
+        return self
+
+    def track(self, value_func):
+        """Follow a zero-argument callable (e.g. tracker.get_value) every frame."""
+        self.add_updater(lambda m: m.set_value(value_func()), call_updater=True)
+        return self
@@ -0,0 +1,189 @@
+"""
+signals.py
+Vectorized signal composition for time-series and trajectory scenes.
+
+A Signal wraps a function of a numpy array. Signals add, multiply (for
+amplitude envelopes) and scale with ordinary operators, and piecewise()
+stitches them over regions using masks, so a whole trace is evaluated in
+a handful of array operations instead of a Python call per sample.
+
+Complex-valued signals describe planar paths (x + iy), e.g. polar-motion
+wobbles; real-valued ones are plotted as y over x. Either kind feeds
+curve mobjects directly via signal_curve() / region_curves().
+"""
+
+import numpy as np
+from manim import ORIGIN, VMobject
+
+
+class Signal:
+    """
+    Vectorized signal y = f(x).
+
+    Args:
+        func: Function mapping a float array to a real or complex array of
+              the same shape
+    """
+
+    def __init__(self, func):
+        self.func = func
+
+    def __call__(self, x):
+        return self.func(np.asarray(x, dtype=float))
+
+    @staticmethod
+    def _wrap(other):
+        return other if isinstance(other, Signal) else constant(other)
+
+    def __add__(self, other):
+        other = Signal._wrap(other)
+        return Signal(lambda x: self(x) + other(x))
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        return self + (-1.0) * Signal._wrap(other)
+
+    def __mul__(self, other):
+        other = Signal._wrap(other)
+        return Signal(lambda x: self(x) * other(x))
+
+    __rmul__ = __mul__
+
+    def __neg__(self):
+        return (-1.0) * self
+
+
+# ---------------------------------------------------------------------------
+# Building blocks
+# ---------------------------------------------------------------------------
+
+def constant(value):
+    """Signal that is `value` everywhere."""
+    return Signal(lambda x: np.full(x.shape, value))
+
+
+def linear(slope, intercept=0.0, x0=0.0):
+    """intercept + slope * (x - x0)."""
+    return Signal(lambda x: intercept + slope * (x - x0))
+
+
+def ramp(x0, x1, y0, y1):
+    """Linear envelope from y0 at x0 to y1 at x1, held constant outside."""
+    return Signal(lambda x: np.interp(x, [x0, x1], [y0, y1]))
+
+
+def sinusoid(amp=1.0, freq=None, period=None, phase=0.0):
+    """amp * sin(2 pi freq x + phase); give either freq or period."""
+    freq = 1.0 / period if freq is None else freq
+    return Signal(lambda x: amp * np.sin(2 * np.pi * freq * x + phase))
+
+
+def circular(amp=1.0, freq=None, period=None, phase=0.0):
+    """Complex rotation amp * exp(i (2 pi freq x + phase)); a circle in x + iy."""
+    freq = 1.0 / period if freq is None else freq
+    return Signal(lambda x: amp * np.exp(1j * (2 * np.pi * freq * x + phase)))
+
+
+def chirp(amp, f0, f1, x0, x1, phase=0.0):
+    """Linear chirp whose frequency sweeps f0 -> f1 over [x0, x1]."""
+    rate = (f1 - f0) / (x1 - x0)
+
+    def func(x):
+        u = x - x0
+        return amp * np.sin(2 * np.pi * (f0 * u + 0.5 * rate * u ** 2) + phase)
+
+    return Signal(func)
+
+
+def superpose(*signals):
+    """Sum of signals (e.g. several periodic terms)."""
+    return Signal(lambda x: sum(s(x) for s in signals))
+
+
+def regions(x, breaks):
+    """Region index of each x: 0 below breaks[0], i for breaks[i-1] <= x < breaks[i]."""
+    return np.searchsorted(breaks, x, side="right")
+
+
+def piecewise(breaks, pieces):
+    """
+    Signal equal to pieces[i] on region i of `breaks` (see regions()).
+
+    Each piece is evaluated only on its own mask.
+    """
+    pieces = [Signal._wrap(p) for p in pieces]
+
+    def func(x):
+        region = regions(x, breaks)
+        out = None
+        for i, piece in enumerate(pieces):
+            mask = region == i
+            if not mask.any():
+                continue
+            y = piece(x[mask])
+            if out is None:
+                out = np.zeros(x.shape, dtype=np.result_type(y, float))
+            out[mask] = y
+        return np.zeros(x.shape) if out is None else out
+
+    return Signal(func)
+
+
+# ---------------------------------------------------------------------------
+# Curve preparation
+# ---------------------------------------------------------------------------
+
+def to_points(x, y, origin=ORIGIN, x_scale=1.0, y_scale=1.0):
+    """
+    (N, 3) scene points for samples of a signal.
+
+    Real y is plotted over x; complex y is treated as a planar path and x
+    is ignored.
+    """
+    pts = np.zeros((len(y), 3))
+    if np.iscomplexobj(y):
+        pts[:, 0] = x_scale * y.real
+        pts[:, 1] = y_scale * y.imag
+    else:
+        pts[:, 0] = x_scale * np.asarray(x)
+        pts[:, 1] = y_scale * y
+    return pts + origin
+
+
+def signal_curve(signal, x, origin=ORIGIN, smooth=True, x_scale=1.0, y_scale=1.0, **kwargs):
+    """VMobject through signal(x), smoothed unless smooth=False."""
+    curve = VMobject(**kwargs)
+    pts = to_points(x, signal(x), origin, x_scale, y_scale)
+    if smooth:
+        curve.set_points_smoothly(pts)
+    else:
+        curve.set_points_as_corners(pts)
+    return curve
+
+
+def region_curves(signal, x, breaks, styles, origin=ORIGIN, smooth=True, **kwargs):
+    """
+    One VMobject per region of `breaks`, from a single evaluation.
+
+    Args:
+        styles: One kwargs dict per region (e.g. {"color": BLUE}), merged
+                over the shared **kwargs
+
+    Returns:
+        List of VMobjects, one per region (empty regions give empty curves)
+    """
+    x = np.asarray(x, dtype=float)
+    pts = to_points(x, signal(x), origin)
+    region = regions(x, breaks)
+    curves = []
+    for i, style in enumerate(styles):
+        curve = VMobject(**{**kwargs, **style})
+        seg = pts[region == i]
+        if len(seg) >= 2:
+            if smooth:
+                curve.set_points_smoothly(seg)
+            else:
+                curve.set_points_as_corners(seg)
+        curves.append(curve)
+    return curves
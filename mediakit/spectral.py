@@ -0,0 +1,279 @@
+"""
+spectral.py
+FFT-backed decomposition and epicycle engine for Fourier scenes.
+
+A Spectrum holds the discrete Fourier coefficients of one period of either
+a real signal (time series) or a closed 2D path (sampled points, or any
+VMobject such as an SVGMobject / MathTex glyph). Coefficients are computed
+once with numpy.fft; partial reconstructions for the first n harmonics are
+cached by n.
+
+Epicycles draws the rotating-vector chain for a Spectrum as three flat
+VMobjects (arms, circles, trace). Each frame is one vectorized cumulative
+sum over all vectors, so thousands of vectors cost about the same as ten
+and no per-vector mobjects or updaters exist.
+"""
+
+import numpy as np
+from manim import VGroup, VMobject, BLUE, WHITE, YELLOW
+
+from .pointcloud import unit_circle_beziers
+
+
+# ---------------------------------------------------------------------------
+# Path sampling
+# ---------------------------------------------------------------------------
+
+def sample_path(vmobject, num_samples=1024):
+    """
+    Sample a VMobject's outline at `num_samples` points, evenly by arc length.
+
+    All cubic Bezier curves of the family are evaluated in one vectorized
+    pass (no point_from_proportion loop). Separate subpaths are joined in
+    family order.
+
+    Returns:
+        (num_samples, 3) array of scene points
+    """
+    pts = np.vstack([m.points for m in vmobject.family_members_with_points()])
+    curves = pts.reshape(-1, 4, 3)
+    # Control-polygon length is a cheap, monotone stand-in for arc length
+    lengths = np.linalg.norm(np.diff(curves, axis=1), axis=2).sum(axis=1)
+    cum = np.concatenate([[0.0], np.cumsum(lengths)])
+    s = np.linspace(0.0, cum[-1], num_samples, endpoint=False)
+    idx = np.clip(np.searchsorted(cum, s, side="right") - 1, 0, len(curves) - 1)
+    u = ((s - cum[idx]) / np.maximum(lengths[idx], 1e-12))[:, None]
+    c = curves[idx]
+    return (
+        (1 - u) ** 3 * c[:, 0]
+        + 3 * (1 - u) ** 2 * u * c[:, 1]
+        + 3 * (1 - u) * u ** 2 * c[:, 2]
+        + u ** 3 * c[:, 3]
+    )
+
+
+# ---------------------------------------------------------------------------
+# Spectrum
+# ---------------------------------------------------------------------------
+
+class Spectrum:
+    """
+    Fourier coefficients of one period of a real signal or a closed path.
+
+    Prefer the constructors `from_signal` and `from_path`.
+
+    Args:
+        samples: One period of evenly spaced samples (real or complex)
+        period: Length of the period in the signal's own time units
+    """
+
+    def __init__(self, samples, period=1.0):
+        samples = np.asarray(samples)
+        self.is_real = not np.iscomplexobj(samples)
+        self.period = period
+        self.num_samples = len(samples)
+        self.coeffs = np.fft.fft(samples) / self.num_samples
+        self.k = np.fft.fftfreq(self.num_samples, d=1.0 / self.num_samples).astype(int)
+        self._partials = {}
+        self._partial_samples = {}
+
+    @classmethod
+    def from_signal(cls, signal, period=1.0, num_samples=1024):
+        """
+        Spectrum of a real signal over [0, period).
+
+        Args:
+            signal: Vectorized function of t, or an array of samples
+        """
+        if callable(signal):
+            t = np.linspace(0.0, period, num_samples, endpoint=False)
+            signal = signal(t)
+        return cls(np.asarray(signal, dtype=float), period=period)
+
+    @classmethod
+    def from_path(cls, path, num_samples=1024):
+        """
+        Spectrum of a closed 2D path.
+
+        Args:
+            path: VMobject (e.g. SVGMobject, MathTex), (N, 2) / (N, 3)
+                  point array, or complex array
+        """
+        if isinstance(path, VMobject):
+            path = sample_path(path, num_samples)
+        path = np.asarray(path)
+        if not np.iscomplexobj(path):
+            path = path[:, 0] + 1j * path[:, 1]
+        return cls(path.astype(complex), period=1.0)
+
+    # ------------------------------------------------------------------
+    # Harmonic selection
+    # ------------------------------------------------------------------
+    def harmonic_index(self, freq):
+        """Harmonic number k for a frequency in the signal's units."""
+        return int(round(freq * self.period))
+
+    def frequencies(self):
+        """Frequency of every coefficient, in the signal's units."""
+        return self.k / self.period
+
+    def amplitudes(self):
+        """
+        One-sided amplitude spectrum of a real signal.
+
+        Returns:
+            (freqs, amps) for k = 0 .. N/2, with amps[k] the peak amplitude
+            of the k-th sinusoid (2|c_k| for k > 0)
+        """
+        half = self.num_samples // 2 + 1
+        amps = 2.0 * np.abs(self.coeffs[:half])
+        amps[0] /= 2.0
+        return self.k[:half] / self.period, amps
+
+    def peaks(self, count, min_amp=1e-6):
+        """
+        The `count` strongest sinusoids of a real signal, sorted by frequency.
+
+        Returns:
+            List of (freq, amp) pairs
+        """
+        freqs, amps = self.amplitudes()
+        order = np.argsort(amps[1:])[::-1][:count] + 1
+        order = order[amps[order] > min_amp]
+        return [(freqs[i], amps[i]) for i in sorted(order)]
+
+    def vector_order(self, num_vectors, by="frequency"):
+        """
+        Indices of the first `num_vectors` rotating vectors (DC excluded).
+
+        Args:
+            by: "frequency" for 1, -1, 2, -2, ... or "magnitude" for the
+                largest coefficients first
+        """
+        nonzero = np.flatnonzero(self.k != 0)
+        if by == "magnitude":
+            order = nonzero[np.argsort(-np.abs(self.coeffs[nonzero]), kind="stable")]
+        else:
+            order = nonzero[np.lexsort((self.k[nonzero] < 0, np.abs(self.k[nonzero])))]
+        return order[:num_vectors]
+
+    # ------------------------------------------------------------------
+    # Reconstruction
+    # ------------------------------------------------------------------
+    def _band(self, n):
+        """Coefficient indices with |k| <= n."""
+        return np.flatnonzero(np.abs(self.k) <= n)
+
+    def partial(self, n):
+        """
+        Vectorized reconstruction using harmonics |k| <= n (cached per n).
+
+        Returns a function of t (in the signal's units) suitable for
+        `axes.plot(..., use_vectorized=True)`. Real signals return real
+        values; paths return complex points.
+        """
+        if n not in self._partials:
+            idx = self._band(n)
+            coeffs = self.coeffs[idx]
+            omega = 2j * np.pi * self.k[idx] / self.period
+            is_real = self.is_real
+
+            def func(t):
+                t = np.asarray(t, dtype=float)
+                z = np.exp(np.multiply.outer(t, omega)) @ coeffs
+                return z.real if is_real else z
+
+            self._partials[n] = func
+        return self._partials[n]
+
+    def component(self, k):
+        """Vectorized single real sinusoid for harmonic k of a real signal."""
+        c = self.coeffs[self.k == k][0]
+        omega = 2 * np.pi * k / self.period
+        return lambda t: 2.0 * np.abs(c) * np.cos(omega * np.asarray(t) + np.angle(c))
+
+    def partial_samples(self, n):
+        """
+        Reconstruction with harmonics |k| <= n on the original sample grid.
+
+        Computed with one inverse FFT and cached per n.
+        """
+        if n not in self._partial_samples:
+            masked = np.where(np.abs(self.k) <= n, self.coeffs, 0.0)
+            z = np.fft.ifft(masked) * self.num_samples
+            self._partial_samples[n] = z.real if self.is_real else z
+        return self._partial_samples[n]
+
+
+# ---------------------------------------------------------------------------
+# Epicycles
+# ---------------------------------------------------------------------------
+
+def _to_points(z):
+    return np.stack([z.real, z.imag, np.zeros(len(z))], axis=1)
+
+
+class Epicycles(VGroup):
+    """
+    Rotating-vector chain that redraws a path from its Spectrum.
+
+    Submobjects are `circles`, `arms` and `trace`, each a single VMobject.
+    Call `set_time(t)` (t in cycles, usually from a ValueTracker updater) to
+    move every vector at once.
+
+    Args:
+        spectrum: Spectrum of a path (see Spectrum.from_path)
+        num_vectors: Number of rotating vectors (DC offset is the anchor)
+        order: "magnitude" or "frequency" (see Spectrum.vector_order)
+        trace_samples: Resolution of the precomputed trace
+    """
+
+    def __init__(
+        self,
+        spectrum,
+        num_vectors=100,
+        order="magnitude",
+        trace_samples=2000,
+        arm_color=WHITE,
+        circle_color=BLUE,
+        trace_color=YELLOW,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        idx = spectrum.vector_order(num_vectors, by=order)
+        self.coeffs = spectrum.coeffs[idx]
+        self.omega = 2j * np.pi * spectrum.k[idx]
+        self.anchor = spectrum.coeffs[spectrum.k == 0][0]
+        self.radii = np.abs(self.coeffs)
+        self._circle_template = unit_circle_beziers()
+
+        # Trace is precomputed once; revealing it is a slice, not a re-evaluation
+        self.trace_t = np.linspace(0.0, 1.0, trace_samples)
+        tip = self.anchor + np.exp(np.multiply.outer(self.trace_t, self.omega)) @ self.coeffs
+        self.trace_points = _to_points(tip)
+
+        self.circles = VMobject(stroke_color=circle_color, stroke_width=1, stroke_opacity=0.35)
+        self.arms = VMobject(stroke_color=arm_color, stroke_width=1.5)
+        self.trace = VMobject(stroke_color=trace_color, stroke_width=3)
+        self.add(self.circles, self.arms, self.trace)
+        self.set_time(0.0)
+
+    def joints(self, t):
+        """(num_vectors + 1,) complex positions of every joint at time t."""
+        return np.concatenate([[self.anchor], self.anchor + np.cumsum(self.coeffs * np.exp(self.omega * t))])
+
+    def set_time(self, t):
+        """Place every vector, circle and the trace for time t (in cycles)."""
+        joints = self.joints(t)
+        self.arms.set_points_as_corners(_to_points(joints))
+
+        centers = _to_points(joints[:-1])
+        circles = centers[:, None, :] + self.radii[:, None, None] * self._circle_template[None]
+        self.circles.set_points(circles.reshape(-1, 3))
+
+        k = np.searchsorted(self.trace_t, min(t, 1.0), side="right")
+        if k >= 2:
+            self.trace.set_points_as_corners(self.trace_points[:k])
+        else:
+            self.trace.clear_points()
+        return self
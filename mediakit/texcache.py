@@ -0,0 +1,208 @@
+"""
+texcache.py
+Parallel LaTeX pre-compilation into a shared, content-addressed cache.
+
+Manim compiles each MathTex / Tex the moment construct() reaches it: one
+latex run plus one dvisvgm run, strictly one after another. Most formulas
+in these scenes are string literals, so they can be known before
+rendering starts.
+
+collect_tex() walks a scene module's AST and lists the exact expressions
+manim will compile for every literal MathTex / Tex / SingleStringMathTex
+call (the joined string and, as MathTex does, each isolated substring).
+precompile_tex() compiles the ones missing from the cache concurrently,
+one latex + dvisvgm job per worker. Results are stored under manim's own
+name for them (a hash of the full .tex source, template included), so
+tex_to_svg_file() finds them and never invokes LaTeX during the render.
+
+use_shared_tex_cache() points config.tex_dir at <repo>/.cache/tex so that
+every project reuses the same compiled formulas.
+"""
+
+import ast
+import os
+import shutil
+import subprocess
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from manim import MathTex, SingleStringMathTex, Tex, config, logger
+from manim.utils.tex_file_writing import make_tex_compilation_command, tex_hash
+
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parents[1] / ".cache" / "tex"
+
+# Class name -> (class, default tex_environment, default arg_separator)
+TEX_CLASSES = {
+    "SingleStringMathTex": (SingleStringMathTex, "align*", None),
+    "MathTex": (MathTex, "align*", " "),
+    "Tex": (Tex, "center", ""),
+}
+
+
+def use_shared_tex_cache(cache_dir=None):
+    """
+    Store compiled TeX for every project in one directory.
+
+    Args:
+        cache_dir: Cache directory (defaults to <repo>/.cache/tex)
+    """
+    cache_dir = Path(cache_dir) if cache_dir is not None else DEFAULT_CACHE_DIR
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    config.tex_dir = str(cache_dir)
+    return cache_dir
+
+
+# ---------------------------------------------------------------------------
+# Static collection
+# ---------------------------------------------------------------------------
+
+def _literal(node):
+    """Value of a literal AST node, or raise ValueError."""
+    return ast.literal_eval(node)
+
+
+def _call_expressions(name, call):
+    """(expression, environment) pairs manim will compile for one call."""
+    cls, env, sep = TEX_CLASSES[name]
+    strings = [_literal(arg) for arg in call.args]
+    if not strings or not all(isinstance(s, str) for s in strings):
+        raise ValueError("non-literal TeX string")
+
+    isolate, color_keys = [], []
+    for kw in call.keywords:
+        if kw.arg == "tex_environment":
+            env = _literal(kw.value)
+        elif kw.arg == "arg_separator":
+            sep = _literal(kw.value)
+        elif kw.arg == "substrings_to_isolate":
+            isolate = list(_literal(kw.value))
+        elif kw.arg == "tex_to_color_map":
+            if not isinstance(kw.value, ast.Dict):
+                raise ValueError("non-literal color map")
+            color_keys = [_literal(k) for k in kw.value.keys]
+        elif kw.arg in (None, "tex_template"):
+            raise ValueError("template or **kwargs not known statically")
+
+    # Let manim's own string handling decide what gets compiled
+    mob = cls.__new__(cls)
+    if sep is None:
+        return [(mob._get_modified_expression(strings[0]), env)]
+    mob.substrings_to_isolate = isolate
+    mob.tex_to_color_map = dict.fromkeys(color_keys)
+    pieces = mob._break_up_tex_strings(strings)
+    exprs = [sep.join(pieces)] + pieces
+    return [(mob._get_modified_expression(e), env) for e in exprs]
+
+
+def collect_tex(path):
+    """
+    Every statically known TeX expression in a scene module.
+
+    Calls with f-strings, computed strings, custom templates or **kwargs
+    are skipped; manim compiles those on demand as usual.
+
+    Returns:
+        Sorted list of unique (expression, environment) pairs
+    """
+    tree = ast.parse(Path(path).read_text(encoding="utf-8"))
+    found = set()
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.Call):
+            continue
+        func = node.func
+        name = func.id if isinstance(func, ast.Name) else getattr(func, "attr", None)
+        if name not in TEX_CLASSES:
+            continue
+        try:
+            found.update(_call_expressions(name, node))
+        except (ValueError, TypeError, SyntaxError):
+            continue
+    return sorted(found, key=lambda pair: (pair[0], pair[1] or ""))
+
+
+# ---------------------------------------------------------------------------
+# Parallel compilation
+# ---------------------------------------------------------------------------
+
+def _tex_source(expression, environment, tex_template):
+    if environment is not None:
+        return tex_template.get_texcode_for_expression_in_env(expression, environment)
+    return tex_template.get_texcode_for_expression(expression)
+
+
+def _compile_job(source, target, tex_template):
+    """Compile one .tex source to `target` in a private scratch directory."""
+    work = Path(tempfile.mkdtemp(prefix="mediakit-tex-"))
+    try:
+        tex_file = work / f"{target.stem}.tex"
+        tex_file.write_text(source, encoding="utf-8")
+        fmt = tex_template.output_format
+        command = make_tex_compilation_command(tex_template.tex_compiler, fmt, tex_file, work)
+        if subprocess.run(command, stdout=subprocess.DEVNULL, cwd=work).returncode != 0:
+            return False
+        svg = work / f"{target.stem}.svg"
+        subprocess.run(
+            [
+                "dvisvgm",
+                *(["--pdf"] if fmt == ".pdf" else []),
+                "--page=1",
+                "--no-fonts",
+                "--verbosity=0",
+                f"--output={svg.as_posix()}",
+                tex_file.with_suffix(fmt).as_posix(),
+            ],
+            stdout=subprocess.DEVNULL,
+        )
+        if not svg.exists():
+            return False
+        # Publish atomically: other renders may be reading the cache
+        staged = target.with_name(f".{target.stem}.{os.getpid()}.svg")
+        shutil.copyfile(svg, staged)
+        os.replace(staged, target)
+        return True
+    finally:
+        shutil.rmtree(work, ignore_errors=True)
+
+
+def precompile_tex(path=None, expressions=None, tex_template=None, max_workers=None):
+    """
+    Compile cache misses ahead of rendering, all cores at once.
+
+    Args:
+        path: Scene module to scan with collect_tex()
+        expressions: Extra (expression, environment) pairs
+        tex_template: Template to compile with (defaults to config's)
+        max_workers: Concurrent latex + dvisvgm jobs (defaults to the
+                     core count)
+
+    Returns:
+        (cached, compiled, failed) counts. Failed expressions are left to
+        manim, which reports the LaTeX error when construct() reaches them.
+    """
+    tex_template = tex_template or config["tex_template"]
+    pairs = list(expressions or [])
+    if path is not None:
+        pairs += collect_tex(path)
+
+    tex_dir = config.get_dir("tex_dir")
+    tex_dir.mkdir(parents=True, exist_ok=True)
+    jobs = {}
+    for expression, environment in pairs:
+        source = _tex_source(expression, environment, tex_template)
+        target = tex_dir / f"{tex_hash(source)}.svg"
+        if not target.exists():
+            jobs[target] = source
+    cached = len(set(pairs)) - len(jobs)
+    if not jobs:
+        return cached, 0, 0
+
+    workers = max_workers or os.cpu_count() or 1
+    logger.info("Pre-compiling %d TeX expressions on %d workers", len(jobs), workers)
+    # Each job is two subprocesses; threads only wait on them
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(
+            lambda item: _compile_job(item[1], item[0], tex_template), jobs.items(),
+        ))
+    compiled = sum(results)
+    return cached, compiled, len(results) - compiled
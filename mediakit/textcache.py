@@ -0,0 +1,137 @@
+"""
+textcache.py
+Persistent cache of parsed Text / MarkupText glyph paths.
+
+Manim keeps the SVG that Pango writes for each Text, but re-parses it with
+svgelements on every run, which dominates the cost of label-heavy scenes.
+enable_text_cache() hooks SVGMobject.init_svg_mobject so that, for Text
+and MarkupText, the parsed glyph outlines are stored as numpy arrays (one
+.npz per distinct text + style) and reloaded on later runs without
+touching the SVG. Within a run, repeated Text still goes through manim's
+in-memory SVG_HASH_TO_MOB_MAP first and is copied from there; the disk
+cache only replaces the parse.
+
+Entries are keyed on Text's own settings hash (text, font, font_size,
+weight, slant, line_spacing, t2* maps, color), the SVG default style and
+the manim / ManimPango / Pango versions -- not on the render quality,
+which does not change glyph paths. The cache lives at the repo root, so
+it is shared by every project and every -ql / -qh render.
+"""
+
+import hashlib
+import os
+from pathlib import Path
+
+import manimpango
+import numpy as np
+from manim import MarkupText, Text, VMobject, logger
+from manim import __version__ as manim_version
+from manim.mobject.svg.svg_mobject import SVG_HASH_TO_MOB_MAP, SVGMobject
+from manim.utils.iterables import hash_obj
+
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parents[1] / ".cache" / "text"
+
+_original_init_svg_mobject = SVGMobject.init_svg_mobject
+_cache_dir = None
+stats = {"memory_hits": 0, "hits": 0, "misses": 0}
+
+
+def cache_key(mob):
+    """Cache key of a Text / MarkupText whose SVG has been written."""
+    seed = (
+        Path(mob.file_name).stem,  # Text's hash of text and style settings
+        repr(mob.svg_default),
+        repr(mob.path_string_config),
+        manim_version,
+        manimpango.__version__,
+        manimpango.pango_version(),
+    )
+    return hashlib.sha256(repr(seed).encode()).hexdigest()[:24]
+
+
+def save_glyphs(path, mobjects):
+    """Write the points and style of `mobjects` to one .npz file."""
+    points = [m.points for m in mobjects]
+    tmp = path.with_name(f"{path.stem}.{os.getpid()}.tmp.npz")
+    np.savez(
+        tmp,
+        points=np.concatenate(points) if points else np.zeros((0, 3)),
+        offsets=np.cumsum([0] + [len(p) for p in points]),
+        fill_color=np.array([m.get_fill_color().to_hex() for m in mobjects], dtype=str),
+        stroke_color=np.array([m.get_stroke_color().to_hex() for m in mobjects], dtype=str),
+        style=np.array([
+            [m.get_fill_opacity(), m.get_stroke_width(), m.get_stroke_opacity()]
+            for m in mobjects
+        ]).reshape(-1, 3),
+    )
+    os.replace(tmp, path)
+
+
+def load_glyphs(path):
+    """VMobjects stored by save_glyphs()."""
+    with np.load(path) as data:
+        points, offsets = data["points"], data["offsets"]
+        mobjects = []
+        for i, (fill, stroke, style) in enumerate(
+            zip(data["fill_color"], data["stroke_color"], data["style"])
+        ):
+            mob = VMobject()
+            mob.set_points(points[offsets[i]:offsets[i + 1]])
+            mob.set_style(
+                fill_color=str(fill), fill_opacity=float(style[0]),
+                stroke_color=str(stroke), stroke_width=float(style[1]),
+                stroke_opacity=float(style[2]),
+            )
+            mobjects.append(mob)
+    return mobjects
+
+
+def _cached_init_svg_mobject(self, use_svg_cache):
+    if _cache_dir is None or not isinstance(self, (Text, MarkupText)):
+        return _original_init_svg_mobject(self, use_svg_cache)
+
+    if use_svg_cache:
+        # Manim's own in-memory cache first, as SVGMobject does
+        hash_val = hash_obj(self.hash_seed)
+        if hash_val in SVG_HASH_TO_MOB_MAP:
+            self.add(*SVG_HASH_TO_MOB_MAP[hash_val].copy())
+            stats["memory_hits"] += 1
+            return
+
+    path = _cache_dir / f"{cache_key(self)}.npz"
+    glyphs = None
+    if path.exists():
+        try:
+            glyphs = load_glyphs(path)
+            stats["hits"] += 1
+        except (OSError, KeyError, ValueError) as err:
+            logger.warning("Ignoring unreadable text cache entry %s: %s", path.name, err)
+
+    if glyphs is not None:
+        self.add(*glyphs)
+    else:
+        self.generate_mobject()
+        stats["misses"] += 1
+        save_glyphs(path, self.submobjects)
+    if use_svg_cache:
+        SVG_HASH_TO_MOB_MAP[hash_val] = self.copy()
+
+
+def enable_text_cache(cache_dir=None):
+    """
+    Route Text / MarkupText SVG parsing through the persistent cache.
+
+    Args:
+        cache_dir: Cache directory (defaults to <repo>/.cache/text)
+    """
+    global _cache_dir
+    _cache_dir = Path(cache_dir) if cache_dir is not None else DEFAULT_CACHE_DIR
+    _cache_dir.mkdir(parents=True, exist_ok=True)
+    SVGMobject.init_svg_mobject = _cached_init_svg_mobject
+
+
+def disable_text_cache():
+    """Restore manim's own SVG parsing."""
+    global _cache_dir
+    _cache_dir = None
+    SVGMobject.init_svg_mobject = _original_init_svg_mobject
@@ -0,0 +1,127 @@
+"""
+tiles.py
+Rasterize each frame in horizontal bands on a thread pool.
+
+Cairo rasterizes a frame on one core: a 1440p frame full of labels, or a
+20000-point phase portrait, keeps one core busy while the others wait.
+enable_tiled_rasterization() patches the camera's VMobject drawing so
+that the frame is cut into horizontal bands, each with its own Cairo
+surface over its rows of the pixel array (a contiguous numpy view, so
+nothing is copied or stitched afterwards):
+
+  * every path is built once, on the calling thread, and captured with
+    copy_path(); building paths is Python work and cannot run in parallel;
+  * each band, in a worker thread, replays the paths whose pixel bounding
+    box touches its rows, then strokes and fills them. Cairo releases
+    the GIL while it rasterizes, so the bands are drawn concurrently.
+
+Bands only differ from the full-frame context by a whole-pixel offset, so
+each pixel gets the same coverage as in a single-threaded draw, and the
+drawing order inside each band is the original one. A clip set on the
+camera's context (see dirty.py) is carried over to the bands.
+ThreeDCamera projects points while building paths, so its frames are
+drawn the usual way.
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import cairo
+import numpy as np
+from manim import ThreeDCamera
+from manim.camera.camera import Camera
+
+from .dirty import pixel_box
+
+_original_display = Camera.display_multiple_non_background_colored_vmobjects
+_settings = {"pool": None, "bands": 1}
+stats = {"frames": 0, "paths": 0, "band_draws": 0}
+
+
+def _device_clip(ctx):
+    """Clip extents of `ctx` in device pixels."""
+    matrix = ctx.get_matrix()
+    ctx.identity_matrix()
+    extents = ctx.clip_extents()
+    ctx.set_matrix(matrix)
+    return extents
+
+
+def _draw_band(camera, pixel_array, matrix, clip, y0, y1, jobs):
+    """Replay `jobs` (vmobject, path) onto the rows y0:y1 of `pixel_array`."""
+    band = pixel_array[y0:y1]
+    surface = cairo.ImageSurface.create_for_data(band, cairo.FORMAT_ARGB32, band.shape[1], y1 - y0)
+    ctx = cairo.Context(surface)
+    ctx.rectangle(clip[0], clip[1] - y0, clip[2] - clip[0], clip[3] - clip[1])
+    ctx.clip()
+    ctx.set_matrix(cairo.Matrix(matrix.xx, matrix.yx, matrix.xy, matrix.yy, matrix.x0, matrix.y0 - y0))
+    for vmobject, path in jobs:
+        ctx.new_path()
+        ctx.append_path(path)
+        camera.apply_stroke(ctx, vmobject, background=True)
+        camera.apply_fill(ctx, vmobject)
+        camera.apply_stroke(ctx, vmobject)
+    surface.flush()
+    surface.finish()
+    return len(jobs)
+
+
+def _display_multiple_non_background_colored_vmobjects(self, vmobjects, pixel_array):
+    pool = _settings["pool"]
+    # Bands are culled with boxes of the unprojected points (see pixel_box)
+    if pool is None or not vmobjects or isinstance(self, ThreeDCamera):
+        return _original_display(self, vmobjects, pixel_array)
+
+    ctx = self.get_cairo_context(pixel_array)
+    matrix = ctx.get_matrix()
+    clip = _device_clip(ctx)
+    paths, boxes = [], []
+    for vmobject in vmobjects:
+        self.set_cairo_context_path(ctx, vmobject)
+        paths.append(ctx.copy_path())
+        boxes.append(pixel_box(self, vmobject) or (0, 0, 0, 0))
+    ctx.new_path()
+    boxes = np.array(boxes)
+
+    height = pixel_array.shape[0]
+    top, bottom = max(int(np.floor(clip[1])), 0), min(int(np.ceil(clip[3])), height)
+    edges = np.linspace(top, bottom, _settings["bands"] + 1).round().astype(int)
+    futures = []
+    for y0, y1 in zip(edges[:-1], edges[1:]):
+        if y1 <= y0:
+            continue
+        touching = np.flatnonzero((boxes[:, 1] < y1) & (boxes[:, 3] > y0))
+        if len(touching) == 0:
+            continue
+        jobs = [(vmobjects[i], paths[i]) for i in touching]
+        futures.append(pool.submit(_draw_band, self, pixel_array, matrix, clip, y0, y1, jobs))
+    for future in futures:
+        stats["band_draws"] += future.result()
+    stats["frames"] += 1
+    stats["paths"] += len(vmobjects)
+    return None
+
+
+def enable_tiled_rasterization(workers=None, bands=None):
+    """
+    Draw VMobjects band by band on a thread pool (see module docstring).
+
+    Args:
+        workers: Threads to draw with (default: one per core)
+        bands: Horizontal bands per frame (default: two per worker, so
+               that bands with little on them do not leave threads idle)
+    """
+    workers = workers or os.cpu_count() or 1
+    if _settings["pool"] is not None:
+        _settings["pool"].shutdown()
+    _settings["pool"] = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="tiles")
+    _settings["bands"] = bands or 2 * workers
+    Camera.display_multiple_non_background_colored_vmobjects = _display_multiple_non_background_colored_vmobjects
+
+
+def disable_tiled_rasterization():
+    """Draw every frame on the calling thread, as manim does."""
+    Camera.display_multiple_non_background_colored_vmobjects = _original_display
+    if _settings["pool"] is not None:
+        _settings["pool"].shutdown()
+        _settings["pool"] = None
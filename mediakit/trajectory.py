@@ -0,0 +1,212 @@
+"""
+trajectory.py
+Single-path trajectories with an O(1) progressive reveal.
+
+A Trajectory fits its samples once (see curves.fit_path) into one Bezier
+buffer. Consecutive samples sharing a color form a run, drawn by one child
+VMobject whose points are a view into that shared buffer. Revealing up to
+a given progress only trims the child that holds the leading edge and
+splits a single cubic there, so a frame costs the same for 10^3 or 10^5
+samples and nothing is ever re-subdivided.
+
+RevealTrajectory animates the progress; use it instead of Create on one
+VMobject per color segment.
+
+Transforms applied from any level (shift, scale, rotate, move_to on the
+trajectory or on a group holding it, .animate, Transform) reach the runs
+as new point arrays rather than through the buffer. An invisible anchor
+child holds a few of the path's own points, affinely independent, so the
+transform can be recovered from it exactly and folded back into the
+buffer before the next reveal (sync). Non-affine point functions
+(apply_function, Homotopy) are not supported.
+"""
+
+import numpy as np
+from manim import Animation, VGroup, VMobject, WHITE, linear
+
+from .curves import fit_path
+
+
+def _reference_points(points, eps=1e-9):
+    """Up to four affinely independent points of `points`, padded to a cubic."""
+    p0 = points[0]
+    p1 = points[np.argmax(np.linalg.norm(points - p0, axis=1))]
+    chosen = [p0, p1]
+    axis = p1 - p0
+    if np.linalg.norm(axis) > eps:
+        axis = axis / np.linalg.norm(axis)
+        off_line = (points - p0) - np.outer((points - p0) @ axis, axis)
+        dist = np.linalg.norm(off_line, axis=1)
+        if dist.max() > eps:
+            p2 = points[np.argmax(dist)]
+            chosen.append(p2)
+            normal = np.cross(axis, p2 - p0)
+            height = np.abs((points - p0) @ (normal / np.linalg.norm(normal)))
+            if height.max() > eps:
+                chosen.append(points[np.argmax(height)])
+    chosen += [p0] * (4 - len(chosen))
+    return np.array(chosen)
+
+
+def _split_cubic(cubic, u):
+    """Control points of the [0, u] part of one cubic (de Casteljau)."""
+    p0, p1, p2, p3 = cubic
+    a = p0 + u * (p1 - p0)
+    b = p1 + u * (p2 - p1)
+    c = p2 + u * (p3 - p2)
+    d = a + u * (b - a)
+    e = b + u * (c - b)
+    return np.array([p0, a, d, d + u * (e - d)])
+
+
+class Trajectory(VGroup):
+    """
+    Long sampled path revealed by progress, one child VMobject per color run.
+
+    Any affine transform (move_to, shift, scale, rotate, also applied to a
+    parent group) is folded into the buffer on the next reveal; the
+    bounding box is always that of the whole path.
+
+    Args:
+        points: (N, 3) samples, evenly spaced in time
+        colors: One color, or a sequence with one color per sample
+        progress: Initial visible fraction of the samples
+        tolerance_px, max_error_px: Curve fitting budget (see fit_path)
+        **kwargs: Stroke style shared by every run (stroke_width, ...)
+    """
+
+    def __init__(self, points, colors=WHITE, progress=1.0, tolerance_px=0.5,
+                 max_error_px=1.0, **kwargs):
+        super().__init__()
+        points = np.asarray(points, dtype=float)
+        n = len(points)
+        if isinstance(colors, (list, tuple, np.ndarray)):
+            keys = [str(c) for c in colors]
+            starts = [0] + [i for i in range(1, n - 1) if keys[i] != keys[i - 1]]
+            run_colors = [colors[i] for i in starts]
+        else:
+            starts = [0]
+            run_colors = [colors]
+        ends = starts[1:] + [n - 1]
+
+        # Fit each run separately so color boundaries are anchors; the
+        # cubic table maps every cubic back to the samples it spans
+        beziers, sample_start, sample_end, self.run_bounds = [], [], [], []
+        num_cubics = 0
+        for s, e in zip(starts, ends):
+            bezier, idx, _ = fit_path(points[s:e + 1], tolerance_px, max_error_px)
+            beziers.append(bezier)
+            sample_start.append(s + idx[:-1])
+            sample_end.append(s + idx[1:])
+            self.run_bounds.append((num_cubics, num_cubics + len(idx) - 1))
+            num_cubics += len(idx) - 1
+
+        self._full = np.concatenate(beziers)
+        self._buffer = self._full.copy()
+        self._sample_start = np.concatenate(sample_start)
+        self._sample_end = np.concatenate(sample_end)
+        self.num_samples = n
+        self._split = None
+
+        self.runs = [
+            VMobject(stroke_color=color, **{"fill_opacity": 0, **kwargs})
+            for color in run_colors
+        ]
+        # Invisible; transforms applied to the family move it with the runs
+        self._anchor = VMobject(stroke_width=0, stroke_opacity=0, fill_opacity=0)
+        self._anchor.points = _reference_points(self._full)
+        self._reference = self._anchor.points.copy()
+        self.add(*self.runs, self._anchor)
+        self._visible = [None] * len(self.runs)
+        self.progress = None
+        self.set_progress(progress)
+
+    @property
+    def num_cubics(self):
+        return len(self._sample_start)
+
+    def sync(self):
+        """
+        Fold transforms applied to the drawn family into the buffer, and
+        make the runs views into it again (they are copies after a parent
+        transform, a Transform or a copy()).
+        """
+        current = self._anchor.points
+        moved = not np.array_equal(current, self._reference)
+        if moved:
+            # Affine map taking the reference points to where they are now
+            src = self._reference - self._reference[0]
+            dst = current - current[0]
+            matrix = np.linalg.lstsq(src, dst, rcond=None)[0]
+            self._full[:] = (self._full - self._reference[0]) @ matrix + current[0]
+            self._reference = current.copy()
+            # In-place edits through the run views may have reached the
+            # buffer; rebuild it (the leading cubic is split again below)
+            self._buffer[:] = self._full
+            self._split = None
+        if moved or any(r.points.base is not self._buffer for r in self.runs):
+            self._visible = [None] * len(self.runs)
+            progress, self.progress = self.progress, None
+            if progress is not None:
+                self.set_progress(progress)
+        return self
+
+    def shift(self, *vectors):
+        # Straight into the buffer, without copying the runs
+        self.sync()
+        total = sum(vectors)
+        self._full += total
+        self._buffer += total
+        self._anchor.points = self._anchor.points + total
+        self._reference = self._anchor.points.copy()
+        return self
+
+    def set_progress(self, progress):
+        """Show the path up to `progress` (0..1) of its samples."""
+        progress = float(np.clip(progress, 0.0, 1.0))
+        if self.progress is not None:
+            self.sync()
+        if progress == self.progress:
+            return self
+        self.progress = progress
+        pos = progress * (self.num_samples - 1)
+
+        # Leading cubic and how far into it the reveal has got
+        c = int(np.searchsorted(self._sample_end, pos, side="left"))
+        c = min(c, self.num_cubics - 1)
+        s0, s1 = self._sample_start[c], self._sample_end[c]
+        u = min(max((pos - s0) / (s1 - s0), 0.0), 1.0)
+
+        if self._split is not None:
+            i = self._split
+            self._buffer[4 * i:4 * i + 4] = self._full[4 * i:4 * i + 4]
+            self._split = None
+        if 0.0 < u < 1.0:
+            self._buffer[4 * c:4 * c + 4] = _split_cubic(self._full[4 * c:4 * c + 4], u)
+            self._split = c
+        end = c + 1 if u > 0.0 else c
+
+        for r, (first, last) in enumerate(self.run_bounds):
+            stop = min(max(end, first), last)
+            if stop == self._visible[r] and not first <= c < last:
+                continue
+            self._visible[r] = stop
+            self.runs[r].points = self._buffer[4 * first:4 * stop]
+        return self
+
+
+class RevealTrajectory(Animation):
+    """
+    Advance a Trajectory's progress from `start` to `end`.
+
+    Args:
+        trajectory: Trajectory to reveal
+        start, end: Progress at the beginning and end of the animation
+    """
+
+    def __init__(self, trajectory, start=0.0, end=1.0, rate_func=linear, **kwargs):
+        self.start, self.end = start, end
+        super().__init__(trajectory, rate_func=rate_func, **kwargs)
+
+    def interpolate_mobject(self, alpha):
+        self.mobject.set_progress(self.start + alpha * (self.end - self.start))
@@ -0,0 +1,128 @@
+"""
+winding.py
+Vectorized "winding machine" for Fourier explainers.
+
+A signal g(t) is wrapped around the origin at winding frequency f:
+
+    z(t) = g(t) * exp(2 pi i f t)
+
+The wound curve is z sampled over t, and its center of mass is the mean of
+the same samples -- the "almost Fourier transform" at f. Both come from one
+numpy expression, so a frame never evaluates the signal or the trig twice.
+
+For a linear ValueTracker sweep the whole center-of-mass trace can be
+precomputed up front; per-frame lookups are then a single interpolation.
+"""
+
+import numpy as np
+from manim import VMobject, YELLOW
+
+
+def _complex_to_points(z):
+    """Map a complex array to (N, 3) scene points on the z = 0 plane."""
+    z = np.atleast_1d(z)
+    pts = np.zeros((len(z), 3))
+    pts[:, 0] = z.real
+    pts[:, 1] = z.imag
+    return pts
+
+
+class WindingMachine:
+    """
+    Wraps a sampled signal around a circle at arbitrary winding frequencies.
+
+    Args:
+        signal_func: Vectorized signal g(t); called once on the sample array
+        t_range: (t_min, t_max) of the sampled window
+        num_samples: Number of samples along t
+        scale: Radius multiplier applied to g(t) (scene units per signal unit)
+    """
+
+    def __init__(self, signal_func, t_range=(0.0, 2.0), num_samples=400, scale=1.0):
+        self.t = np.linspace(t_range[0], t_range[1], num_samples)
+        self.radius = scale * np.asarray(signal_func(self.t), dtype=float)
+        self.sweep_freqs = None
+        self.sweep_com = None
+
+    # ------------------------------------------------------------------
+    # Single-frequency evaluation
+    # ------------------------------------------------------------------
+    def wound(self, freq):
+        """Complex samples of the signal wound at `freq`."""
+        return self.radius * np.exp(2j * np.pi * freq * self.t)
+
+    def wind(self, freq):
+        """
+        Wound curve and its center of mass from one evaluation.
+
+        Returns:
+            (points, com): (N, 3) curve points and the (3,) center of mass
+        """
+        z = self.wound(freq)
+        return _complex_to_points(z), _complex_to_points(z.mean())[0]
+
+    def curve_points(self, freq):
+        """(N, 3) points of the wound curve at `freq`."""
+        return _complex_to_points(self.wound(freq))
+
+    def center_of_mass(self, freq):
+        """
+        (3,) center of mass at `freq`.
+
+        Uses the precomputed sweep when `freq` lies inside it, otherwise
+        evaluates directly.
+        """
+        if self.sweep_freqs is not None and self.sweep_freqs[0] <= freq <= self.sweep_freqs[-1]:
+            com = complex(
+                np.interp(freq, self.sweep_freqs, self.sweep_com.real),
+                np.interp(freq, self.sweep_freqs, self.sweep_com.imag),
+            )
+        else:
+            com = self.wound(freq).mean()
+        return np.array([com.real, com.imag, 0.0])
+
+    # ------------------------------------------------------------------
+    # Whole-sweep precomputation
+    # ------------------------------------------------------------------
+    def precompute_sweep(self, f_start, f_end, num_freqs=2000, chunk=256):
+        """
+        Precompute the center of mass for every frequency in a linear sweep.
+
+        The phase matrix is built `chunk` frequencies at a time so memory
+        stays bounded for long sweeps or dense sampling.
+
+        Returns:
+            self (for chaining)
+        """
+        freqs = np.linspace(f_start, f_end, num_freqs)
+        com = np.empty(num_freqs, dtype=complex)
+        for i in range(0, num_freqs, chunk):
+            phase = np.exp(2j * np.pi * np.outer(freqs[i:i + chunk], self.t))
+            com[i:i + chunk] = phase @ self.radius / len(self.t)
+        self.sweep_freqs = freqs
+        self.sweep_com = com
+        return self
+
+    def com_trace(self, upto=None):
+        """
+        (M, 3) center-of-mass trace of the precomputed sweep.
+
+        Args:
+            upto: Optional frequency; the trace is cut there, ending exactly
+                  at the interpolated center of mass for `upto`
+        """
+        if self.sweep_freqs is None:
+            raise RuntimeError("call precompute_sweep() before com_trace()")
+        if upto is None:
+            return _complex_to_points(self.sweep_com)
+        k = np.searchsorted(self.sweep_freqs, upto, side="right")
+        pts = _complex_to_points(self.sweep_com[:k])
+        return np.vstack([pts, self.center_of_mass(upto)])
+
+    def com_trace_curve(self, upto=None, color=YELLOW, stroke_width=2, **kwargs):
+        """VMobject drawing the center-of-mass trace (see com_trace)."""
+        curve = VMobject(color=color, stroke_width=stroke_width, **kwargs)
+        pts = self.com_trace(upto)
+        if len(pts) >= 2:
+            curve.set_points_as_corners(pts)
+        return curve
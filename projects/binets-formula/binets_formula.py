@@ -22,6 +22,8 @@ except ImportError:
 # Import VoiceSettings model from elevenlabs
 from elevenlabs import VoiceSettings
 
+from mediakit.texcache import precompile_tex, use_shared_tex_cache
+
 # ============================================================================
 # OPTIMIZED CONFIGURATION - DO NOT MODIFY THESE VALUES
 # ============================================================================
@@ -31,6 +33,9 @@ config.pixel_height = 1440
 config.pixel_width = 2560
 # ============================================================================
 
+use_shared_tex_cache()
+precompile_tex(__file__)
+
 # ---------------------------------------------------------------------------
 # Voice configuration (reads from environment)
 # ---------------------------------------------------------------------------
@@ -1 +1,4 @@
+# mediakit is imported from the repo root
+export PYTHONPATH="$(cd "$(dirname "${BASH_SOURCE[0]}")/../.." && pwd)${PYTHONPATH:+:$PYTHONPATH}"
+
 manim binets_formula.py BinetFormulaSelfCorrection
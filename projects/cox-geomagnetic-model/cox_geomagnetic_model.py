@@ -2,6 +2,18 @@ from manim import *
 import numpy as np
 from scipy.integrate import solve_ivp
 
+from mediakit.axes import get_axes
+from mediakit.chunks import enable_chunked_encoding
+from mediakit.coords import coords_to_points
+from mediakit.curves import simplified_curve
+from mediakit.holds import enable_static_holds
+from mediakit.outputs import enable_extra_outputs
+from mediakit.pipeline import enable_render_pipeline
+from mediakit.texcache import precompile_tex, use_shared_tex_cache
+from mediakit.textcache import enable_text_cache
+from mediakit.tiles import enable_tiled_rasterization
+from mediakit.trajectory import RevealTrajectory, Trajectory
+
 # ============================================================================
 # OPTIMIZED CONFIGURATION - DO NOT MODIFY THESE VALUES
 # ============================================================================
@@ -11,6 +23,15 @@ config.pixel_height = 1440
 config.pixel_width = 2560
 # ============================================================================
 
+enable_static_holds()
+enable_render_pipeline()
+enable_chunked_encoding()
+enable_extra_outputs()
+enable_text_cache()
+enable_tiled_rasterization()
+use_shared_tex_cache()
+precompile_tex(__file__)
+
 
 class CoxGeomageticModel(Scene):
     """
@@ -189,7 +210,7 @@ class CoxGeomageticModel(Scene):
         title.move_to(UP * 3.8)
         self.play(Write(title), run_time=1.0)
 
-        ax = Axes(
+        ax = get_axes(
             x_range=[0, 6 * np.pi, np.pi],
             y_range=[-0.1, 1.3, 0.5],
             x_length=13,
@@ -289,7 +310,7 @@ class CoxGeomageticModel(Scene):
         title.move_to(UP * 3.8)
         self.play(Write(title), run_time=1.0)
 
-        ax = Axes(
+        ax = get_axes(
             x_range=[0, 6 * np.pi, np.pi],
             y_range=[-0.1, 1.3, 0.5],
             x_length=13,
@@ -326,9 +347,8 @@ class CoxGeomageticModel(Scene):
         nd_vals = gaussian_filter1d(raw, sigma=15) * 0.08 + 0.15
         nd_vals = np.clip(nd_vals, 0.03, 0.4)
 
-        nd_points = [ax.c2p(x, y) for x, y in zip(xs, nd_vals)]
-        nd_curve = VMobject(color=GREEN, stroke_width=2)
-        nd_curve.set_points_smoothly(nd_points)
+        nd_points = coords_to_points(ax, xs, nd_vals)
+        nd_curve = simplified_curve(nd_points, color=GREEN, stroke_width=2)
         nd_label = MathTex(r"B_{nd}", font_size=22, color=GREEN)
         nd_label.next_to(ax.c2p(1.0, 0.25), UP, buff=0.1)
         self.play(Create(nd_curve), Write(nd_label), run_time=2.5)
@@ -600,7 +620,7 @@ class CoxGeomageticModel(Scene):
         chart_title.move_to(UP * 3.8)
         self.play(Write(chart_title), run_time=0.8)
 
-        ax = Axes(
+        ax = get_axes(
             x_range=[0, 21, 1],
             y_range=[0, 0.42, 0.1],
             x_length=12,
@@ -744,7 +764,7 @@ class CoxGeomageticModel(Scene):
         X, Y, Z = sol.y
 
         # X(t) time series
-        ax = Axes(
+        ax = get_axes(
             x_range=[0, 250, 50],
             y_range=[-7, 7, 2],
             x_length=13,
@@ -778,20 +798,19 @@ class CoxGeomageticModel(Scene):
         )
         self.play(Create(zero_line), Write(zero_label), run_time=0.8)
 
-        # Draw curve in segments for progressive reveal
+        # Progressive reveal of one path, colored in five stretches
         skip = 2
-        t_s, X_s = t[::skip], X[::skip]
-        n_pts = len(t_s)
+        all_pts = coords_to_points(ax, t[::skip], X[::skip])
+        n_pts = len(all_pts)
         seg_size = n_pts // 5
         colors = [BLUE_B, BLUE_C, BLUE_D, BLUE_E, BLUE]
+        stretch = np.minimum(np.arange(n_pts) // seg_size, 4)
 
-        for i in range(5):
-            start = i * seg_size
-            end = min((i + 1) * seg_size + 1, n_pts)
-            seg_pts = [ax.c2p(ti, xi) for ti, xi in zip(t_s[start:end], X_s[start:end])]
-            seg = VMobject(color=colors[i], stroke_width=1.5)
-            seg.set_points_smoothly(seg_pts)
-            self.play(Create(seg), run_time=1.5)
+        trace = Trajectory(
+            all_pts, [colors[i] for i in stretch],
+            progress=0.0, stroke_width=1.5,
+        )
+        self.play(RevealTrajectory(trace), run_time=7.5)
 
         self.wait(1.0)
 
@@ -834,7 +853,7 @@ class CoxGeomageticModel(Scene):
         )
         X, Y = sol.y[0], sol.y[1]
 
-        ax = Axes(
+        ax = get_axes(
             x_range=[-7, 7, 2],
             y_range=[-3.5, 3.5, 1],
             x_length=12,
@@ -848,31 +867,26 @@ class CoxGeomageticModel(Scene):
         y_lab = ax.get_y_axis_label(MathTex(r"Y", font_size=22), edge=UP, direction=LEFT)
         self.play(Create(ax), Write(x_lab), Write(y_lab), run_time=1.0)
 
-        # Draw trajectory in colored segments
+        # Draw trajectory as one path, colored in stretches of seg_size samples
         skip = 3
-        Xs, Ys = X[::skip], Y[::skip]
-        all_pts = [ax.c2p(xi, yi) for xi, yi in zip(Xs, Ys)]
+        all_pts = coords_to_points(ax, X[::skip], Y[::skip])
 
         seg_size = 300
-        n_segs = len(all_pts) // seg_size
+        n_segs = min(len(all_pts) // seg_size, 10)
         palette = [BLUE, TEAL, GREEN, YELLOW, ORANGE, RED, PURPLE, PINK, BLUE_B, GREEN_B]
 
-        segments = VGroup()
-        for i in range(min(n_segs, 10)):
-            seg_pts = all_pts[i * seg_size : (i + 1) * seg_size + 1]
-            if len(seg_pts) < 2:
-                continue
-            seg = VMobject(
-                color=palette[i % len(palette)],
-                stroke_width=1, stroke_opacity=0.6,
-            )
-            seg.set_points_smoothly(seg_pts)
-            segments.add(seg)
+        trail_pts = all_pts[: n_segs * seg_size + 1]
+        stretch = np.minimum(np.arange(len(trail_pts)) // seg_size, n_segs - 1)
+        trajectory = Trajectory(
+            trail_pts, [palette[i % len(palette)] for i in stretch],
+            progress=0.0, stroke_width=1, stroke_opacity=0.6,
+        )
 
-        for seg in segments[:4]:
-            self.play(Create(seg), run_time=1.0)
-        if len(segments) > 4:
-            self.play(Create(VGroup(*segments[4:])), run_time=3.0)
+        # First four stretches at a second each, then the rest in one sweep
+        split = min(4, n_segs) / n_segs
+        self.play(RevealTrajectory(trajectory, 0.0, split), run_time=min(4, n_segs))
+        if n_segs > 4:
+            self.play(RevealTrajectory(trajectory, split, 1.0), run_time=3.0)
 
         self.wait(0.5)
 
@@ -1,2 +1,5 @@
+# mediakit is imported from the repo root
+export PYTHONPATH="$(cd "$(dirname "${BASH_SOURCE[0]}")/../.." && pwd)${PYTHONPATH:+:$PYTHONPATH}"
+
 # Render a single scene
 manim cox_geomagnetic_model.py CoxGeomageticModel
@@ -1,6 +1,9 @@
 from manim import *
 import numpy as np
 
+from mediakit.cellsort import CellGrid, CellSortSim, ReplaySwaps
+from mediakit.lagged import BatchedFadeIn
+
 # ============================================================================
 # OPTIMIZED CONFIGURATION - DO NOT MODIFY THESE VALUES
 # ============================================================================
@@ -57,117 +60,30 @@ class ClusteringEmergence(Scene):
         self.play(FadeIn(legend, shift=RIGHT))
         self.wait(0.5)
 
-        # Create grid of cells with random algotypes
-        cells = VGroup()
-        algo_types = {}
-
-        x_start = -5.0
-        y_start = 2.5
-        x_step = cell_size * 1.2
-        y_step = cell_size * 1.2
-
-        for r in range(rows):
-            for c in range(cols):
-                algo_index = np.random.randint(0, len(algo_colors))
-                color = algo_colors[algo_index]
-
-                cell = Square(
-                    side_length=cell_size,
-                    stroke_width=0.5,
-                    stroke_color=GRAY_D,
-                    fill_color=color,
-                    fill_opacity=0.95,
-                )
-
-                x = x_start + c * x_step
-                y = y_start - r * y_step
-                cell.move_to(np.array([x, y, 0.0]))
-
-                # Store algotype index as immutable "identity"
-                cell.algo_index = algo_index
-                cells.add(cell)
-
-        grid_group = VGroup(cells)
-        self.play(FadeIn(grid_group, lag_ratio=0.02))
-        self.wait(1.0)
+        # Simulate up front on an integer grid; the swap history is then
+        # replayed onto one batched grid mobject (one path per algotype)
+        steps = 40
+        swaps_per_step = 12  # how many swaps per iteration
 
-        # Helper to get neighbors for a cell index in the flat list
-        def neighbor_indices(index):
-            r = index // cols
-            c = index % cols
-            neighbors = []
-            for dr, dc in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-                nr = r + dr
-                nc = c + dc
-                if 0 <= nr < rows and 0 <= nc < cols:
-                    neighbors.append(nr * cols + nc)
-            return neighbors
-
-        # Simple local-energy function: count neighbors with different algotype
-        def local_discomfort(idx):
-            cell = cells[idx]
-            own_type = cell.algo_index
-            diff_count = 0
-            for n_idx in neighbor_indices(idx):
-                if cells[n_idx].algo_index != own_type:
-                    diff_count += 1
-            return diff_count
+        sim = CellSortSim(rows, cols, num_types=len(algo_colors))
+        sim.run(steps, max_swaps=swaps_per_step)
+
+        cells = CellGrid(
+            sim.initial_types, rows, cols, algo_colors,
+            cell_size=cell_size, spacing=cell_size * 1.2,
+        )
+        # Top-left cell center at (-5.0, 2.5), as before
+        cells.shift(np.array([-5.0, 2.5, 0.0]) - cells.slot_centers[0])
+
+        # Staggered entrance cell by cell, then the batched grid takes over
+        entrance = cells.cell_squares()
+        self.play(BatchedFadeIn(entrance, lag_ratio=0.02))
+        self.remove(entrance)
+        self.add(cells)
+        self.wait(1.0)
 
         # "Sorting" iterations: cells swap positions if it reduces local discomfort
-        steps = 40
-        animations_per_step = 12  # how many swaps per iteration
-
-        for step in range(steps):
-            anims = []
-            indices = list(range(len(cells)))
-            np.random.shuffle(indices)
-
-            swaps_done = 0
-            for idx in indices:
-                if swaps_done >= animations_per_step:
-                    break
-
-                current_discomfort = local_discomfort(idx)
-                if current_discomfort == 0:
-                    continue
-
-                # Try swapping with a random neighbor
-                nbs = neighbor_indices(idx)
-                if not nbs:
-                    continue
-                n_idx = np.random.choice(nbs)
-
-                # Compute discomfort if swapped
-                # Perform a temporary position swap in memory only
-                cells[idx], cells[n_idx] = cells[n_idx], cells[idx]
-                new_discomfort_idx = local_discomfort(n_idx)
-                new_discomfort_n = local_discomfort(idx)
-                total_new = new_discomfort_idx + new_discomfort_n
-
-                # Undo temporary swap
-                cells[idx], cells[n_idx] = cells[n_idx], cells[idx]
-
-                # Current total discomfort of the two cells
-                total_old = current_discomfort + local_discomfort(n_idx)
-
-                if total_new < total_old:
-                    # Accept swap: entire objects exchange positions (algotype moves with cell)
-                    cell_a = cells[idx]
-                    cell_b = cells[n_idx]
-
-                    pos_a = cell_a.get_center()
-                    pos_b = cell_b.get_center()
-
-                    # Animate the swap
-                    anims.append(cell_a.animate.move_to(pos_b))
-                    anims.append(cell_b.animate.move_to(pos_a))
-
-                    # Swap in the VGroup
-                    cells[idx], cells[n_idx] = cells[n_idx], cells[idx]
-                    swaps_done += 1
-
-            if anims:
-                self.play(*anims, run_time=0.4, rate_func=linear)
+        self.play(ReplaySwaps(cells, sim), run_time=steps * 0.4)
 
         # Final emphasize clusters
         highlight = SurroundingRectangle(
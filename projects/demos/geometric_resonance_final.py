@@ -1,6 +1,9 @@
 from manim import *
 import numpy as np
 
+from mediakit.instancing import FadeInInstances
+from mediakit.pointcloud import Scatter
+
 # Moderate zoom out with HIGH QUALITY settings
 config.frame_height = 10  # Moderate zoom (was 14, too much; default is 8)
 config.frame_width = 10 * 16/9  # Maintain 16:9 aspect ratio
@@ -142,16 +145,9 @@ class GeometricResonancePrimePrediction(Scene):
 
         # Generate properly scaled quasi-random points
         np.random.seed(42)
-        sobol_dots = VGroup()
-        for i in range(30):
-            x_offset = (i % 6 - 2.5) * 0.55
-            y_offset = (i // 6 - 2) * 0.45
-            dot = Dot(
-                sobol_box.get_center() + np.array([x_offset, y_offset, 0]),
-                color=TEAL,
-                radius=0.05
-            )
-            sobol_dots.add(dot)
+        i = np.arange(30)
+        sobol_offsets = np.stack([(i % 6 - 2.5) * 0.55, (i // 6 - 2) * 0.45, np.zeros(30)], axis=1)
+        sobol_dots = Scatter(sobol_box.get_center() + sobol_offsets, radii=0.05, colors=TEAL)
 
         # Resonance computation
         resonance_box = RoundedRectangle(
@@ -184,7 +180,8 @@ class GeometricResonancePrimePrediction(Scene):
         ).move_to(ORIGIN).shift(DOWN * 0.3)
 
         self.play(Create(sobol_box), Write(sobol_label))
-        self.play(LaggedStart(*[FadeIn(dot, scale=0.5) for dot in sobol_dots], lag_ratio=0.05))
+        # Same timing as LaggedStart(FadeIn(dot, scale=0.5) ..., lag_ratio=0.05)
+        self.play(FadeInInstances(sobol_dots, scale=0.5, lag_ratio=0.05, run_time=1 + 29 * 0.05))
         self.play(Create(resonance_box), Write(resonance_label))
         self.play(Write(phi_formula), run_time=0.8)
         self.play(Write(e_formula), run_time=0.8)
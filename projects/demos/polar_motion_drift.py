@@ -1,6 +1,10 @@
 from manim import *
 import numpy as np
 
+from mediakit.readout import Readout
+from mediakit.signals import circular, piecewise, ramp, region_curves, signal_curve, sinusoid
+from mediakit.signals import linear as linear_signal
+
 # ============================================================================
 # OPTIMIZED CONFIGURATION - DO NOT MODIFY THESE VALUES
 # ============================================================================
@@ -108,20 +112,19 @@ class PolarMotionDrift(Scene):
         chandler_period = 433.0 / 365.25
         annual_period = 1.0
 
+        # Chandler + annual terms as one complex (x + i y) signal, sampled
+        # daily over six years in a single array evaluation
+        wobble = (wobble_radius / 1.4) * (
+            circular(0.8, period=chandler_period) + circular(0.4, period=annual_period)
+        )
+        wobble_days = np.arange(0, 6.0, 1 / 365.25)
+
         def wobble_path(t):
-            cx = 0.8 * np.cos(2 * PI * t / chandler_period)
-            cy = 0.8 * np.sin(2 * PI * t / chandler_period)
-            ax = 0.4 * np.cos(2 * PI * t / annual_period)
-            ay = 0.4 * np.sin(2 * PI * t / annual_period)
-            return wobble_center + np.array([
-                (cx + ax) * wobble_radius / 1.4,
-                (cy + ay) * wobble_radius / 1.4,
-                0
-            ])
-
-        wobble_trace = ParametricFunction(
-            lambda t: wobble_path(t),
-            t_range=[0, 6.0, 0.01],
+            z = wobble(t)
+            return wobble_center + np.array([z.real, z.imag, 0])
+
+        wobble_trace = signal_curve(
+            wobble, wobble_days, origin=wobble_center,
             color=ACCENT_BLUE, stroke_width=2.0, stroke_opacity=0.8
         )
 
@@ -232,42 +235,29 @@ class PolarMotionDrift(Scene):
             run_time=0.8
         )
 
-        def signal_func(x):
-            if x < -1.5:
-                t_norm = (x + 7) / 5.5
-                amplitude = 1.8
-                return amplitude * np.sin(8 * PI * t_norm)
-            elif x < 1.5:
-                t_norm = (x + 1.5) / 3.0
-                amplitude = 1.8 * (1 - t_norm)
-                freq_shift = 8 * PI * ((x + 7) / 5.5)
-                return amplitude * np.sin(freq_shift)
-            else:
-                t_norm = (x - 1.5) / 5.5
-                return 0.15 + t_norm * 1.2
-
-        signal_points_x = np.linspace(-7, 6.5, 1000)
-        signal_points = [
-            plot_center + np.array([x, signal_func(x), 0])
-            for x in signal_points_x
-        ]
+        # Stable wobble -> decaying wobble -> linear drift, evaluated once and
+        # split into the three phase curves by region masks
+        wave = sinusoid(1.0, freq=4 / 5.5, phase=8 * PI * 7 / 5.5)
+        phase_breaks = [-1.5, 1.5]
+        drift_signal = piecewise(phase_breaks, [
+            1.8 * wave,
+            ramp(-1.5, 1.5, 1.8, 0.0) * wave,
+            linear_signal(1.2 / 5.5, 0.15, x0=1.5),
+        ])
 
-        phase1_pts = [p for p, x in zip(signal_points, signal_points_x) if x < -1.5]
-        phase1_curve = VMobject(color=ACCENT_BLUE, stroke_width=2.5)
-        phase1_curve.set_points_smoothly(phase1_pts)
+        phase1_curve, phase2_curve, phase3_curve = region_curves(
+            drift_signal, np.linspace(-7, 6.5, 1000), phase_breaks,
+            styles=[
+                {"color": ACCENT_BLUE},
+                {"color": ACCENT_ORANGE},
+                {"color": ACCENT_RED},
+            ],
+            origin=plot_center, stroke_width=2.5,
+        )
 
         self.play(Create(phase1_curve), run_time=2.0, rate_func=linear)
-
-        phase2_pts = [p for p, x in zip(signal_points, signal_points_x) if -1.5 <= x < 1.5]
-        phase2_curve = VMobject(color=ACCENT_ORANGE, stroke_width=2.5)
-        phase2_curve.set_points_smoothly(phase2_pts)
-
         self.play(Create(phase2_curve), run_time=2.0, rate_func=linear)
 
-        phase3_pts = [p for p, x in zip(signal_points, signal_points_x) if x >= 1.5]
-        phase3_curve = VMobject(color=ACCENT_RED, stroke_width=2.5)
-        phase3_curve.set_points_smoothly(phase3_pts)
-
         now_arrow = Arrow(
             RIGHT * 5.5 + plot_center + UP * 2.5,
             RIGHT * 5.5 + plot_center + UP * 0.8,
@@ -507,12 +497,10 @@ class PolarMotionDrift(Scene):
         fill_bar = always_redraw(get_fill)
         self.add(fill_bar)
 
-        pct_counter = always_redraw(
-            lambda: Text(
-                f"{fill_tracker.get_value() * 100:.1f}%",
-                font_size=36, color=HIGHLIGHT_YELLOW, weight=BOLD
-            ).next_to(bar_bg, DOWN, buff=0.5)
-        )
+        pct_counter = Readout(
+            "{:.1f}%", fill_tracker.get_value() * 100,
+            font_size=36, color=HIGHLIGHT_YELLOW, weight=BOLD,
+        ).next_to(bar_bg, DOWN, buff=0.5).track(lambda: fill_tracker.get_value() * 100)
         self.add(pct_counter)
 
         self.play(fill_tracker.animate.set_value(0.065), run_time=2.5, rate_func=smooth)
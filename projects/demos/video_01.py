@@ -1,6 +1,8 @@
 from manim import *
 import numpy as np
 
+from mediakit.lagged import BatchedFadeIn
+
 config.frame_height = 24  # Default is 8, increase to zoom out
 
 class GeometricResonancePrimePrediction(Scene):
@@ -180,7 +182,7 @@ class GeometricResonancePrimePrediction(Scene):
         ).scale(0.7).move_to(ORIGIN).shift(DOWN * 0.3)  # SURGICAL FIX
 
         self.play(Create(sobol_box), Write(sobol_label))
-        self.play(LaggedStart(*[FadeIn(dot, scale=0.5) for dot in sobol_dots], lag_ratio=0.05))
+        self.play(BatchedFadeIn(sobol_dots, scale=0.5, lag_ratio=0.05, per_submobject=True))
         self.play(Create(resonance_box), Write(resonance_label))
         self.play(Write(phi_formula), run_time=0.8)
         self.play(Write(e_formula), run_time=0.8)
@@ -1,6 +1,8 @@
 from manim import *
 import numpy as np
 
+from mediakit.partialcache import enable_partial_cache
+
 # ============================================================================
 # OPTIMIZED CONFIGURATION - DO NOT MODIFY THESE VALUES
 # ============================================================================
@@ -10,6 +12,8 @@ config.pixel_height = 1440
 config.pixel_width = 2560
 # ============================================================================
 
+enable_partial_cache()
+
 
 def safe_position(mobject, max_y=4.0, min_y=-4.0):
     top = mobject.get_top()[1]
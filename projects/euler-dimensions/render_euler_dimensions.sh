@@ -3,10 +3,15 @@
 # render_euler_dimensions.sh
 # Renders all scenes from euler_dimensions.py and concatenates into one video
 # Usage: chmod +x render_euler_dimensions.sh && ./render_euler_dimensions.sh
+#        ./render_euler_dimensions.sh --stream   (one encoder, scene chapters,
+#                                                 no per-scene files)
 # ============================================================================
 
 set -e
 
+# mediakit is imported from the repo root
+export PYTHONPATH="$(cd "$(dirname "${BASH_SOURCE[0]}")/../.." && pwd)${PYTHONPATH:+:$PYTHONPATH}"
+
 SCRIPT="euler_dimensions.py"
 SCENES=(
     "TitleScene"
@@ -42,7 +47,17 @@ if [ ! -f "$SCRIPT" ]; then
     exit 1
 fi
 
-# Clean previous partial renders to avoid stale files
+# Single-encoder mode: every scene streams straight into the final video
+if [ "${1:-}" = "--stream" ]; then
+    echo "[STREAM] Rendering ${#SCENES[@]} scenes into $FINAL_OUTPUT..."
+    python3 -m mediakit.project "$SCRIPT" "${SCENES[@]}" -o "$FINAL_OUTPUT"
+    echo ""
+    echo "Play: open $FINAL_OUTPUT"
+    exit 0
+fi
+
+# Clean previous partial renders to avoid stale files; unchanged animations
+# come back from the shared partial cache (<repo>/.cache/partials)
 echo "[CLEANUP] Removing previous render artifacts..."
 rm -rf media/videos/euler_dimensions/
 echo ""
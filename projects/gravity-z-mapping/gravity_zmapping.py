@@ -9,6 +9,8 @@ SYNCHRONIZED TO 51.5s VOICEOVER
 from manim import *
 import numpy as np
 
+from mediakit.holds import enable_static_holds
+
 # ============================================================================
 # OPTIMIZED CONFIGURATION - DO NOT MODIFY THESE VALUES
 # ============================================================================
@@ -18,6 +20,8 @@ config.pixel_height = 1440      # High quality 1440p resolution
 config.pixel_width = 2560       # Crisp text and graphics
 # ============================================================================
 
+enable_static_holds()
+
 
 class GravityAnomalyZMapping(Scene):
     """
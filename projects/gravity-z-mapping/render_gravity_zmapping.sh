@@ -4,6 +4,9 @@
 
 set -e  # Exit on error
 
+# mediakit is imported from the repo root
+export PYTHONPATH="$(cd "$(dirname "${BASH_SOURCE[0]}")/../.." && pwd)${PYTHONPATH:+:$PYTHONPATH}"
+
 SCRIPT_NAME="gravity_zmapping.py"
 MAIN_SCENE="GravityAnomalyZMapping"
 DIAGNOSTIC_SCENE="WideFrameCheck"
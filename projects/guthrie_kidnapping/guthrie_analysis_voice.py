@@ -33,6 +33,9 @@ from manim_voiceover_plus import VoiceoverScene
 from manim_voiceover_plus.services.elevenlabs import ElevenLabsService
 from elevenlabs import VoiceSettings
 
+from mediakit.layers import enable_layer_cache
+from mediakit.textcache import enable_text_cache
+
 # ============================================================================
 # OPTIMIZED CONFIGURATION - DO NOT MODIFY THESE VALUES
 # ============================================================================
@@ -42,6 +45,9 @@ config.pixel_height = 1440
 config.pixel_width = 2560
 # ============================================================================
 
+enable_layer_cache()
+enable_text_cache()
+
 # ---------------------------------------------------------------------------
 # Voice configuration
 # ---------------------------------------------------------------------------
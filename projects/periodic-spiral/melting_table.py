@@ -19,6 +19,12 @@ Render all scenes sequentially:
 from manim import *
 import numpy as np
 
+from mediakit.instancing import FadeInInstances, InstanceTransition, Instances
+from mediakit.lagged import BatchedFadeIn
+from mediakit.pointcloud import Scatter, unit_circle_beziers
+from mediakit.textcache import enable_text_cache
+from mediakit.tiles import enable_tiled_rasterization
+
 # ============================================================================
 # OPTIMIZED CONFIGURATION - DO NOT MODIFY THESE VALUES
 # ============================================================================
@@ -28,6 +34,9 @@ config.pixel_height = 1440
 config.pixel_width = 2560
 # ============================================================================
 
+enable_text_cache()
+enable_tiled_rasterization()
+
 
 def safe_position(mobject, max_y=4.0, min_y=-4.0):
     top = mobject.get_top()[1]
@@ -131,6 +140,18 @@ def get_spiral_pos(z, center=ORIGIN, base_r=0.5, growth=0.025, turns_factor=0.12
     return np.array([x, y, 0])
 
 
+def get_spiral_points(z, center=ORIGIN, base_r=0.5, growth=0.025, turns_factor=0.12):
+    """Vectorized get_spiral_pos: (N,) atomic numbers -> (N, 3) points."""
+    z = np.asarray(z, dtype=float)
+    theta = z * turns_factor * TAU
+    r = base_r + growth * z
+    return np.stack([
+        center[0] + r * np.cos(theta),
+        center[1] + r * np.sin(theta),
+        np.zeros_like(z),
+    ], axis=1)
+
+
 # ============================================================================
 # SCENE 1: THE FAMILIAR GRID
 # ============================================================================
@@ -139,34 +160,37 @@ class Scene1_FamiliarGrid(Scene):
         title = Text("The Periodic Table", font_size=44, weight=BOLD)
         title.move_to(UP * 3.8)
 
-        # Build the grid
-        grid_group = VGroup()
-        element_cells = {}
+        # Build the grid: one instanced tile set plus the symbol labels
+        cells = [e for e in ELEMENTS if e[4] != "f"]  # Skip f-block to keep the grid compact
+        cell_index = {sym: i for i, (sym, *_) in enumerate(cells)}
+        positions = np.array([get_grid_pos(period, group) for _, _, period, group, _ in cells])
 
-        for sym, z, period, group, block in ELEMENTS:
-            if block == "f":
-                continue  # Skip f-block to keep the grid compact
-
-            pos = get_grid_pos(period, group)
-            cell = Square(side_length=0.55, stroke_width=1.0, stroke_color=WHITE)
-            cell.set_fill(BLOCK_COLORS[block], opacity=0.25)
-            cell.move_to(pos)
-            label = Text(sym, font_size=11)
-            label.move_to(pos)
-            pair = VGroup(cell, label)
-            grid_group.add(pair)
-            element_cells[sym] = pair
+        tiles = Instances(
+            Square(side_length=0.55), positions,
+            colors=[BLOCK_COLORS[block] for *_, block in cells],
+            fill_opacities=0.25, opacities=0.0,
+            stroke_color=WHITE, stroke_width=1.0,
+        )
+        labels = VGroup(*[
+            Text(sym, font_size=11).move_to(pos)
+            for (sym, *_), pos in zip(cells, positions)
+        ])
+        grid_group = VGroup(tiles, labels)
 
         grid_group.move_to(DOWN * 0.3)
         safe_position(grid_group)
 
         self.play(Write(title), run_time=1.0)
-        self.play(FadeIn(grid_group, lag_ratio=0.005), run_time=2.5)
+        self.play(
+            InstanceTransition(tiles, opacities=1.0, lag_ratio=0.005),
+            BatchedFadeIn(labels, lag_ratio=0.005),
+            run_time=2.5,
+        )
         self.wait(0.5)
 
         # Highlight Group 1 and Group 18
-        g1_cells = VGroup(*[element_cells[s] for s in GROUP1 if s in element_cells])
-        g18_cells = VGroup(*[element_cells[s] for s in NOBLE_GASES if s in element_cells])
+        g1_cells = tiles.get_instances([cell_index[s] for s in GROUP1 if s in cell_index])
+        g18_cells = tiles.get_instances([cell_index[s] for s in NOBLE_GASES if s in cell_index])
 
         g1_highlight = SurroundingRectangle(g1_cells, color=RED, buff=0.05, stroke_width=3)
         g18_highlight = SurroundingRectangle(g18_cells, color=TEAL_B, buff=0.05, stroke_width=3)
@@ -220,23 +244,17 @@ class Scene2_RollingSpiral(Scene):
         self.play(Write(title), run_time=1.0)
 
         # Build element dots at grid positions (compact, no f-block)
-        dots = VGroup()
-        grid_positions = {}
-        spiral_positions = {}
-
         filtered = [(s, z, p, g, b) for s, z, p, g, b in ELEMENTS if b != "f"]
+        filtered_z = np.array([z for _, z, _, _, _ in filtered])
 
-        for sym, z, period, group, block in filtered:
-            gpos = get_grid_pos(period, group)
-            dot = Dot(gpos, radius=0.08, color=z_to_color(z))
-            dots.add(dot)
-            grid_positions[sym] = gpos.copy()
-            spiral_positions[sym] = get_spiral_pos(z)
-
+        dots = Instances(
+            unit_circle_beziers(),
+            [get_grid_pos(period, group) for _, _, period, group, _ in filtered],
+            scales=0.08, colors=[z_to_color(z) for z in filtered_z], opacities=0.0,
+        )
         dots.move_to(DOWN * 0.2)
-        offset = dots.get_center() - DOWN * 0.2
 
-        self.play(FadeIn(dots, lag_ratio=0.005), run_time=1.5)
+        self.play(InstanceTransition(dots, opacities=1.0, lag_ratio=0.005), run_time=1.5)
         self.wait(0.5)
 
         morph_text = Text(
@@ -248,12 +266,10 @@ class Scene2_RollingSpiral(Scene):
 
         # Animate dots from grid to spiral positions
         spiral_center = DOWN * 0.2
-        anims = []
-        for i, (sym, z, period, group, block) in enumerate(filtered):
-            target_pos = get_spiral_pos(z, center=spiral_center)
-            anims.append(dots[i].animate.move_to(target_pos))
-
-        self.play(*anims, run_time=3.0, rate_func=smooth)
+        self.play(
+            InstanceTransition(dots, positions=get_spiral_points(filtered_z, center=spiral_center)),
+            run_time=3.0, rate_func=smooth,
+        )
         self.wait(0.3)
 
         self.play(FadeOut(morph_text), run_time=0.5)
@@ -278,7 +294,7 @@ class Scene2_RollingSpiral(Scene):
             lbl.move_to(pos + normalize(pos - spiral_center) * 0.3)
             noble_labels_group.add(lbl)
 
-        self.play(FadeIn(noble_labels_group, lag_ratio=0.1), run_time=1.2)
+        self.play(BatchedFadeIn(noble_labels_group, lag_ratio=0.1), run_time=1.2)
 
         spoke_text = Text(
             "Noble gases now fall along a natural radial line.\n"
@@ -433,20 +449,20 @@ class Scene3_EngineUnderTheHood(Scene):
 # SCENE 4: THE DISSOLUTION
 # ============================================================================
 class Scene4_Dissolution(Scene):
+    SUPERHEAVY_MAX_Z = 160
+
     def construct(self):
         title = Text("The Periodic Law Melts", font_size=44, weight=BOLD)
         title.move_to(UP * 3.8)
         self.play(Write(title), run_time=1.0)
 
-        # Build spiral with all 118 elements as dots
+        # Build spiral with all 118 elements as one scatter
         spiral_center = DOWN * 0.3
-        dots = VGroup()
-        labels = VGroup()
-
-        for sym, z, period, group, block in ELEMENTS:
-            pos = get_spiral_pos(z, center=spiral_center)
-            dot = Dot(pos, radius=0.06, color=z_to_color(z))
-            dots.add(dot)
+        spiral_z = np.array([z for _, z, _, _, _ in ELEMENTS])
+        dots = Scatter(
+            get_spiral_points(spiral_z, center=spiral_center),
+            radii=0.06, colors=[z_to_color(z) for z in spiral_z], keys=spiral_z,
+        )
 
         spiral_curve = ParametricFunction(
             lambda t: get_spiral_pos(t, center=spiral_center),
@@ -464,7 +480,7 @@ class Scene4_Dissolution(Scene):
 
         self.play(
             Create(spiral_curve),
-            FadeIn(dots, lag_ratio=0.005),
+            FadeInInstances(dots, lag_ratio=0.005),
             run_time=2.0,
         )
         self.play(FadeIn(au_marker), Write(au_label), run_time=0.8)
@@ -479,13 +495,13 @@ class Scene4_Dissolution(Scene):
         safe_position(flicker_text)
         self.play(Write(flicker_text), run_time=1.0)
 
-        actinide_dots = VGroup(*[dots[i] for i, (_, z, _, _, _) in enumerate(ELEMENTS) if 89 <= z <= 103])
+        actinide_dim = np.where((spiral_z >= 89) & (spiral_z <= 103), 0.2, 1.0)
         for _ in range(3):
             self.play(
-                actinide_dots.animate.set_opacity(0.2), run_time=0.3,
+                InstanceTransition(dots, opacities=actinide_dim), run_time=0.3,
             )
             self.play(
-                actinide_dots.animate.set_opacity(1.0), run_time=0.3,
+                InstanceTransition(dots, opacities=1.0), run_time=0.3,
             )
         self.wait(0.5)
         self.play(FadeOut(flicker_text), run_time=0.5)
@@ -499,36 +515,36 @@ class Scene4_Dissolution(Scene):
         safe_position(extend_text)
         self.play(Write(extend_text), run_time=0.8)
 
-        # Add superheavy dots that jitter
-        superheavy_dots = VGroup()
-        ghost_dots = VGroup()
+        # Add superheavy dots that jitter (one scatter each, so the
+        # per-frame cost stays flat however far SUPERHEAVY_MAX_Z reaches)
+        superheavy_z = np.arange(119, self.SUPERHEAVY_MAX_Z + 1)
+        superheavy_color = z_to_color(118)
+        superheavy_dots = Scatter(
+            get_spiral_points(superheavy_z, center=spiral_center),
+            radii=0.06, keys=superheavy_z,
+            colors=superheavy_color, opacities=0.6,
+        )
+
+        # Dissolution index label for milestones
         d_labels = VGroup()
+        for z in [120, 130, 140, 150, 160]:
+            d_val = (z / 80) ** (10 / 3)
+            d_lbl = Text(f"D={d_val:.0f}", font_size=10, color=RED_B)
+            d_lbl.move_to(get_spiral_pos(z, center=spiral_center) + UP * 0.25)
+            d_labels.add(d_lbl)
 
-        for z in range(119, 161):
-            pos = get_spiral_pos(z, center=spiral_center)
-            dot = Dot(pos, radius=0.06, color=z_to_color(min(z, 118)))
-            dot.set_opacity(0.6)
-            superheavy_dots.add(dot)
-
-            # Dissolution index label for milestones
-            if z in [120, 130, 140, 150, 160]:
-                d_val = (z / 80) ** (10 / 3)
-                d_lbl = Text(f"D={d_val:.0f}", font_size=10, color=RED_B)
-                d_lbl.move_to(pos + UP * 0.25)
-                d_labels.add(d_lbl)
-
-            # Ghost copies at competing positions for Z > 130
-            if z > 130:
-                offset_angle = 0.4 * np.sin(z * 0.7)
-                ghost_pos = get_spiral_pos(z + offset_angle * 5, center=spiral_center)
-                ghost = Dot(ghost_pos, radius=0.05, color=z_to_color(min(z, 118)))
-                ghost.set_opacity(0.25)
-                ghost_dots.add(ghost)
+        # Ghost copies at competing positions for Z > 130
+        ghost_z = superheavy_z[superheavy_z > 130]
+        ghost_dots = Scatter(
+            get_spiral_points(ghost_z + 2.0 * np.sin(ghost_z * 0.7), center=spiral_center),
+            radii=0.05, keys=ghost_z,
+            colors=superheavy_color, opacities=0.25,
+        )
 
         # Extend the spiral curve
         extended_curve = ParametricFunction(
             lambda t: get_spiral_pos(t, center=spiral_center),
-            t_range=[118, 160],
+            t_range=[118, self.SUPERHEAVY_MAX_Z],
             color=WHITE,
             stroke_width=1.0,
             stroke_opacity=0.25,
@@ -536,11 +552,11 @@ class Scene4_Dissolution(Scene):
 
         self.play(
             Create(extended_curve),
-            FadeIn(superheavy_dots, lag_ratio=0.02),
-            FadeIn(d_labels, lag_ratio=0.1),
+            FadeInInstances(superheavy_dots, lag_ratio=0.02),
+            BatchedFadeIn(d_labels, lag_ratio=0.1),
             run_time=2.5,
         )
-        self.play(FadeIn(ghost_dots, lag_ratio=0.02), run_time=1.0)
+        self.play(FadeInInstances(ghost_dots, lag_ratio=0.02), run_time=1.0)
         self.wait(0.5)
 
         self.play(FadeOut(extend_text), run_time=0.5)
@@ -556,19 +572,15 @@ class Scene4_Dissolution(Scene):
 
         time_tracker = ValueTracker(0)
 
-        def jitter_updater(mob, dt):
-            t = time_tracker.get_value()
-            for i, dot in enumerate(mob):
-                z = 119 + i
-                base_pos = get_spiral_pos(z, center=spiral_center)
-                jitter_scale = min(0.15, 0.005 * (z - 118))
-                offset = np.array([
-                    jitter_scale * np.sin(t * 3 + z * 0.5),
-                    jitter_scale * np.cos(t * 4 + z * 0.7),
-                    0,
-                ])
-                dot.move_to(base_pos + offset)
+        def jitter(t, z):
+            jitter_scale = np.minimum(0.15, 0.005 * (z - 118))
+            return np.stack([
+                jitter_scale * np.sin(t * 3 + z * 0.5),
+                jitter_scale * np.cos(t * 4 + z * 0.7),
+                np.zeros_like(jitter_scale),
+            ], axis=1)
 
+        jitter_updater = superheavy_dots.offset_updater(jitter, time_tracker.get_value)
         superheavy_dots.add_updater(jitter_updater)
         self.play(time_tracker.animate.set_value(6), run_time=4.0, rate_func=linear)
         superheavy_dots.remove_updater(jitter_updater)
@@ -587,8 +599,8 @@ class Scene4_Dissolution(Scene):
         # Fade and fragment the extended region
         self.play(
             extended_curve.animate.set_stroke(opacity=0.05),
-            superheavy_dots.animate.set_opacity(0.15),
-            ghost_dots.animate.set_opacity(0.08),
+            InstanceTransition(superheavy_dots, opacities=0.15),
+            InstanceTransition(ghost_dots, opacities=0.08),
             Write(fracture_text),
             run_time=2.0,
         )
@@ -612,13 +624,11 @@ class Scene5_WhatWeKnow(Scene):
         left_title.move_to(UP * 2.8 + LEFT * 4.2)
 
         left_center = LEFT * 4.2 + DOWN * 0.5
-        left_dots = VGroup()
-        for sym, z, period, group, block in ELEMENTS:
-            if z > 80:
-                continue
-            pos = get_spiral_pos(z, center=left_center, base_r=0.3, growth=0.018)
-            dot = Dot(pos, radius=0.05, color=z_to_color(z))
-            left_dots.add(dot)
+        left_z = np.array([z for _, z, _, _, _ in ELEMENTS if z <= 80])
+        left_dots = Scatter(
+            get_spiral_points(left_z, center=left_center, base_r=0.3, growth=0.018),
+            radii=0.05, colors=[z_to_color(z) for z in left_z], keys=left_z,
+        )
 
         left_curve = ParametricFunction(
             lambda t: get_spiral_pos(t, center=left_center, base_r=0.3, growth=0.018),
@@ -707,7 +717,7 @@ class Scene5_WhatWeKnow(Scene):
         self.play(
             Write(left_title),
             Create(left_curve),
-            FadeIn(left_dots, lag_ratio=0.01),
+            FadeInInstances(left_dots, lag_ratio=0.01),
             run_time=2.0,
         )
         self.play(Write(left_caption), run_time=0.8)
@@ -718,8 +728,8 @@ class Scene5_WhatWeKnow(Scene):
         # Animate right side
         self.play(
             Write(right_title),
-            FadeIn(tree_lines, lag_ratio=0.03),
-            FadeIn(tree_elements, lag_ratio=0.03),
+            BatchedFadeIn(tree_lines, lag_ratio=0.03),
+            BatchedFadeIn(tree_elements, lag_ratio=0.03),
             run_time=2.0,
         )
         self.play(Write(right_caption), run_time=0.8)
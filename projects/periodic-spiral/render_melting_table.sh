@@ -18,6 +18,8 @@
 set -euo pipefail
 
 SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+# mediakit is imported from the repo root
+export PYTHONPATH="$(cd "${SCRIPT_DIR}/../.." && pwd)${PYTHONPATH:+:$PYTHONPATH}"
 MANIM_SCRIPT="${SCRIPT_DIR}/melting_table.py"
 OUTPUT_DIR="${SCRIPT_DIR}/media/videos"
 
@@ -1,6 +1,9 @@
 from manim import *
 import numpy as np
 
+from mediakit.curves import simplified_curve
+from mediakit.holds import enable_static_holds
+
 # ============================================================================
 # OPTIMIZED CONFIGURATION - DO NOT MODIFY THESE VALUES
 # ============================================================================
@@ -11,6 +14,8 @@ config.pixel_width = 2560
 config.background_color = "#0a0a0a"
 # ============================================================================
 
+enable_static_holds()
+
 def safe_position(mobject, max_y=4.0, min_y=-4.0):
     """Clamp mobject to safe vertical zone to prevent clipping."""
     top = mobject.get_top()[1]
@@ -90,13 +95,12 @@ class Scene02_AcousticLevitation(Scene):
         # Standing wave
         y_range = np.linspace(-2.3, 1.8, 200)
         amp = 0.8
-        points_l = [np.array([-amp * np.sin(2 * np.pi * y / 1.7), y, 0]) for y in y_range]
-        points_r = [np.array([amp * np.sin(2 * np.pi * y / 1.7), y, 0]) for y in y_range]
+        wave_x = amp * np.sin(2 * np.pi * y_range / 1.7)
+        points_l = np.stack([-wave_x, y_range, np.zeros_like(y_range)], axis=1)
+        points_r = np.stack([wave_x, y_range, np.zeros_like(y_range)], axis=1)
 
-        wave_curve_l = VMobject(color="#00bfff", stroke_width=2, stroke_opacity=0.5)
-        wave_curve_l.set_points_smoothly(points_l)
-        wave_curve_r = VMobject(color="#00bfff", stroke_width=2, stroke_opacity=0.5)
-        wave_curve_r.set_points_smoothly(points_r)
+        wave_curve_l = simplified_curve(points_l, color="#00bfff", stroke_width=2, stroke_opacity=0.5)
+        wave_curve_r = simplified_curve(points_r, color="#00bfff", stroke_width=2, stroke_opacity=0.5)
 
         # Pressure nodes
         nodes = VGroup()
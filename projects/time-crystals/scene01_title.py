@@ -1,12 +1,16 @@
 from manim import *
 import numpy as np
 
+from mediakit.holds import enable_static_holds
+
 config.frame_height = 10
 config.frame_width = 10 * 16/9
 config.pixel_height = 1440
 config.pixel_width = 2560
 config.background_color = "#0a0a0a"
 
+enable_static_holds()
+
 def safe_position(mobject, max_y=4.0, min_y=-4.0):
     top = mobject.get_top()[1]
     bottom = mobject.get_bottom()[1]
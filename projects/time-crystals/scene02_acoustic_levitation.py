@@ -1,6 +1,8 @@
 from manim import *
 import numpy as np
 
+from mediakit.curves import simplified_curve
+
 config.frame_height = 10
 config.frame_width = 10 * 16/9
 config.pixel_height = 1440
@@ -38,13 +40,12 @@ class Scene02_AcousticLevitation(Scene):
         wave_right = VGroup()
         y_range = np.linspace(-2.3, 1.8, 200)
         amp = 0.8
-        points_l = [np.array([-amp * np.sin(2 * np.pi * y / 1.7), y, 0]) for y in y_range]
-        points_r = [np.array([amp * np.sin(2 * np.pi * y / 1.7), y, 0]) for y in y_range]
+        wave_x = amp * np.sin(2 * np.pi * y_range / 1.7)
+        points_l = np.stack([-wave_x, y_range, np.zeros_like(y_range)], axis=1)
+        points_r = np.stack([wave_x, y_range, np.zeros_like(y_range)], axis=1)
 
-        wave_curve_l = VMobject(color="#00bfff", stroke_width=2, stroke_opacity=0.5)
-        wave_curve_l.set_points_smoothly(points_l)
-        wave_curve_r = VMobject(color="#00bfff", stroke_width=2, stroke_opacity=0.5)
-        wave_curve_r.set_points_smoothly(points_r)
+        wave_curve_l = simplified_curve(points_l, color="#00bfff", stroke_width=2, stroke_opacity=0.5)
+        wave_curve_r = simplified_curve(points_r, color="#00bfff", stroke_width=2, stroke_opacity=0.5)
 
         # Pressure nodes (where beads sit)
         nodes = VGroup()
@@ -8,6 +8,9 @@
 
 set -e
 
+# mediakit is imported from the repo root
+export PYTHONPATH="$(cd "$(dirname "${BASH_SOURCE[0]}")/../.." && pwd)${PYTHONPATH:+:$PYTHONPATH}"
+
 echo "=== Rendering Manim Scenes (single file) ==="
 
 PY_FILE="levitating_time_crystals_all_scenes.py"
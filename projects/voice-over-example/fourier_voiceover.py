@@ -11,6 +11,13 @@ import os
 from manim_voiceover_plus import VoiceoverScene                            # NEW
 from manim_voiceover_plus.services.elevenlabs import ElevenLabsService     # NEW
 
+from mediakit.dirty import enable_dirty_rects
+from mediakit.layers import enable_layer_cache
+from mediakit.readout import Readout
+from mediakit.spectral import Epicycles, Spectrum
+from mediakit.texcache import precompile_tex, use_shared_tex_cache
+from mediakit.winding import WindingMachine
+
 
 # If you are on Python 3.13+ or need the updated ElevenLabs SDK, swap imports:
 # from manim_voiceover_plus import VoiceoverScene
@@ -25,6 +32,11 @@ config.pixel_height = 1440
 config.pixel_width  = 2560
 # ============================================================================
 
+enable_layer_cache()
+enable_dirty_rects()
+use_shared_tex_cache()
+precompile_tex(__file__)
+
 # ---------------------------------------------------------------------------
 # Voice configuration (edit per project)
 # ---------------------------------------------------------------------------
@@ -278,13 +290,9 @@ class FourierExplainer(VoiceoverScene):
                 color=BLUE,
             )
         )
-        freq_text = always_redraw(
-            lambda: Text(
-                f"f = {freq_tracker.get_value():.1f} Hz",
-                font_size=24,
-                color=YELLOW,
-            ).move_to(axes.c2p(3.5, 1.8))
-        )
+        freq_text = Readout(
+            "f = {:.1f} Hz", freq_tracker.get_value(), font_size=24, color=YELLOW,
+        ).move_to(axes.c2p(3.5, 1.8)).track(freq_tracker.get_value)
 
         self.remove(sine_graph)
         self.add(dynamic_sine, freq_text)
@@ -312,13 +320,9 @@ class FourierExplainer(VoiceoverScene):
                 color=GREEN,
             )
         )
-        amp_text = always_redraw(
-            lambda: Text(
-                f"A = {amp_tracker.get_value():.1f}",
-                font_size=24,
-                color=GREEN,
-            ).move_to(axes.c2p(3.5, 1.8))
-        )
+        amp_text = Readout(
+            "A = {:.1f}", amp_tracker.get_value(), font_size=24, color=GREEN,
+        ).move_to(axes.c2p(3.5, 1.8)).track(amp_tracker.get_value)
 
         self.add(dynamic_amp, amp_text)
 
@@ -335,21 +339,24 @@ class FourierExplainer(VoiceoverScene):
         # =================================================================
         # 6. COMBINING WAVES (~31 s)
         # =================================================================
-        wave1 = make_sine_graph(axes, freq=1, amp=1.0, color=RED)
-        wave2 = make_sine_graph(axes, freq=2.5, amp=0.6, color=YELLOW)
-        wave3 = make_sine_graph(axes, freq=4, amp=0.4, color=TEAL)
-
-        combined_2 = axes.plot(
-            lambda t: 1.0 * np.sin(2 * np.pi * 1 * t) +
-                      0.6 * np.sin(2 * np.pi * 2.5 * t),
-            color=PURPLE,
-        )
-        combined_3 = axes.plot(
-            lambda t: 1.0 * np.sin(2 * np.pi * 1 * t) +
-                      0.6 * np.sin(2 * np.pi * 2.5 * t) +
-                      0.4 * np.sin(2 * np.pi * 4 * t),
-            color=WHITE,
-        )
+        # One FFT of the 4 s window gives every component and partial sum;
+        # 1, 2.5 and 4 Hz are harmonics 4, 10 and 16 of the 0.25 Hz base.
+        def combined_signal(t):
+            return (
+                1.0 * np.sin(2 * np.pi * 1 * t) +
+                0.6 * np.sin(2 * np.pi * 2.5 * t) +
+                0.4 * np.sin(2 * np.pi * 4 * t)
+            )
+
+        spectrum = Spectrum.from_signal(combined_signal, period=4.0, num_samples=512)
+        k1, k2, k3 = (spectrum.harmonic_index(f) for f in (1, 2.5, 4))
+
+        wave1 = axes.plot(spectrum.component(k1), color=RED, use_vectorized=True)
+        wave2 = axes.plot(spectrum.component(k2), color=YELLOW, use_vectorized=True)
+        wave3 = axes.plot(spectrum.component(k3), color=TEAL, use_vectorized=True)
+
+        combined_2 = axes.plot(spectrum.partial(k2), color=PURPLE, use_vectorized=True)
+        combined_3 = axes.plot(spectrum.partial(k3), color=WHITE, use_vectorized=True)
 
         l1 = Text("f=1 Hz", font_size=16, color=RED).move_to(axes.c2p(3.8, 1.6))
         l2 = Text("f=2.5 Hz", font_size=16, color=YELLOW).next_to(l1, DOWN, buff=0.15)
@@ -378,14 +385,7 @@ class FourierExplainer(VoiceoverScene):
         # =================================================================
         # 7. DECOMPOSITION CONCEPT (~26 s)
         # =================================================================
-        messy_signal = axes.plot(
-            lambda t: (
-                    1.0 * np.sin(2 * np.pi * 1 * t) +
-                    0.6 * np.sin(2 * np.pi * 2.5 * t) +
-                    0.4 * np.sin(2 * np.pi * 4 * t)
-            ),
-            color=GREY_A,
-        )
+        messy_signal = axes.plot(spectrum.partial(k3), color=GREY_A, use_vectorized=True)
 
         spectrum_axes = Axes(
             x_range=[0, 6, 1],
@@ -398,8 +398,8 @@ class FourierExplainer(VoiceoverScene):
         spec_y = spectrum_axes.get_y_axis_label("Amplitude", direction=UP)
 
         bars = VGroup()
-        bar_data = [(1, 1.0, RED), (2.5, 0.6, YELLOW), (4, 0.4, TEAL)]
-        for freq, amp, color in bar_data:
+        bar_colors = [RED, YELLOW, TEAL]
+        for (freq, amp), color in zip(spectrum.peaks(3), bar_colors):
             bar = Rectangle(
                 width=0.5, height=amp * 3, color=color, fill_opacity=0.7,
             )
@@ -473,47 +473,41 @@ class FourierExplainer(VoiceoverScene):
                 0.5 * np.sin(2 * np.pi * 5 * t)
         )
 
-        NUM_PTS = 400
-        t_vals = np.linspace(0, 2, NUM_PTS)
-
-        def get_wound_curve():
-            wf = wind_freq.get_value()
-            pts = []
-            for t in t_vals:
-                r = signal_func(t) * 0.8
-                angle = 2 * np.pi * wf * t
-                pts.append([r * np.cos(angle), r * np.sin(angle), 0])
-            curve = VMobject(color=BLUE, stroke_width=2)
-            curve.set_points_smoothly(pts)
-            return curve
-
-        wound_curve = always_redraw(get_wound_curve)
-
-        def get_com_dot():
-            wf = wind_freq.get_value()
-            cx, cy = 0.0, 0.0
-            for t in t_vals:
-                r = signal_func(t) * 0.8
-                angle = 2 * np.pi * wf * t
-                cx += r * np.cos(angle)
-                cy += r * np.sin(angle)
-            cx /= NUM_PTS
-            cy /= NUM_PTS
-            return Dot([cx, cy, 0], color=YELLOW, radius=0.1)
-
-        com_dot = always_redraw(get_com_dot)
-
-        wind_label = always_redraw(
-            lambda: Text(
-                f"Winding freq = {wind_freq.get_value():.1f} Hz",
-                font_size=22,
-                color=YELLOW,
-            ).move_to(DOWN * 3.8)
+        # Curve and center of mass come from one numpy evaluation per frame;
+        # the COM for the whole 0.1 -> 7 Hz sweep is precomputed up front.
+        machine = WindingMachine(signal_func, t_range=(0, 2), num_samples=400, scale=0.8)
+        machine.precompute_sweep(0.1, 7.0)
+
+        wound_curve = VMobject(color=BLUE, stroke_width=2)
+        wound_curve.add_updater(
+            lambda m: m.set_points_smoothly(
+                machine.curve_points(wind_freq.get_value())
+            ),
+            call_updater=True,
+        )
+
+        com_dot = Dot(color=YELLOW, radius=0.1)
+        com_dot.add_updater(
+            lambda d: d.move_to(machine.center_of_mass(wind_freq.get_value())),
+            call_updater=True,
         )
 
+        # Path traced by the center of mass so far ("almost Fourier transform")
+        com_trail = VMobject(color=YELLOW, stroke_width=1.5, stroke_opacity=0.5)
+        com_trail.add_updater(
+            lambda m: m.set_points_as_corners(
+                machine.com_trace(upto=wind_freq.get_value())
+            ),
+            call_updater=True,
+        )
+
+        wind_label = Readout(
+            "Winding freq = {:.1f} Hz", wind_freq.get_value(), font_size=22, color=YELLOW,
+        ).move_to(DOWN * 3.8).track(wind_freq.get_value)
+
         with self.voiceover(text=SCRIPT["visual_wrapping"]) as tracker:
             self.play(Create(wrap_circle), FadeIn(dot_center), run_time=2)
-            self.add(wound_curve, com_dot, wind_label)
+            self.add(com_trail, wound_curve, com_dot, wind_label)
             self.play(
                 wind_freq.animate.set_value(7.0),
                 run_time=tracker.duration - 4,
@@ -524,6 +518,7 @@ class FourierExplainer(VoiceoverScene):
         self.play(
             FadeOut(wrap_circle), FadeOut(dot_center),
             FadeOut(wound_curve), FadeOut(com_dot), FadeOut(wind_label),
+            FadeOut(com_trail),
             run_time=1,
         )
 
@@ -606,3 +601,37 @@ class FourierExplainer(VoiceoverScene):
             run_time=2,
         )
         self.wait(1)
+
+
+# ============================================================================
+# EPICYCLE COMPANION SCENE (no narration)
+# ============================================================================
+
+class FourierEpicycles(Scene):
+    """
+    Redraws a glyph outline with 1000 rotating vectors from its FFT.
+
+    Render: manim fourier_voiceover.py FourierEpicycles
+    """
+
+    NUM_VECTORS = 1000
+
+    def construct(self):
+        self.camera.background_color = "#0e1117"
+
+        glyph = MathTex(r"\pi", font_size=480).move_to(ORIGIN)
+        spectrum = Spectrum.from_path(glyph, num_samples=4096)
+
+        title = Text(
+            f"{self.NUM_VECTORS} rotating vectors", font_size=28, color=GREY_A,
+        ).move_to(UP * 4.2)
+
+        cycle = ValueTracker(0.0)
+        chain = Epicycles(spectrum, num_vectors=self.NUM_VECTORS)
+        chain.add_updater(lambda m: m.set_time(cycle.get_value()))
+
+        self.play(FadeIn(title), FadeIn(chain), run_time=1)
+        self.play(cycle.animate.set_value(1.0), run_time=20, rate_func=linear)
+        chain.clear_updaters()
+        self.play(FadeOut(chain.circles), FadeOut(chain.arms), run_time=1)
+        self.wait(2)
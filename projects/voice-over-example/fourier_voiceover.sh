@@ -1,5 +1,11 @@
+# mediakit is imported from the repo root
+export PYTHONPATH="$(cd "$(dirname "${BASH_SOURCE[0]}")/../.." && pwd)${PYTHONPATH:+:$PYTHONPATH}"
+
 # Development (free gTTS, no ElevenLabs credits burned)
 manim fourier_voiceover.py FourierExplainer
 
 # Production (ElevenLabs)
 MANIM_VOICE_PROD=1 manim fourier_voiceover.py FourierExplainer
+
+# Epicycle companion scene (no narration)
+manim fourier_voiceover.py FourierEpicycles
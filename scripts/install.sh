@@ -127,7 +127,28 @@ command -v latex  >/dev/null 2>&1 && echo "latex found:  $(command -v latex)" ||
 command -v dvisvgm >/dev/null 2>&1 && echo "dvisvgm found: $(command -v dvisvgm)" || echo "dvisvgm NOT found"
 
 ########################################
-# 7. Install Manim Community Edition
+# 7. Put the repo's shared mediakit package on PYTHONPATH
+########################################
+
+echo
+echo "=== Configuring PYTHONPATH for mediakit ==="
+
+REPO_ROOT="$(cd "$(dirname "${BASH_SOURCE[0]}")/.." && pwd)"
+SHELL_RC="$HOME/.zshrc"
+if [[ "$SHELL" == *"bash"* ]]; then
+  SHELL_RC="$HOME/.bashrc"
+fi
+
+if ! grep -qF "$REPO_ROOT" "$SHELL_RC" 2>/dev/null; then
+  echo "export PYTHONPATH=\"$REPO_ROOT\${PYTHONPATH:+:\$PYTHONPATH}\"" >> "$SHELL_RC"
+  echo "-> Added $REPO_ROOT to PYTHONPATH in $SHELL_RC"
+else
+  echo "-> $REPO_ROOT already in PYTHONPATH config ($SHELL_RC)"
+fi
+export PYTHONPATH="$REPO_ROOT${PYTHONPATH:+:$PYTHONPATH}"
+
+########################################
+# 8. Install Manim Community Edition
 ########################################
 
 echo
@@ -142,7 +163,7 @@ echo "Manim version:"
 manim --version || echo "Manim not found on PATH; check your Homebrew install."
 
 ########################################
-# 8. Run manim checkhealth
+# 9. Run manim checkhealth
 ########################################
 
 echo